@@ -0,0 +1,191 @@
+from ..constants import *
+from ..objects.platform import Platform
+
+
+class JumpBoost:
+    """점프력 증가: 다음 duration번의 점프를 value배로 합니다."""
+
+    @staticmethod
+    def apply(game, value, duration):
+        game.player.jump_power_multiplier = value
+        game.player.remaining_jump_boosts = duration
+
+    @staticmethod
+    def remove(game):
+        game.player.jump_power_multiplier = 1.0
+        game.player.remaining_jump_boosts = 0
+
+    @staticmethod
+    def remaining(game):
+        return game.player.remaining_jump_boosts
+
+
+class DoubleJump:
+    """2단 점프: 공중에서 한 번 더 점프할 수 있는 기회를 duration번 줍니다."""
+
+    @staticmethod
+    def apply(game, value, duration):
+        game.player.can_double_jump = True
+        game.player.has_double_jumped = False
+        game.player.remaining_double_jumps = duration
+
+    @staticmethod
+    def remove(game):
+        game.player.can_double_jump = False
+        game.player.has_double_jumped = False
+        game.player.remaining_double_jumps = 0
+
+    @staticmethod
+    def remaining(game):
+        return game.player.remaining_double_jumps
+
+
+class SpeedMultiplier:
+    """이동 속도 변경"""
+
+    @staticmethod
+    def apply(game, value, duration):
+        game.player.speed_multiplier = value
+
+    @staticmethod
+    def remove(game):
+        game.player.speed_multiplier = 1.0
+
+
+class KeyReverse:
+    """좌우 키 반전"""
+
+    @staticmethod
+    def apply(game, value, duration):
+        game.player.is_key_reversed = True
+
+    @staticmethod
+    def remove(game):
+        game.player.is_key_reversed = False
+
+
+class IceSlide:
+    """발판 위에서 미끄러짐"""
+
+    @staticmethod
+    def apply(game, value, duration):
+        game.player.is_sliding = True
+        game.player.velocity_x = 0
+
+    @staticmethod
+    def remove(game):
+        game.player.is_sliding = False
+        game.player.velocity_x = 0
+
+
+class PlatformWidth:
+    """
+    모든 발판(버프 중에 생성되는 발판 포함)의 너비를 value로 보이게 합니다.
+    발판은 그대로 두고 Platform.width_override만 바꾸므로 객체 모드에서는 발판 수와 관계없이 O(1)입니다.
+    보이는 너비는 움직이는 발판의 왕복 구간도 바꾸므로, 분석/LOD 모드에서는 바꾸기 전에
+    발판들의 기준 상태를 현재 틱으로 옮깁니다.
+    """
+
+    @staticmethod
+    def apply(game, value, duration):
+        game.rebase_platforms()
+        game.width_override = Platform.width_override = value
+
+    @staticmethod
+    def remove(game):
+        game.rebase_platforms()
+        game.width_override = Platform.width_override = None
+
+
+# ITEM_TYPES의 'effect' 이름 -> 효과 처리기
+EFFECT_HANDLERS = {
+    'jump_power_multiplier': JumpBoost,
+    'double_jump': DoubleJump,
+    'speed_multiplier': SpeedMultiplier,
+    'key_reverse': KeyReverse,
+    'ice_slide': IceSlide,
+    'platform_width': PlatformWidth,
+}
+
+
+class BuffEngine:
+    """
+    ITEM_TYPES와 EFFECT_HANDLERS로 버프의 적용과 해제를 처리합니다.
+    버프는 한 번에 하나만 적용되며, 아이템을 먹으면 이전 버프를 해제하고 새 버프로 바꿉니다.
+    - 'uses' 버프(긍정 버프)는 점프로 횟수를 다 쓰면 해제됩니다.
+    - 'height' 버프는 획득 높이에서 지속 높이만큼 오르거나 BUFF_EXPIRE_DROP만큼 내려가면 해제됩니다.
+    해제 조건은 매 프레임 검사하지 않고 점프(on_jump)와 높이 변화(on_height) 때만 확인합니다.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.active = {}  # 버프 종류 -> {'start_height', 'duration'} (적용 중인 버프 하나)
+        self.positive = None  # 현재 적용 중인 'uses' 버프
+
+    def handler(self, buff_type):
+        return EFFECT_HANDLERS[ITEM_TYPES[buff_type]['effect']]
+
+    def apply(self, effect):
+        """
+        아이템 효과를 적용합니다. 적용 중인 버프는 해제하고 새 버프로 바꾸므로,
+        같은 버프를 다시 얻으면 횟수/높이가 새로 시작됩니다.
+        Args:
+            effect (dict): Item.collect()가 반환한 효과 정보
+        Returns:
+            bool: 적용되었는지 여부 (알 수 없는 버프면 적용되지 않음)
+        """
+        buff_type = effect['type']
+        if buff_type not in ITEM_TYPES:
+            return False
+        for old_type in list(self.active):
+            self.expire(old_type)
+
+        player = self.game.player
+        if ITEM_TYPES[buff_type]['expire'] == 'uses':
+            self.positive = buff_type
+            player.positive_buff = buff_type
+        else:
+            player.active_buffs.add(buff_type)
+
+        self.active[buff_type] = {
+            'start_height': effect['start_height'],
+            'duration': effect['duration']
+        }
+        self.handler(buff_type).apply(self.game, effect['value'], effect['duration'])
+        return True
+
+    def expire(self, buff_type):
+        """버프를 해제하고 효과를 되돌립니다."""
+        if self.active.pop(buff_type, None) is None:
+            return
+        player = self.game.player
+        if buff_type == self.positive:
+            self.positive = None
+            player.positive_buff = None
+        else:
+            player.active_buffs.discard(buff_type)
+        self.handler(buff_type).remove(self.game)
+
+    def on_jump(self):
+        """점프 후 호출합니다. 긍정 버프의 횟수를 다 썼으면 해제합니다."""
+        if self.positive is not None and self.remaining(self.positive) <= 0:
+            self.expire(self.positive)
+
+    def on_height(self, height):
+        """높이(m)가 바뀌었을 때 호출합니다. 범위를 벗어난 높이 버프를 해제합니다."""
+        expired = [buff_type for buff_type, info in self.active.items()
+                   if buff_type != self.positive and
+                   not -BUFF_EXPIRE_DROP < height - info['start_height'] < info['duration']]
+        for buff_type in expired:
+            self.expire(buff_type)
+
+    def remaining(self, buff_type):
+        """
+        버프의 남은 양을 반환합니다.
+        Returns:
+            int: 'uses' 버프는 남은 횟수, 'height' 버프는 남은 높이(m)
+        """
+        if buff_type == self.positive:
+            return self.handler(buff_type).remaining(self.game)
+        info = self.active[buff_type]
+        return info['duration'] - (self.game.player.raw_height - info['start_height'])
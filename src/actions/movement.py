@@ -3,18 +3,22 @@ from ..constants import *
 
 class Movement:
     @staticmethod
-    def apply_gravity(player, platforms):
+    def apply_gravity(player, platforms, dt=1.0, swept=False):
         """
         중력을 적용하고 플랫폼과의 충돌을 처리합니다.
         Args:
             player: 플레이어 객체
-            platforms: 플랫폼 객체 리스트
+            platforms: 플랫폼 객체 리스트 또는 PlatformIndex
+            dt (float): 이번 틱의 길이 (FPS 기준 프레임 수)
+            swept (bool): True면 착지 x 범위를 틱 끝 위치가 아니라 플레이어 바닥이
+                발판 상단을 지나는 시점의 위치로 검사 (틱이 길어도 착지가 정확함)
         """
         prev_y = player.pos_y
 
-        # 중력 적용
-        player.velocity_y += GRAVITY
-        player.pos_y += player.velocity_y
+        # 중력 적용: FPS 기준 프레임마다 속도 += GRAVITY, 위치 += 속도로 진행하는 궤적을
+        # dt와 관계없이 그대로 따르도록 보정항을 더함 (dt == 1이면 보정항은 0)
+        player.velocity_y += GRAVITY * dt
+        player.pos_y += player.velocity_y * dt + GRAVITY * dt * (1 - dt) / 2
 
         # 플랫폼과의 충돌 검사
         player_bottom = player.bottom
@@ -22,6 +26,14 @@ class Movement:
 
         # 현재 플레이어가 서있는 플랫폼
         current_platform = None
+        carry_from = None  # 스윕 검사에서 발판과 함께 움직이기 시작한 발판 x
+
+        # y 인덱스가 있으면 플레이어 바닥 근처 구간의 발판만 검사
+        if hasattr(platforms, 'near'):
+            if player.velocity_y > 0:
+                platforms = platforms.near(prev_bottom, player_bottom)
+            else:
+                platforms = platforms.near(player_bottom - 5, player_bottom + 5)
 
         for platform in platforms:
             # 사라진 상태의 플랫폼은 무시
@@ -35,7 +47,13 @@ class Movement:
                         player_bottom >= platform.y):  # 현재 프레임에서는 플랫폼보다 아래로 이동했으며
 
                     # 플레이어의 중심이 플랫폼 범위 안에 있는지 확인
-                    if (platform.x <= player.pos_x <= platform.x + platform.width):
+                    if swept:
+                        carry_from = Movement.contact_x(
+                            player, platform, prev_bottom, player_bottom)
+                        on_platform = carry_from is not None
+                    else:
+                        on_platform = platform.x <= player.pos_x <= platform.x + platform.width
+                    if on_platform:
                         # 플랫폼 위에 착지
                         player.pos_y = platform.y - PLAYER_HEIGHT/2
                         player.velocity_y = 0
@@ -49,11 +67,16 @@ class Movement:
                 if (platform.y - 5 <= player_bottom <= platform.y + 5 and
                         platform.x <= player.pos_x <= platform.x + platform.width):
                     current_platform = platform
+                    carry_from = platform.prev_x
                     break
 
         # 움직이는 플랫폼 위에 있을 경우 플랫폼과 함께 이동
+        # (스윕 검사에서는 착지한 시점부터, 또는 틱 시작부터 발판이 실제로 움직인 만큼)
         if current_platform and current_platform.is_moving and not player.is_jumping:
-            player.pos_x += current_platform.speed * current_platform.direction
+            if swept:
+                player.pos_x += current_platform.x - carry_from
+            else:
+                player.pos_x += current_platform.speed * current_platform.direction * dt
 
         # 현재 서있는 플랫폼이 사라진 상태라면 플레이어를 떨어지게 함
         if current_platform and hasattr(current_platform, 'is_vanish') and current_platform.is_vanish and not current_platform.is_visible:
@@ -61,9 +84,32 @@ class Movement:
             current_platform = None
 
     @staticmethod
-    def move_horizontal(player, direction):
+    def contact_x(player, platform, prev_bottom, bottom):
+        """
+        이번 틱 동안 플레이어 바닥이 발판 상단을 지나는 시점에
+        플레이어 중심이 그 시점의 발판 x 범위 안에 있었는지 확인합니다.
+        플레이어와 발판 모두 틱 시작 상태(prev_x, prev_width)에서 현재 상태까지
+        일정한 속도로 움직였다고 보고 그 사이를 보간합니다.
+        Args:
+            player: 플레이어 객체 (prev_x는 틱 시작 위치)
+            platform: 발판 객체
+            prev_bottom (float): 틱 시작 시 플레이어 바닥 y
+            bottom (float): 틱 끝 플레이어 바닥 y
+        Returns:
+            float | None: 닿은 시점의 발판 x. 닿지 않았으면 None
+        """
+        fall = bottom - prev_bottom
+        t = (platform.y - prev_bottom) / fall if fall > 0 else 1.0
+        x = player.prev_x + (player.pos_x - player.prev_x) * t
+        left, width = platform.interpolate(t)
+        if left <= x <= left + width:
+            return left
+        return None
+
+    @staticmethod
+    def move_horizontal(player, direction, dt=1.0):
         """플레이어를 좌우로 이동시킵니다."""
-        player.pos_x += direction * PLAYER_SPEED
+        player.pos_x += direction * PLAYER_SPEED * dt
         # 화면 경계 처리
         player.pos_x = max(
             PLAYER_WIDTH/2, min(SCREEN_WIDTH - PLAYER_WIDTH/2, player.pos_x))
@@ -3,7 +3,12 @@ import pygame
 # 게임 설정
 SCREEN_WIDTH = 450
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = 60  # 물리 상수(속도, 중력 등)의 기준 프레임 속도 (값은 1/FPS초당 변화량)
+
+# 고정 시간 간격 시뮬레이션
+SIM_RATE = 60  # 시뮬레이션 틱 속도 (Hz). FPS와 다르면 한 틱에 FPS / SIM_RATE 프레임만큼 진행
+RENDER_FPS = 60  # 화면 갱신 속도 상한 (0이면 제한 없음)
+MAX_SIM_STEPS_PER_FRAME = 5  # 한 번 그릴 때 따라잡는 최대 틱 수 (넘치는 시간은 버림)
 
 # 엑셀 스타일 설정
 EXCEL_CELL_WIDTH = 60
@@ -15,6 +20,12 @@ EXCEL_SELECTED_CELL_COLOR = (217, 226, 243)
 EXCEL_FONT_COLOR = (60, 60, 60)
 EXCEL_HEADER_FONT_COLOR = (80, 80, 80)
 
+# 입력 비트 (헤드리스 실행 및 스크립트 입력용)
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4
+INPUT_RESET = 8
+
 # 카메라 설정
 CAMERA_FOLLOW_THRESHOLD = SCREEN_HEIGHT * 0.4  # 화면 40% 지점부터 카메라가 따라감
 
@@ -64,6 +75,27 @@ RETRY_BUTTON_POS = (SCREEN_WIDTH // 2 - 60, SCREEN_HEIGHT // 2 + 50)
 BUTTON_COLOR = (100, 100, 255)  # 버튼 색상
 BUTTON_SIZE = (200, 50)  # 버튼 크기
 BUTTON_POS = (SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2 + 50)  # 버튼 위치
+TEXT_CACHE_SIZE = 256  # 렌더링된 텍스트 캐시 크기
+PLATFORM_SPRITE_CACHE_SIZE = 128  # 너비별 발판 Surface 캐시 크기
+
+# 변경 영역(dirty rect) 렌더링 설정
+DIRTY_RECT_SCROLL_THRESHOLD = 8  # 카메라가 이 픽셀보다 많이 움직이면 전체 다시 그리기
+DIRTY_RECT_HUD_HEIGHT = 110  # 점수/버프 표시가 차지하는 화면 상단 높이
+
+# 프로파일러 설정
+PROFILER_HISTORY_SIZE = 600  # 단계별로 보관할 최근 측정값 수 (60 FPS 기준 10초)
+PROFILER_TRACE_EVENTS = 200000  # 추적 중 보관할 최대 구간 수
+
+# 타이머 휠 설정
+TIMER_WHEEL_SLOTS = 64  # 단계별 칸 수 (2의 거듭제곱)
+
+# 시뮬레이션 구간 설정 (분석/LOD 모드에서 매 틱 계산하는 camera_y 기준 구간, 픽셀)
+SIM_BAND_ABOVE = SCREEN_HEIGHT + 100  # camera_y 위쪽 (아이템 배치 후보인 화면 위 한 화면 포함)
+SIM_BAND_BELOW = SCREEN_HEIGHT + 100  # camera_y 아래쪽 (화면 포함)
+
+# 월드 청크 설정 (발판을 고정 높이 구간 단위로 생성/정리)
+WORLD_CHUNK_HEIGHT = SCREEN_HEIGHT  # 청크 하나의 높이 (픽셀)
+WORLD_RETAINED_CHUNKS = 24  # 화면 아래로 보관할 청크 수 (떨어져도 다시 밟을 수 있는 범위)
 
 # 움직이는 플랫폼 설정
 MOVING_PLATFORM_RANGE = 100  # 움직이는 거리
@@ -73,42 +105,51 @@ MOVING_PLATFORM_RANGE = 100  # 움직이는 거리
 ITEM_SIZE = 15  # 아이템의 크기
 ITEM_SPAWN_CHANCE = 0.1  # 아이템 생성 확률 (0.4%)
 
+# 버프 설정
+BUFF_EXPIRE_DROP = 5  # 높이로 해제되는 버프: 획득 높이보다 이만큼(m) 내려가면 해제
+
 # 아이템 종류
 ITEM_TYPES = {
     'jump_boost': {
         'color': (0, 255, 0),  # 초록색
         'duration': 5,  # 사용 가능 횟수
         'effect': 'jump_power_multiplier',
-        'value': 1.5  # 점프력 1.5배
+        'value': 1.5,  # 점프력 1.5배
+        'expire': 'uses'  # 사용 횟수만큼 쓰면 해제 (긍정 버프, 한 번에 하나)
     },
     'speed_reduce': {
         'color': (255, 0, 0),  # 빨간색
         'duration': 10,  # 지속 높이 (m)
         'effect': 'speed_multiplier',
-        'value': 0.2  # 이동속도 절반
+        'value': 0.2,  # 이동속도 절반
+        'expire': 'height'  # 지속 높이만큼 오르거나 BUFF_EXPIRE_DROP만큼 내려가면 해제
     },
     'double_jump': {
         'color': (255, 255, 0),  # 노란색
         'duration': 5,  # 사용 가능 횟수
         'effect': 'double_jump',
-        'value': 1.0  # 이동속도 그대로
+        'value': 1.0,  # 이동속도 그대로
+        'expire': 'uses'  # 사용 횟수만큼 쓰면 해제 (긍정 버프, 한 번에 하나)
     },
     'key_reverse': {
         'color': (128, 0, 128),  # 보라색
         'duration': 10,  # 지속 높이 (m)
         'effect': 'key_reverse',
-        'value': 1.0  # 이동속도 그대로
+        'value': 1.0,  # 이동속도 그대로
+        'expire': 'height'  # 지속 높이만큼 오르거나 BUFF_EXPIRE_DROP만큼 내려가면 해제
     },
     'platform_width': {
         'color': (255, 165, 0),  # 주황색
         'duration': 10,  # 지속 높이 (m)
         'effect': 'platform_width',
-        'value': 10  # 플랫폼 너비
+        'value': 10,  # 플랫폼 너비
+        'expire': 'height'  # 지속 높이만큼 오르거나 BUFF_EXPIRE_DROP만큼 내려가면 해제
     },
     'ice_slide': {
         'color': (135, 206, 235),  # 하늘색
         'duration': 10,  # 지속 높이 (m)
         'effect': 'ice_slide',
-        'value': 0.5  # 미끄러짐 속도
+        'value': 0.5,  # 미끄러짐 속도
+        'expire': 'height'  # 지속 높이만큼 오르거나 BUFF_EXPIRE_DROP만큼 내려가면 해제
     }
 }
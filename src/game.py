@@ -1,31 +1,80 @@
+import os
 import pygame
 import random
 import time
 from src.ui.score import ScoreUI
 from src.ui.splash_screen import SplashScreen
+from src.ui.excel_background import ExcelBackground
+from src.ui.text_cache import get_font, text_cache
+from src.ui.game_over import GameOverOverlay
 from .constants import *
 from .objects.player import Player
 from .objects.platform import Platform
+from .objects.platform_index import PlatformIndex
+from .objects.platform_store import PlatformStore
+from .objects.world_stream import platform_stream, chunk_stream
 from .objects.item import Item
+from .objects.item_index import ItemIndex
+from .objects.pool import ObjectPool
+from .actions.buffs import BuffEngine
+from .sim.clock import SimClock
+from .sim.profiler import FrameProfiler
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, platform_store=False, dirty_rects=False,
+                 seed=None, analytic=False, lod=False, sim_band=None,
+                 item_placement='frame', sim_rate=SIM_RATE, swept_collision=None):
+        """
+        게임을 초기화합니다.
+        Args:
+            headless (bool): True면 창을 열지 않고 오프스크린 화면만 사용
+            platform_store (bool): True면 발판 상태를 NumPy 배열(PlatformStore)로 관리
+            dirty_rects (bool): True면 변경된 영역만 다시 그려 화면에 반영
+            seed (int, optional): 판마다 사용할 시드를 뽑는 기준 시드. None이면 무작위
+            analytic (bool): True면 발판/아이템을 매 틱 진행하지 않고 화면 주변 구간만
+                시뮬레이션 시각으로부터 직접 계산
+            lod (bool): True면 화면 주변 구간의 발판/아이템만 매 틱 업데이트하고,
+                구간 밖의 객체는 멈춰 두었다가 다시 들어올 때 현재 틱의 상태로 따라잡음
+            sim_band (tuple, optional): (camera_y 위쪽, 아래쪽) 구간 크기.
+                None이면 (SIM_BAND_ABOVE, SIM_BAND_BELOW)
+            item_placement (str): 'frame'이면 매 프레임 확률적으로 아이템 생성,
+                'chunk'면 발판 청크를 생성할 때 한 번에 배치
+            sim_rate (int): 초당 시뮬레이션 틱 수. 화면 갱신 속도(RENDER_FPS)와 별개로,
+                run()은 실제 흐른 시간만큼 이 속도의 고정 틱을 진행하고 그 사이를 보간해 그림
+            swept_collision (bool, optional): True면 착지를 틱 동안의 플레이어/발판 움직임
+                전체로 검사. None이면 틱이 FPS 기준 한 프레임보다 길 때(sim_rate < FPS)만 사용
+        """
+        self.headless = headless
+        if headless:
+            # 디스플레이가 없는 환경에서도 동작하도록 SDL 더미 드라이버 사용
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if headless:
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode(
+                (SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
         self.camera_y = 0  # 카메라의 y 위치
+        self.prev_camera_y = 0  # 이전 틱의 카메라 위치 (그릴 때 보간용)
+        self.render_camera_y = 0  # 그릴 때 사용하는 (보간된) 카메라 위치
+        self.render_alpha = 1.0  # 이전 틱과 현재 틱 사이 그릴 지점 (1이면 현재 틱)
+        self.sim_accumulator = 0.0  # 아직 시뮬레이션하지 않은 실제 시간 (초)
+        self.last_run_time = None  # 지난 run() 호출 시각
         self.score_ui = ScoreUI()  # 점수 UI 초기화
-        self.font = pygame.font.Font(None, FONT_SIZE)
-        self.big_font = pygame.font.Font(None, FONT_SIZE + 20)  # 큰 폰트 추가
-        self.small_font = pygame.font.Font(None, 24)  # 작은 폰트 추가
-
-        # 성능 모니터링을 위한 변수들
-        self.frame_times = []  # 프레임 시간 기록
+        self.font = get_font(FONT_SIZE)
+        self.big_font = get_font(FONT_SIZE + 20)  # 큰 폰트 추가
+        self.small_font = get_font(24)  # 작은 폰트 추가
+        self.background = ExcelBackground()  # 미리 그려 둔 엑셀 배경
+        self.dirty_rects = dirty_rects  # 변경 영역 렌더링 사용 여부
+        self.last_frame = None  # 이전 프레임의 객체 영역 (변경 영역 계산용)
+        self.retained_state = None  # 화면에 그려져 있는 정적 화면(스플래시/게임오버)의 상태
+
+        # 성능 모니터링 (단계별 시간과 FPS/객체 수를 고정 크기 링 버퍼에 기록)
+        self.profiler = FrameProfiler()
         self.last_fps_check = time.time()
-        self.fps_history = []  # FPS 기록
-        self.platform_count_history = []  # 플랫폼 수 기록
-        self.item_count_history = []  # 아이템 수 기록
 
         # 버튼 위치 및 크기 조정
         button_width = 250
@@ -41,27 +90,95 @@ class Game:
             SCREEN_WIDTH//2 - button_width//2,
             base_y + button_height + button_gap,
             button_width, button_height)
+        self.game_over_overlay = GameOverOverlay(
+            self.retry_button, self.change_difficulty_button)
 
         # 게임 상태 추가
         self.is_in_splash = True  # 스플래시 화면 상태
         self.splash_screen = SplashScreen()
 
         # 게임 객체 초기화
-        self.platforms = []
-        self.items = []  # 아이템 리스트 추가
+        self.platforms = PlatformIndex()  # y 순서로 정렬된 발판 인덱스
+        self.world_chunks = None  # 새 발판을 청크 단위로 내는 스트림
+        self.items = ItemIndex()  # y 순서로 정렬된 아이템 인덱스
         self.obstacles = []  # 장애물 리스트 추가
         self.last_obstacle_height = 0  # 마지막 장애물 생성 높이
         self.obstacle_interval = 300  # 10m (100픽셀 = 1m)
         self.player = None
+        # 배열 기반 발판 저장소 (선택)
+        self.platform_store = PlatformStore() if platform_store else None
+        # 발판/아이템 객체 풀 (지나간 청크와 이전 판의 객체를 재사용)
+        self.platform_pool = ObjectPool(Platform)
+        self.item_pool = ObjectPool(Item)
 
         # 버프 상태 초기화
-        self.active_buffs = {}  # 현재 활성화된 버프들
-        self.original_platform_widths = {}  # 플랫폼의 원래 너비 저장
+        self.buffs = BuffEngine(self)  # 현재 활성화된 버프들
+
+        # 재현 가능한 실행을 위한 시드와 시뮬레이션 시간
+        self.seed_source = random.Random(seed)  # 판마다 시드를 뽑는 난수 생성기
+        self.seed = None  # 현재 판의 시드
+        self.rng = random.Random()  # 현재 판의 난수 생성기
+        self.sim_rate = sim_rate  # 초당 시뮬레이션 틱 수
+        self.sim_clock = SimClock(sim_rate)  # 현재 판의 시뮬레이션 시계
+        if swept_collision is None:
+            swept_collision = self.sim_clock.dt > 1
+        self.swept_collision = swept_collision  # 연속 충돌(스윕) 착지 검사 사용 여부
+        self.analytic = analytic  # 분석 모드 사용 여부
+        self.lod = lod  # LOD(구간 밖 객체 정지) 모드 사용 여부
+        self.sim_band = sim_band or (SIM_BAND_ABOVE, SIM_BAND_BELOW)
+        self.item_placement = item_placement  # 아이템 배치 방식 ('frame' 또는 'chunk')
+        self.lod_platforms = []  # 지난 틱에 구간 안에서 업데이트된 발판들
+        self.updated_objects = 0  # 이번 틱에 업데이트(또는 계산)된 발판/아이템 수
+        self.pending_input = 0  # 이벤트로 들어온 점프/리셋 입력 (다음 update에서 처리)
+        self.recorder = None  # 입력 기록기 (InputRecorder)
+
+    @property
+    def frame(self):
+        """현재 판에서 진행된 프레임 수를 반환합니다."""
+        return self.sim_clock.tick
+
+    @property
+    def sim_time(self):
+        """현재 판의 시뮬레이션 시간(ms)을 반환합니다."""
+        return self.sim_clock.time
+
+    def reset_game(self, seed=None):
+        """
+        게임을 초기 상태로 리셋합니다.
+        Args:
+            seed (int, optional): 이번 판의 시드. None이면 seed_source에서 뽑음
+        """
+        if seed is None:
+            seed = self.seed_source.randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.sim_clock = SimClock(self.sim_rate)
+        self.difficulty = Platform.current_difficulty  # 이번 판의 난이도 설정
+        self.width_override = None  # 발판 너비 버프 값 (None이면 없음)
+        self.activate()
+        self.pending_input = 0
+
+        # 이전 판의 발판과 아이템은 풀에 돌려주고 재사용
+        for platform in self.platforms:
+            self.release_platform(platform)
+        for item in self.items:
+            self.item_pool.release(item)
+
+        # 이전 판의 아이템, 버프, 카메라 초기화
+        self.items = ItemIndex()
+        self.buffs = BuffEngine(self)
+        self.camera_y = 0
+        self.prev_camera_y = 0
+        self.lod_platforms = []
 
-    def reset_game(self):
-        """게임을 초기 상태로 리셋합니다."""
         # 초기 발판들 생성 (더 많은 수의 초기 발판)
-        self.platforms = Platform.create_initial_platforms(10)
+        initial_platforms = Platform.create_initial_platforms(10)
+        if self.platform_store is not None:
+            self.platform_store.clear()
+            initial_platforms = [self.store_platform(platform)
+                                 for platform in initial_platforms]
+        self.platforms = PlatformIndex(initial_platforms)
+        self.start_world_stream()
         self.obstacles = []  # 장애물 리스트 초기화
         self.last_obstacle_height = 0
 
@@ -73,6 +190,47 @@ class Game:
 
         # 초기에 더 많은 플랫폼 미리 생성
         self.generate_platforms()
+        self.last_frame = None  # 다음 프레임은 전체를 다시 그림
+        self.retained_state = None
+        if self.recorder is not None:
+            self.recorder.begin(self.seed, self.splash_screen.selected_difficulty,
+                                self.sim_rate)
+
+    def activate(self):
+        """
+        이 게임의 판 상태(난수 생성기, 시계, 난이도, 객체 풀, 너비 버프)를 Platform에 연결합니다.
+        Platform은 이 값들을 클래스 속성으로 공유하므로, 한 프로세스에서 여러 게임을
+        번갈아 진행할 수 있도록 update()와 draw()가 시작할 때 호출합니다.
+        """
+        Platform.rng = self.rng
+        Platform.clock = self.sim_clock
+        Platform.analytic = self.analytic
+        Platform.pool = self.platform_pool
+        Platform.current_difficulty = self.difficulty
+        Platform.width_override = self.width_override
+
+    def start(self, difficulty_name, seed=None):
+        """
+        스플래시 화면을 건너뛰고 지정한 난이도로 게임을 시작합니다.
+        Args:
+            difficulty_name (str): 난이도 이름
+            seed (int, optional): 첫 판의 시드
+        """
+        Platform.set_difficulty(difficulty_name)
+        self.splash_screen.selected_difficulty = difficulty_name
+        self.is_in_splash = False
+        self.reset_game(seed)
+
+    def read_input(self):
+        """키보드 상태와 이벤트로 들어온 입력을 입력 비트로 만듭니다."""
+        input_bits = self.pending_input
+        self.pending_input = 0
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_LEFT]:
+            input_bits |= INPUT_LEFT
+        if keys[pygame.K_RIGHT]:
+            input_bits |= INPUT_RIGHT
+        return input_bits
 
     def update_camera(self):
         """카메라 위치를 업데이트합니다."""
@@ -85,7 +243,7 @@ class Game:
         """버튼을 그립니다."""
         pygame.draw.rect(self.screen, color, rect)
         pygame.draw.rect(self.screen, WHITE, rect, 2)  # 테두리
-        text_surface = self.font.render(text, True, WHITE)
+        text_surface = text_cache.render(self.font, text, WHITE)
         text_rect = text_surface.get_rect(center=rect.center)
         self.screen.blit(text_surface, text_rect)
 
@@ -95,6 +253,14 @@ class Game:
             if event.type == pygame.QUIT:
                 return False
 
+            # 창이 다시 노출되면 정적 화면도 다시 그림
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.retained_state = None
+
+            # 프로파일링 단축키 (F9: cProfile, F10: Chrome trace, F11: 단계별 통계 출력)
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_F9, pygame.K_F10, pygame.K_F11):
+                self.toggle_profiling(event.key)
+
             # 스플래시 화면일 때
             if self.is_in_splash:
                 if event.type == pygame.MOUSEBUTTONDOWN:
@@ -113,71 +279,60 @@ class Game:
                         elif self.change_difficulty_button.collidepoint(event.pos):
                             self.is_in_splash = True
                 else:
+                    # 점프/리셋은 다음 update에서 입력 비트로 처리 (기록/리플레이와 같은 경로)
                     if event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_SPACE:
-                            self.player.jump()
+                            self.pending_input |= INPUT_JUMP
                         elif event.key == pygame.K_r:
-                            self.reset_game()
+                            self.pending_input |= INPUT_RESET
 
         return True
 
+    def toggle_profiling(self, key):
+        """프로파일링 단축키를 처리합니다. 결과 파일은 현재 디렉터리에 저장합니다."""
+        profiler = self.profiler
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        if key == pygame.K_F9:
+            if profiler.profiling:
+                path = f"profile-{stamp}.prof"
+                profiler.stop_cprofile(path).sort_stats('cumulative').print_stats(20)
+                print(f"cProfile saved: {path}")
+            else:
+                profiler.start_cprofile()
+                print("cProfile started (F9 to stop)")
+        elif key == pygame.K_F10:
+            if profiler.tracing:
+                path = f"trace-{stamp}.json"
+                profiler.stop_trace(path)
+                print(f"Trace saved: {path}")
+            else:
+                profiler.start_trace()
+                print("Trace started (F10 to stop)")
+        else:
+            print(profiler.format_summary())
+
     def generate_items(self):
         """새로운 아이템을 생성합니다."""
         try:
+            # 청크 배치 모드에서는 발판을 생성할 때 이미 배치됨
+            if self.item_placement != 'frame':
+                return
+
             # 화면 상단에서 일정 높이 이상 떨어진 아이템은 제거
-            self.items = [item for item in self.items if item.pos_y >
-                          self.camera_y - SCREEN_HEIGHT]
+            top = self.camera_y - SCREEN_HEIGHT
+            for item in self.items.drop_above(top):
+                self.item_pool.release(item)
 
             # 새로운 아이템 생성
-            if random.random() < ITEM_SPAWN_CHANCE:
-                # 현재 화면에 보이는 플랫폼들 중에서 선택
-                visible_platforms = [p for p in self.platforms
-                                     if p.y > self.camera_y - SCREEN_HEIGHT
-                                     and p.y < self.camera_y]
-
-                if visible_platforms:
-                    # 가장 가까운 아이템과의 거리 확인
-                    min_distance_up = 1000  # 위로 10m(1000픽셀)
-                    min_distance_down = 500  # 아래로 5m(500픽셀)
-                    valid_platforms = []
-
-                    for platform in visible_platforms:
-                        # 이 플랫폼이 다른 아이템들과 충분히 떨어져 있는지 확인
-                        is_valid = True
-                        for item in self.items:
-                            height_diff = platform.y - item.pos_y
-                            if height_diff > 0:  # 플랫폼이 아이템보다 위에 있는 경우
-                                if height_diff < min_distance_up:
-                                    is_valid = False
-                                    break
-                            else:  # 플랫폼이 아이템보다 아래에 있는 경우
-                                if abs(height_diff) < min_distance_down:
-                                    is_valid = False
-                                    break
-                        if is_valid:
-                            valid_platforms.append(platform)
-
-                    if valid_platforms:
-                        # 유효한 플랫폼들 중에서 랜덤하게 선택
-                        platform = random.choice(valid_platforms)
-
-                        # 플랫폼 위에 아이템 생성
-                        x = platform.center_x + \
-                            random.randint(-platform.width//3,
-                                           platform.width//3)
-                        y = platform.y - ITEM_SIZE/2
-
-                        # 랜덤하게 아이템 타입 선택
-                        item_type = random.choice(list(ITEM_TYPES.keys()))
-
-                        # 새 아이템 생성
-                        new_item = Item(x, y, item_type)
-                        self.items.append(new_item)
-
-                        # 아이템 수 제한
-                        if len(self.items) > 50:  # 최대 50개로 제한
-                            print("Item limit reached, removing oldest items")
-                            self.items = self.items[-50:]  # 가장 최근 50개만 유지
+            if self.rng.random() < ITEM_SPAWN_CHANCE * self.sim_clock.dt:
+                # 화면 위 한 화면 구간의 플랫폼들 중 다른 아이템과 충분히 떨어진 것만 선택
+                valid_platforms = [p for p in self.platforms.near(top, self.camera_y)
+                                   if top < p.y < self.camera_y
+                                   and self.is_item_spacing_valid(p)]
+
+                if valid_platforms:
+                    # 유효한 플랫폼들 중에서 랜덤하게 선택
+                    self.place_item(self.rng.choice(valid_platforms))
 
         except Exception as e:
             print(f"Item Generation Error: {str(e)}")
@@ -186,7 +341,7 @@ class Game:
 
     def draw_buff_status(self):
         """우측 상단에 버프 상태를 표시합니다."""
-        if not self.active_buffs:
+        if not self.buffs.active:
             return
 
         # 버프 아이콘 크기와 간격
@@ -195,7 +350,7 @@ class Game:
         start_x = SCREEN_WIDTH - 20
         start_y = 20
 
-        for i, (buff_type, buff_info) in enumerate(self.active_buffs.items()):
+        for i, buff_type in enumerate(self.buffs.active):
             # 버프 아이콘 그리기
             color = ITEM_TYPES[buff_type]['color']
             pygame.draw.circle(self.screen, color, (
@@ -209,24 +364,16 @@ class Game:
                 start_y
             ), icon_size/2, 1)
 
-            # 남은 효과 표시
-            if buff_type == 'double_jump':
-                # 2단 점프의 경우 남은 횟수 표시
-                remaining = self.player.remaining_double_jumps
-                text = self.small_font.render(f"{remaining}", True, (0, 0, 0))
-            elif buff_type == 'jump_boost':
-                # 점프력 증가의 경우 남은 횟수 표시
-                remaining = self.player.remaining_jump_boosts
-                text = self.small_font.render(f"{remaining}", True, (0, 0, 0))
+            # 남은 효과 표시 (횟수 버프는 남은 횟수, 높이 버프는 남은 높이)
+            remaining = self.buffs.remaining(buff_type)
+            if ITEM_TYPES[buff_type]['expire'] == 'uses':
+                text = text_cache.render(
+                    self.small_font, f"{remaining}", (0, 0, 0))
+            elif remaining > 0:
+                text = text_cache.render(
+                    self.small_font, f"{remaining}m", (0, 0, 0))
             else:
-                # 다른 버프의 경우 남은 높이 표시
-                remaining_height = buff_info['duration'] - \
-                    (self.player.raw_height - buff_info['start_height'])
-                if remaining_height > 0:
-                    text = self.small_font.render(
-                        f"{remaining_height}m", True, (0, 0, 0))
-                else:
-                    continue
+                continue
 
             text_rect = text.get_rect(center=(
                 start_x - i * (icon_size + icon_gap),
@@ -234,127 +381,83 @@ class Game:
             ))
             self.screen.blit(text, text_rect)
 
-    def update_buffs(self):
-        """버프 상태를 업데이트합니다."""
-        # 만료된 버프 제거
-        expired_buffs = []
-        for buff_type, buff_info in self.active_buffs.items():
-            # 점프력 증가나 2단 점프의 경우 횟수가 0이면 만료
-            if buff_type in ['jump_boost', 'double_jump']:
-                if (buff_type == 'jump_boost' and self.player.remaining_jump_boosts <= 0) or \
-                   (buff_type == 'double_jump' and self.player.remaining_double_jumps <= 0):
-                    expired_buffs.append(buff_type)
-                    # 버프 효과 제거
-                    if buff_type == 'jump_boost':
-                        self.player.jump_power_multiplier = 1.0
-            # 속도 감소, 키 반전, 플랫폼 너비 변경, 슬라이딩의 경우 높이로 판단
-            elif buff_type in ['speed_reduce', 'key_reverse', 'platform_width', 'ice_slide']:
-                current_height = self.player.raw_height
-                height_diff = current_height - buff_info['start_height']
-                # 10m 위로 올라가거나 5m 아래로 내려가면 해제
-                if height_diff >= 10 or height_diff <= -5:
-                    expired_buffs.append(buff_type)
-                    if buff_type == 'speed_reduce':
-                        self.player.speed_multiplier = 1.0
-                    elif buff_type == 'key_reverse':
-                        self.player.is_key_reversed = False
-                    elif buff_type == 'platform_width':
-                        # 플랫폼 너비를 원래대로 복구
-                        for platform_id, original_width in self.original_platform_widths.items():
-                            for platform in self.platforms:
-                                if id(platform) == platform_id:
-                                    platform.width = original_width
-                        self.original_platform_widths.clear()
-                    elif buff_type == 'ice_slide':
-                        self.player.is_sliding = False
-                        self.player.velocity_x = 0
-
-        for buff_type in expired_buffs:
-            del self.active_buffs[buff_type]
-            # 모든 버프가 만료되었는지 확인
-            if not self.active_buffs:
-                self.player.remove_buff()
-
-    def apply_buff(self, effect):
-        """아이템 효과를 적용합니다."""
-        buff_type = effect['type']
-
-        # 이전 버프 효과 제거
-        if self.active_buffs:
-            old_buff_type = list(self.active_buffs.keys())[0]
-            if old_buff_type == 'jump_boost':
-                self.player.jump_power_multiplier = 1.0
-            elif old_buff_type == 'speed_reduce':
-                self.player.speed_multiplier = 1.0
-            elif old_buff_type == 'platform_width':
-                # 플랫폼 너비를 원래대로 복구
-                for platform_id, original_width in self.original_platform_widths.items():
-                    for platform in self.platforms:
-                        if id(platform) == platform_id:
-                            platform.width = original_width
-                            if platform.is_transforming:
-                                platform.initial_width = original_width
-                self.original_platform_widths.clear()
-            self.active_buffs.clear()
-
-        # 새로운 버프 적용
-        self.active_buffs[buff_type] = {
-            'start_height': effect['start_height'],
-            'duration': effect['duration']
-        }
-
-        # 버프 효과 적용
-        if buff_type == 'jump_boost':
-            self.player.jump_power_multiplier = effect['value']
-        elif buff_type == 'speed_reduce':
-            self.player.speed_multiplier = effect['value']
-        elif buff_type == 'platform_width':
-            # 모든 플랫폼의 너비를 변경하고 원래 너비 저장
-            for platform in self.platforms:
-                if id(platform) not in self.original_platform_widths:
-                    self.original_platform_widths[id(
-                        platform)] = platform.width
-                platform.width = effect['value']
-                if platform.is_transforming:
-                    platform.initial_width = effect['value']
-                    platform.min_width = effect['value']
-
-        # 플레이어의 테두리 색상 변경
-        self.player.set_buff(buff_type)
-
-    def update(self):
-        """게임 상태를 업데이트합니다."""
+    def update(self, input_bits=None):
+        """
+        게임 상태를 한 틱(1/sim_rate초) 진행합니다.
+        Args:
+            input_bits (int, optional): 스크립트 입력. None이면 키보드/이벤트 입력을 읽음
+        """
         try:
             if self.is_in_splash:
+                self.pending_input = 0
                 return
+            self.activate()
+
+            if input_bits is None:
+                input_bits = self.read_input()
+
+            # 리셋은 새 판을 시작하므로 기록하지 않음
+            if input_bits & INPUT_RESET:
+                self.reset_game()
+                input_bits &= ~INPUT_RESET
 
             if self.player.is_dead:
                 return
 
             # 성능 모니터링 시작
-            frame_start = time.time()
-
-            # 키보드 입력 처리
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT]:
-                self.player.move(-1)
-            if keys[pygame.K_RIGHT]:
-                self.player.move(1)
+            profiler = self.profiler
+            update_start = profiler.mark()
+
+            # 그릴 때 보간할 수 있도록 이전 틱의 카메라/플레이어 위치 저장
+            dt = self.sim_clock.dt
+            self.prev_camera_y = self.camera_y
+            self.player.save_previous()
+
+            # 입력 기록
+            if self.recorder is not None:
+                self.recorder.record(input_bits)
+
+            # 입력 처리
+            if input_bits & INPUT_JUMP:
+                if self.player.jump():
+                    self.buffs.on_jump()
+            if input_bits & INPUT_LEFT:
+                self.player.move(-1, dt)
+            if input_bits & INPUT_RIGHT:
+                self.player.move(1, dt)
+            profiler.lap('update.input')
+
+            # 시뮬레이션 시계를 한 틱 진행 (이번 틱에 예약된 사라짐/나타남 전환 실행)
+            self.sim_clock.advance()
 
             # 플랫폼 업데이트
-            for platform in self.platforms:
-                platform.update()
-
-            # 아이템 업데이트
-            for item in self.items:
-                item.update()
-                # 플레이어와 아이템 충돌 체크
-                if not item.is_collected and item.rect.colliderect(self.player.rect):
-                    effect = item.collect()
-                    self.apply_buff(effect)
-
-            # 버프 상태 업데이트
-            self.update_buffs()
+            if self.analytic:
+                self.updated_objects = self.evaluate_band()
+            elif self.platform_store is not None:
+                self.platform_store.update()
+                self.updated_objects = len(self.platforms)
+            elif self.lod:
+                self.updated_objects = self.update_band()
+            else:
+                for platform in self.platforms:
+                    platform.update()
+                self.updated_objects = len(self.platforms)
+            profiler.lap('update.platforms')
+
+            # 아이템 업데이트 (분석 모드에서는 그릴 때 계산)
+            if self.lod and not self.analytic:
+                self.updated_objects += self.update_band_items()
+            elif not self.analytic:
+                for item in self.items:
+                    item.update(dt)
+                self.updated_objects += len(self.items)
+            # 플레이어와 아이템 충돌 체크 (플레이어 높이 근처의 아이템만)
+            player_rect = self.player.rect
+            for item in self.items.near(player_rect.top - ITEM_SIZE,
+                                        player_rect.bottom + ITEM_SIZE):
+                if not item.is_collected and item.rect.colliderect(player_rect):
+                    self.buffs.apply(item.collect())
+            profiler.lap('update.items')
 
             # 장애물 업데이트 및 충돌 체크
             for obstacle in self.obstacles:
@@ -363,57 +466,39 @@ class Game:
                     pass
 
             # 플레이어 업데이트
-            self.player.update(self.platforms)
+            self.player.update(self.platforms, dt, self.swept_collision)
 
             # 점수 업데이트
             prev_score = self.player.score
+            prev_height = self.player.raw_height
             self.player.update_score()
+            # 높이가 바뀌었을 때만 버프 해제 조건 확인
+            if self.player.raw_height != prev_height:
+                self.buffs.on_height(self.player.raw_height)
+            profiler.lap('update.player')
 
             # 카메라 업데이트
             self.update_camera()
 
             # 플레이어의 화면상 위치 업데이트
             self.player.update_screen_position(self.camera_y)
+            profiler.lap('update.camera')
 
             # 새로운 플랫폼 생성
             self.generate_platforms()
 
             # 새로운 아이템 생성
             self.generate_items()
+            profiler.lap('update.generation')
 
             # 성능 모니터링
-            frame_time = time.time() - frame_start
-            self.frame_times.append(frame_time)
+            profiler.since('update', update_start)
+            profiler.counter('updated_objects', self.updated_objects)
 
-            # 1초마다 성능 통계 업데이트
+            # 1초마다 성능 통계 확인 (헤드리스 모드에서는 생략)
             current_time = time.time()
-            if current_time - self.last_fps_check >= 1.0:
-                if self.frame_times:
-                    avg_frame_time = sum(self.frame_times) / \
-                        len(self.frame_times)
-                    fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
-                    self.fps_history.append(fps)
-                    self.platform_count_history.append(len(self.platforms))
-                    self.item_count_history.append(len(self.items))
-
-                    # 성능 이슈 체크
-                    if fps < 30:  # FPS가 30 미만이면 경고
-                        print(f"Performance Warning: Low FPS ({fps:.1f})")
-                        print(
-                            f"Platforms: {len(self.platforms)}, Items: {len(self.items)}")
-
-                    # 메모리 사용량이 너무 많으면 경고
-                    if len(self.platforms) > 100 or len(self.items) > 50:
-                        print(f"Memory Warning: Too many objects")
-                        print(
-                            f"Platforms: {len(self.platforms)}, Items: {len(self.items)}")
-
-                    # 프레임 시간이 너무 길면 경고
-                    if avg_frame_time > 0.033:  # 30 FPS 기준
-                        print(
-                            f"Frame Time Warning: {avg_frame_time*1000:.1f}ms")
-
-                self.frame_times = []
+            if not self.headless and current_time - self.last_fps_check >= 1.0:
+                self.check_performance()
                 self.last_fps_check = current_time
 
         except Exception as e:
@@ -425,155 +510,470 @@ class Game:
                 f"Player position: x={self.player.pos_x}, y={self.player.pos_y}")
             raise  # 예외를 다시 발생시켜 게임이 멈추도록 함
 
-    def draw_excel_background(self):
-        """엑셀 스타일의 배경을 그립니다."""
-        # 배경을 흰색으로 채우기
-        self.screen.fill(WHITE)
-
-        # 열 헤더 그리기
-        columns = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
-        small_font = pygame.font.Font(None, 24)
-
-        # 행 번호와 열 헤더 배경
-        pygame.draw.rect(self.screen, EXCEL_COLUMN_HEADER_COLOR,
-                         (0, 0, SCREEN_WIDTH, EXCEL_HEADER_HEIGHT))
-
-        # 열 헤더 텍스트
-        for i, col in enumerate(columns):
-            x = i * EXCEL_CELL_WIDTH + EXCEL_CELL_WIDTH//2
-            text = small_font.render(col, True, EXCEL_HEADER_FONT_COLOR)
-            text_rect = text.get_rect(center=(x, EXCEL_HEADER_HEIGHT//2))
-            self.screen.blit(text, text_rect)
+    def active_band(self):
+        """
+        분석/LOD 모드에서 매 틱 상태를 계산하는 y 구간 (top, bottom)을 반환합니다.
+        기본값은 화면과 그 위 한 화면(아이템 배치 후보)을 여유와 함께 덮습니다.
+        """
+        above, below = self.sim_band
+        return self.camera_y - above, self.camera_y + below
+
+    def evaluate_band(self):
+        """
+        분석 모드: 구간 안의 발판만 현재 틱의 상태로 계산합니다. 구간 밖의 발판은 비용이 없습니다.
+        Returns:
+            int: 계산한 발판 수
+        """
+        tick = self.sim_clock.tick
+        band = self.platforms.near(*self.active_band())
+        for platform in band:
+            platform.evaluate(tick)
+        return len(band)
+
+    def update_band(self):
+        """
+        LOD 모드: 구간 안의 발판만 매 틱 업데이트합니다.
+        구간을 벗어난 발판은 그 시점 상태를 기준으로 저장하고 멈추며,
+        다시 들어오면 기준 상태에서 현재 틱의 상태를 계산해 이어서 업데이트합니다.
+        Returns:
+            int: 업데이트한 발판 수
+        """
+        tick = self.sim_clock.tick
+        band = self.platforms.near(*self.active_band())
+        for platform in band:
+            if platform.lod_tick == tick - 1:
+                platform.update()
+            else:
+                platform.evaluate(tick)  # 멈춰 있던 동안의 변화를 따라잡음
+            platform.lod_tick = tick
+        for platform in self.lod_platforms:
+            if platform.lod_tick != tick:
+                platform.anchor(tick - 1)  # 지난 틱 상태에서 멈춤
+        self.lod_platforms = band
+        return len(band)
+
+    def update_band_items(self):
+        """
+        LOD 모드: 구간 안의 아이템만 매 틱 업데이트합니다.
+        아이템의 움직임은 생성 틱에서 바로 계산되므로 다시 들어올 때 evaluate로 따라잡습니다.
+        Returns:
+            int: 업데이트한 아이템 수
+        """
+        tick = self.sim_clock.tick
+        top, bottom = self.active_band()
+        count = 0
+        for item in self.items:
+            if top <= item.pos_y <= bottom:
+                if item.lod_tick == tick - 1:
+                    item.update(self.sim_clock.dt)
+                else:
+                    item.evaluate(tick, self.sim_clock.dt)
+                item.lod_tick = tick
+                count += 1
+        return count
+
+    def rebase_platforms(self):
+        """
+        분석/LOD 모드: 모든 발판을 현재 틱의 상태로 맞추고 그 상태를 기준으로 다시 저장합니다.
+        기준 상태부터는 같은 움직임 규칙이 이어진다고 보고 계산하므로,
+        너비 버프처럼 규칙이 바뀌기 직전에 호출합니다.
+        """
+        if not (self.analytic or self.lod):
+            return
+        tick = self.sim_clock.tick
+        for platform in self.platforms:
+            if self.analytic or platform.lod_tick != tick:
+                platform.evaluate(tick)
+            platform.anchor(tick)
+
+    def evaluate_items(self):
+        """분석 모드: 화면에 보이는 아이템의 상하 움직임만 현재 틱의 상태로 계산합니다."""
+        tick = self.sim_clock.tick
+        top = self.camera_y - ITEM_SIZE
+        bottom = self.camera_y + SCREEN_HEIGHT + ITEM_SIZE
+        for item in self.items:
+            if top <= item.pos_y <= bottom:
+                item.evaluate(tick, self.sim_clock.dt)
+
+    def check_performance(self):
+        """최근 1초의 update 시간으로 FPS와 객체 수를 기록하고 성능 경고를 출력합니다."""
+        update_times = self.profiler.phases.get('update')
+        if not update_times:
+            return
+        avg_frame_time = update_times.mean(last=self.sim_rate)
+        fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
+        self.profiler.counter('fps', fps)
+        self.profiler.counter('platforms', len(self.platforms))
+        self.profiler.counter('items', len(self.items))
+
+        # 성능 이슈 체크
+        if fps < 30:  # FPS가 30 미만이면 경고
+            print(f"Performance Warning: Low FPS ({fps:.1f})")
+            print(
+                f"Platforms: {len(self.platforms)}, Items: {len(self.items)}")
 
-        # 행 번호
-        visible_rows = SCREEN_HEIGHT // EXCEL_CELL_HEIGHT
-        start_row = int(self.camera_y // EXCEL_CELL_HEIGHT)
-
-        for i in range(visible_rows + 2):
-            row_num = i + start_row
-            y = i * EXCEL_CELL_HEIGHT + EXCEL_HEADER_HEIGHT
-            text = small_font.render(
-                str(row_num + 1), True, EXCEL_HEADER_FONT_COLOR)
-            text_rect = text.get_rect(
-                midright=(EXCEL_CELL_WIDTH - 5, y + EXCEL_CELL_HEIGHT//2))
-            self.screen.blit(text, text_rect)
+        # 메모리 사용량이 너무 많으면 경고
+        if len(self.platforms) > 100 or len(self.items) > 50:
+            print(f"Memory Warning: Too many objects")
+            print(
+                f"Platforms: {len(self.platforms)}, Items: {len(self.items)}")
 
-        # 격자 그리기
-        for i in range(visible_rows + 2):
-            y = i * EXCEL_CELL_HEIGHT + EXCEL_HEADER_HEIGHT
-            pygame.draw.line(self.screen, EXCEL_GRID_COLOR,
-                             (0, y), (SCREEN_WIDTH, y))
+        # 프레임 시간이 너무 길면 경고
+        if avg_frame_time > 0.033:  # 30 FPS 기준
+            print(
+                f"Frame Time Warning: {avg_frame_time*1000:.1f}ms")
 
-        for i in range(len(columns) + 1):
-            x = i * EXCEL_CELL_WIDTH
-            pygame.draw.line(self.screen, EXCEL_GRID_COLOR,
-                             (x, 0), (x, SCREEN_HEIGHT))
+    def draw_excel_background(self):
+        """엑셀 스타일의 배경을 그립니다."""
+        self.background.draw(self.screen, self.render_camera_y)
+
+    def draw_world(self):
+        """발판, 아이템, 플레이어를 그립니다."""
+        # 발판 그리기 (보이는 발판을 모아 한 번에 blit)
+        camera_y = self.render_camera_y
+        alpha = self.render_alpha
+        sprites = []
+        for platform in self.platforms:
+            if platform.is_vanish and not platform.is_visible:
+                continue
+            screen_y = platform.y - camera_y
+            if screen_y + platform.height > 0 and screen_y < SCREEN_HEIGHT:
+                x, width = platform.interpolate(alpha)
+                sprite = platform.sprite(width)
+                if sprite is not None:
+                    sprites.append((sprite, (int(x), int(screen_y))))
+        if hasattr(self.screen, 'fblits'):
+            self.screen.fblits(sprites)
+        else:
+            self.screen.blits(sprites, doreturn=False)
+
+        # 아이템 그리기
+        for item in self.items:
+            item.draw(self.screen, camera_y)
+
+        # 플레이어 그리기
+        self.player.draw(self.screen)
+
+    def draw_hud(self):
+        """점수와 버프 상태를 그립니다."""
+        self.score_ui.draw(self.screen, self.player.score,
+                           self.player.max_height)
+        self.draw_buff_status()
+
+    def hud_signature(self):
+        """HUD에 표시되는 값들을 묶어 반환합니다. 값이 같으면 HUD도 같습니다."""
+        player = self.player
+        return (player.score, player.max_height, player.raw_height,
+                Platform.current_difficulty.score_multiplier,
+                tuple(self.buffs.active), player.remaining_double_jumps,
+                player.remaining_jump_boosts, player.positive_buff,
+                tuple(player.active_buffs))
+
+    def collect_sprite_rects(self):
+        """이번 프레임에 그려질 객체들의 화면 영역을 {키: Rect}로 반환합니다."""
+        camera_y = self.render_camera_y
+        rects = {'player': self.player.screen_rect()}
+        for platform in self.platforms:
+            rect = platform.screen_rect(camera_y, self.render_alpha)
+            if rect is not None:
+                rects[id(platform)] = rect
+        for item in self.items:
+            rect = item.screen_rect(camera_y)
+            if rect is not None:
+                rects[id(item)] = rect
+        return rects
+
+    def draw_dirty(self):
+        """
+        이전 프레임과 달라진 영역만 다시 그리고 그 영역만 화면에 반영합니다.
+        카메라가 DIRTY_RECT_SCROLL_THRESHOLD보다 많이 움직였으면 전체를 다시 그립니다.
+        Returns:
+            list[pygame.Rect] | None: 변경된 영역들. None이면 화면 전체가 바뀜
+        """
+        camera_y = self.render_camera_y
+        alpha = self.render_alpha
+        rects = self.collect_sprite_rects()
+        hud_key = self.hud_signature()
+        start_row = int(camera_y // EXCEL_CELL_HEIGHT)
+        last = self.last_frame
+        self.last_frame = {'camera_y': camera_y, 'start_row': start_row,
+                           'rects': rects, 'hud': hud_key}
+
+        if last is None or abs(camera_y - last['camera_y']) > DIRTY_RECT_SCROLL_THRESHOLD:
+            self.draw_excel_background()
+            self.draw_world()
+            self.draw_hud()
+            return None
+
+        # 위치/크기가 바뀌었거나 사라진 객체의 이전 영역과 새 영역
+        dirty = []
+        last_rects = last['rects']
+        for key, rect in rects.items():
+            old_rect = last_rects.get(key)
+            if old_rect != rect:
+                if old_rect is not None:
+                    dirty.append(old_rect)
+                dirty.append(rect)
+        for key, old_rect in last_rects.items():
+            if key not in rects:
+                dirty.append(old_rect)
+
+        # 행 번호가 바뀌었으면 행 번호 열 전체
+        if start_row != last['start_row']:
+            dirty.append(pygame.Rect(0, EXCEL_HEADER_HEIGHT, EXCEL_CELL_WIDTH,
+                                     SCREEN_HEIGHT - EXCEL_HEADER_HEIGHT))
+
+        # HUD 값이 바뀌었거나 다른 영역이 HUD와 겹치면 HUD 전체
+        hud_rect = pygame.Rect(0, 0, SCREEN_WIDTH, DIRTY_RECT_HUD_HEIGHT)
+        if hud_key != last['hud'] or hud_rect.collidelist(dirty) != -1:
+            dirty.append(hud_rect)
+
+        if not dirty:
+            return []
+
+        # 변경 영역마다 배경을 복구하고 겹치는 객체만 잘라서 다시 그림
+        player_rect = rects['player']
+        screen = self.screen
+        for area in dirty:
+            screen.set_clip(area)
+            self.background.restore(screen, area, camera_y)
+            for platform in self.platforms:
+                rect = rects.get(id(platform))
+                if rect is not None and rect.colliderect(area):
+                    platform.draw(screen, camera_y, alpha)
+            for item in self.items:
+                rect = rects.get(id(item))
+                if rect is not None and rect.colliderect(area):
+                    item.draw(screen, camera_y)
+            if player_rect.colliderect(area) or hud_rect.colliderect(area):
+                self.player.draw(screen)
+            if hud_rect.colliderect(area):
+                self.draw_hud()
+        screen.set_clip(None)
+        return dirty
+
+    def interpolate_render_state(self):
+        """
+        이전 틱과 현재 틱 사이 render_alpha 지점을 그릴 카메라/플레이어 위치로 정합니다.
+        발판은 그릴 때 Platform.interpolate로 같은 지점을 계산합니다.
+        """
+        alpha = self.render_alpha
+        self.render_camera_y = (self.camera_y -
+                                (self.camera_y - self.prev_camera_y) * (1 - alpha))
+        self.player.interpolate(self.render_camera_y, alpha)
 
     def draw(self):
         """게임을 화면에 그립니다."""
+        profiler = self.profiler
+        profiler.mark()
+        if self.analytic and not self.is_in_splash:
+            self.evaluate_items()
+        if not self.is_in_splash:
+            self.activate()
+            self.interpolate_render_state()
         if self.is_in_splash:
-            self.screen.fill(WHITE)  # 스플래시 화면 배경을 흰색으로
+            self.last_frame = None
+            # 선택된 난이도가 그대로면 이미 그려진 화면을 유지
+            state = ('splash', self.splash_screen.selected_difficulty)
+            if state == self.retained_state:
+                return
             self.splash_screen.draw(self.screen)
+            self.retained_state = state
+            profiler.lap('draw.splash')
+        elif self.player.is_dead:
+            self.last_frame = None
+            # 죽은 뒤에는 게임 화면이 멈추므로 최종 점수가 같으면 다시 그리지 않음
+            state = ('game_over', id(self.player), self.player.max_height)
+            if state == self.retained_state:
+                return
+            self.draw_excel_background()
+            profiler.lap('draw.background')
+            self.draw_world()
+            profiler.lap('draw.world')
+            self.draw_hud()
+            profiler.lap('draw.hud')
+            self.game_over_overlay.draw(self.screen, self.player.max_height)
+            self.retained_state = state
+            profiler.lap('draw.overlay')
+        elif self.dirty_rects:
+            self.retained_state = None
+            dirty = self.draw_dirty()
+            profiler.lap('draw.dirty')
+            if not self.headless:
+                if dirty is None:
+                    pygame.display.update()
+                elif dirty:
+                    pygame.display.update(dirty)
+                profiler.lap('display.update')
+            return
         else:
+            self.retained_state = None
+            self.last_frame = None
             # 엑셀 스타일 배경 그리기
             self.draw_excel_background()
+            profiler.lap('draw.background')
 
-            # 발판 그리기
-            for platform in self.platforms:
-                platform.draw(self.screen, self.camera_y)
-
-            # 아이템 그리기
-            for item in self.items:
-                item.draw(self.screen, self.camera_y)
-
-            # 플레이어 그리기
-            self.player.draw(self.screen)
-
-            # UI 그리기
-            self.score_ui.draw(self.screen, self.player.score,
-                               self.player.max_height)
+            # 발판, 아이템, 플레이어 그리기
+            self.draw_world()
+            profiler.lap('draw.world')
 
-            # 버프 상태 그리기
-            self.draw_buff_status()
+            # UI 및 버프 상태 그리기
+            self.draw_hud()
+            profiler.lap('draw.hud')
 
-            # 게임오버 화면
-            if self.player.is_dead:
-                # 반투명한 흰색 오버레이 (엑셀 스타일)
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                overlay.fill(WHITE)
-                overlay.set_alpha(220)
-                self.screen.blit(overlay, (0, 0))
-
-                # 게임오버 텍스트
-                game_over_text = self.big_font.render('Game Over', True, RED)
-                game_over_rect = game_over_text.get_rect(
-                    center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 150))
-                self.screen.blit(game_over_text, game_over_rect)
-
-                # 최종 점수
-                final_score_text = self.font.render(
-                    f'Final Score: {self.player.max_height}m', True, EXCEL_FONT_COLOR)
-                final_score_rect = final_score_text.get_rect(
-                    center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
-                self.screen.blit(final_score_text, final_score_rect)
-
-                # Retry 버튼 (엑셀 스타일)
-                pygame.draw.rect(self.screen, EXCEL_SELECTED_CELL_COLOR,
-                                 self.retry_button)
-                pygame.draw.rect(self.screen, EXCEL_GRID_COLOR,
-                                 self.retry_button, 1)
-                retry_text = self.font.render("RETRY", True, EXCEL_FONT_COLOR)
-                retry_rect = retry_text.get_rect(
-                    center=self.retry_button.center)
-                self.screen.blit(retry_text, retry_rect)
-
-                # Change Difficulty 버튼 (엑셀 스타일)
-                pygame.draw.rect(self.screen, EXCEL_SELECTED_CELL_COLOR,
-                                 self.change_difficulty_button)
-                pygame.draw.rect(self.screen, EXCEL_GRID_COLOR,
-                                 self.change_difficulty_button, 1)
-                change_text = self.font.render(
-                    "Change Difficulty", True, EXCEL_FONT_COLOR)
-                change_rect = change_text.get_rect(
-                    center=self.change_difficulty_button.center)
-                self.screen.blit(change_text, change_rect)
-
-        pygame.display.update()
+        # 헤드리스 모드에서는 오프스크린 화면에만 그림
+        if not self.headless:
+            pygame.display.update()
+            profiler.lap('display.update')
 
     def generate_platforms(self):
-        """필요한 경우 새로운 플랫폼을 생성합니다."""
+        """필요한 경우 새로운 플랫폼을 청크 단위로 생성하고 지나간 청크를 정리합니다."""
         try:
-            # 가장 높은 플랫폼 찾기
-            highest_platform = min(self.platforms, key=lambda p: p.y)
-
-            # 플레이어보다 화면 높이의 2배 위까지 미리 플랫폼 생성
-            while highest_platform.y > self.player.pos_y - SCREEN_HEIGHT * 2:
-                new_platform = Platform.create_random(
-                    highest_platform.x,  # 이전 플랫폼의 실제 x 좌표 전달
-                    highest_platform.y,
-                    highest_platform.width
-                )
-                self.platforms.append(new_platform)
-                highest_platform = new_platform
-
-                # 플랫폼 수 제한
-                if len(self.platforms) > 200:  # 최대 200개로 제한
-                    print("Platform limit reached, removing oldest platforms")
-                    self.platforms = self.platforms[-200:]  # 가장 최근 200개만 유지
-                    break
+            # 플레이어보다 화면 높이의 2배 위까지 미리 청크 생성
+            while self.platforms.highest.y > self.player.pos_y - SCREEN_HEIGHT * 2:
+                chunk = next(self.world_chunks)
+                for platform in chunk:
+                    # 미리 만들어 둔 발판도 월드에 들어온 틱부터 움직이고 사라짐
+                    platform.start(self.sim_clock.tick)
+                if self.platform_store is not None:
+                    chunk = [self.store_platform(p) for p in chunk]
+                self.platforms.extend(chunk)
+                if self.item_placement == 'chunk':
+                    self.place_chunk_items(chunk)
+
+            retention_line = self.retention_line()
+            for platform in self.platforms.drop_below(retention_line):
+                self.release_platform(platform)
+            if self.item_placement == 'chunk':
+                for item in self.items.drop_below(retention_line):
+                    self.item_pool.release(item)
 
         except Exception as e:
             print(f"Platform Generation Error: {str(e)}")
             print(f"Error occurred at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"Current platform count: {len(self.platforms)}")
 
+    def start_world_stream(self):
+        """현재 가장 높은 발판 위로 이어지는 청크 스트림을 새로 시작합니다."""
+        if self.world_chunks is not None:
+            self.world_chunks.close()
+        highest = self.platforms.highest
+        self.world_chunks = chunk_stream(
+            platform_stream(highest.x, highest.y, highest.initial_width), self.platforms)
+
+    def retention_line(self):
+        """
+        발판을 보관할 가장 아래 y 좌표를 반환합니다. 이보다 완전히 아래에 있는 청크는 버립니다.
+        카메라는 플레이어를 따라 아래로도 내려가므로 화면 아래 발판도 다시 밟을 수 있습니다.
+        camera_y는 0을 넘지 않아 죽는 선(SCREEN_HEIGHT + PLAYER_HEIGHT)은 시작 지점 근처에
+        고정되므로, 그 위로는 화면 아래 WORLD_RETAINED_CHUNKS개 청크만 보관합니다.
+        """
+        death_line = SCREEN_HEIGHT + PLAYER_HEIGHT
+        history = (self.camera_y + SCREEN_HEIGHT +
+                   WORLD_RETAINED_CHUNKS * self.platforms.chunk_height)
+        return min(death_line, history)
+
+    def is_item_spacing_valid(self, platform):
+        """
+        발판이 다른 아이템들과 충분히 떨어져 있는지 확인합니다.
+        발판 위로 10m(1000픽셀), 아래로 5m(500픽셀) 안에 아이템이 없어야 합니다.
+        """
+        return not self.items.has_between(platform.y - 1000, platform.y + 500)
+
+    def current_span(self, platform):
+        """
+        현재 틱에서 발판의 (x, 너비)를 반환합니다.
+        분석/LOD 모드에서 구간 밖의 발판은 속성이 멈춰 있으므로 기준 상태에서 계산합니다.
+        """
+        tick = self.sim_clock.tick
+        if self.analytic or (self.lod and platform.lod_tick != tick):
+            x, _, width, _, _, _ = platform.state_at(tick)
+            return x, platform.width_override or width
+        return platform.x, platform.width
+
+    def place_item(self, platform):
+        """플랫폼 위에 랜덤한 종류의 아이템을 생성합니다."""
+        x, width = self.current_span(platform)
+        x += width / 2 + self.rng.randint(-int(width) // 3, int(width) // 3)
+        y = platform.y - ITEM_SIZE/2
+
+        # 랜덤하게 아이템 타입 선택
+        item_type = self.rng.choice(list(ITEM_TYPES.keys()))
+        self.items.append(self.item_pool.acquire(
+            x, y, item_type, self.sim_clock.tick))
+
+        # 아이템 수 제한 (최대 50개, 가장 최근 50개만 유지)
+        if len(self.items) > 50:
+            print("Item limit reached, removing oldest items")
+            for item in self.items.keep_newest(50):
+                self.item_pool.release(item)
+
+    def place_chunk_items(self, platforms):
+        """
+        청크 배치 모드: 새 청크의 발판들을 아래에서 위로 훑으며 간격 규칙을 만족하는
+        발판마다 아이템을 배치합니다. 프레임마다 생성을 시도하는 방식은 생성 확률이 높아
+        화면이 올라가며 빈자리가 생기는 즉시 가장 아래 자리부터 채워지므로,
+        같은 간격 분포를 청크를 생성할 때 한 번에 만듭니다.
+        """
+        for platform in platforms:
+            if self.is_item_spacing_valid(platform):
+                self.place_item(platform)
+
+    def store_platform(self, platform):
+        """발판 상태를 PlatformStore로 옮겨 뷰를 반환하고, 원래 객체는 풀에 돌려줍니다."""
+        view = self.platform_store.add(platform)
+        self.platform_pool.release(platform)
+        return view
+
+    def release_platform(self, platform):
+        """더 이상 사용하지 않는 발판을 정리하고 풀(또는 저장소의 빈 행)로 돌려줍니다."""
+        platform.cancel_timers()
+        if self.platform_store is not None:
+            self.platform_store.release(platform)
+        else:
+            self.platform_pool.release(platform)
+
+    def pool_stats(self):
+        """
+        객체 풀 사용 통계를 반환합니다. 플레이가 안정되면 created가 더 늘지 않아야 합니다.
+        Returns:
+            dict: 'platforms'/'items' -> ObjectPool.stats()
+        """
+        return {
+            'platforms': self.platform_pool.stats(),
+            'items': self.item_pool.stats(),
+        }
+
     def run(self):
-        """게임 메인 루프를 실행합니다."""
+        """
+        게임 메인 루프를 한 번(화면 한 장) 실행합니다.
+        지난 호출 이후 실제로 흐른 시간만큼 고정 길이 틱을 진행하고(느리면 여러 틱,
+        빠르면 0틱), 남은 시간의 비율만큼 이전 틱과 현재 틱 사이를 보간해 그립니다.
+        """
         try:
+            frame_start = self.profiler.mark()
             running = self.handle_events()
-            self.update()
+            self.profiler.lap('events')
+
+            now = time.perf_counter()
+            if self.last_run_time is not None:
+                self.sim_accumulator += now - self.last_run_time
+            self.last_run_time = now
+            step = 1 / self.sim_rate
+            steps = 0
+            while self.sim_accumulator >= step:
+                if steps == MAX_SIM_STEPS_PER_FRAME:
+                    # 따라잡을 수 없을 만큼 밀렸으면 남은 시간을 버림 (게임이 느려짐)
+                    self.sim_accumulator %= step
+                    break
+                self.update()
+                self.sim_accumulator -= step
+                steps += 1
+            self.render_alpha = self.sim_accumulator / step
+
             self.draw()
-            self.clock.tick(FPS)
+            self.profiler.since('frame', frame_start)
+            self.clock.tick(RENDER_FPS)
             return running
         except Exception as e:
             print(f"Game Loop Error: {str(e)}")
@@ -1,57 +1,105 @@
 import pygame
 from ..constants import *
+from .motion import float_wave, wrap_counter
+
+
+# ITEM_TYPES에 없는 아이템의 효과 정보
+_DEFAULT_EFFECT_INFO = {
+    'color': (255, 255, 255),
+    'duration': 10,
+    'effect': None,
+    'value': 1.0
+}
 
 
 class Item:
-    def __init__(self, x, y, item_type):
+    __slots__ = ('pos_x', 'pos_y', 'item_type', 'is_collected', 'animation_frame',
+                 'float_offset', 'float_direction', 'spawn_tick', 'lod_tick',
+                 'effect_info', 'rect')
+    animation_speed = 0.1
+    float_speed = 0.05
+
+    def __init__(self, x, y, item_type, tick=0):
         """
         아이템을 초기화합니다.
         Args:
             x (float): 아이템의 x 좌표
             y (float): 아이템의 y 좌표
             item_type (str): 아이템의 종류 ('jump_boost', 'speed_reduce')
+            tick (int): 생성된 시뮬레이션 틱 (움직임을 시각으로부터 계산할 때의 기준)
         """
+        self.rect = pygame.Rect(0, 0, ITEM_SIZE, ITEM_SIZE)
+        self.reinit(x, y, item_type, tick)
+
+    def reinit(self, x, y, item_type, tick=0):
+        """아이템을 새로 만든 것과 같은 상태로 다시 초기화합니다. (풀에서 재사용할 때)"""
         self.pos_x = x
         self.pos_y = y
         self.item_type = item_type
         self.is_collected = False
         self.animation_frame = 0
-        self.animation_speed = 0.1
         self.float_offset = 0
-        self.float_speed = 0.05
         self.float_direction = 1
+        self.spawn_tick = tick
+        self.lod_tick = None  # LOD 모드에서 마지막으로 매 틱 업데이트된 틱
 
         # 아이템 효과 정보 가져오기
-        self.effect_info = ITEM_TYPES.get(item_type, {
-            'color': (255, 255, 255),
-            'duration': 10,
-            'effect': None,
-            'value': 1.0
-        })
-
-    @property
-    def rect(self):
-        """아이템의 충돌 박스를 반환합니다."""
-        return pygame.Rect(
+        self.effect_info = ITEM_TYPES.get(item_type, _DEFAULT_EFFECT_INFO)
+
+        # 충돌 박스 (아이템은 생성 위치에서 움직이지 않으므로 초기화할 때만 갱신)
+        self.rect.update(
             self.pos_x - ITEM_SIZE/2,
             self.pos_y - ITEM_SIZE/2,
             ITEM_SIZE,
             ITEM_SIZE
         )
 
-    def update(self):
-        """아이템의 상태를 업데이트합니다."""
+    def update(self, dt=1.0):
+        """아이템의 상태를 한 틱(dt 프레임) 업데이트합니다."""
         if not self.is_collected:
             # 부드러운 상하 움직임
-            self.float_offset += self.float_speed * self.float_direction
+            self.float_offset += self.float_speed * dt * self.float_direction
             if abs(self.float_offset) > 5:
                 self.float_direction *= -1
 
             # 애니메이션 프레임 업데이트
-            self.animation_frame += self.animation_speed
+            self.animation_frame += self.animation_speed * dt
             if self.animation_frame >= 360:
                 self.animation_frame = 0
 
+    def state_at(self, tick, dt=1.0):
+        """
+        생성 시점으로부터 tick 시점의 움직임 상태를 O(1)로 계산합니다.
+        Args:
+            tick (int): 계산할 틱
+            dt (float): 틱의 길이 (FPS 기준 프레임 수)
+        Returns:
+            tuple: (float_offset, float_direction, animation_frame)
+        """
+        steps = tick - self.spawn_tick
+        offset, direction = float_wave(0, 1, self.float_speed * dt, 5, steps)
+        frame = wrap_counter(0, self.animation_speed * dt, 360, steps)
+        return offset, direction, frame
+
+    def evaluate(self, tick, dt=1.0):
+        """tick 시점의 움직임 상태를 계산해 속성에 반영합니다."""
+        if not self.is_collected:
+            self.float_offset, self.float_direction, self.animation_frame = self.state_at(
+                tick, dt)
+
+    def screen_rect(self, camera_y):
+        """
+        화면에 그려질 영역(원을 감싸는 사각형)을 반환합니다.
+        Returns:
+            pygame.Rect | None: 수집된 아이템이면 None
+        """
+        if self.is_collected:
+            return None
+        screen_y = int(self.pos_y - camera_y + self.float_offset)
+        radius = int(ITEM_SIZE/2) + 1
+        return pygame.Rect(int(self.pos_x) - radius, screen_y - radius,
+                           radius * 2 + 1, radius * 2 + 1)
+
     def draw(self, screen, camera_y):
         """아이템을 화면에 그립니다."""
         if not self.is_collected:
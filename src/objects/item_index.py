@@ -0,0 +1,76 @@
+from bisect import bisect_left, bisect_right
+
+
+class ItemIndex:
+    """
+    아이템을 y 좌표 순서(아래에서 위)로 보관하는 인덱스입니다.
+    아이템은 생성 위치에서 움직이지 않으므로(pos_y 고정) 정렬 키가 바뀌지 않고,
+    간격 규칙 검사와 오래된 아이템 정리를 이진 탐색으로 처리합니다.
+    생성 순서도 함께 보관해 개수 제한 시 가장 오래된 아이템부터 버립니다.
+    """
+
+    def __init__(self, items=()):
+        self._keys = []  # 정렬 키 (-pos_y, 오름차순)
+        self._items = []
+        self._order = []  # 생성 순서
+        for item in items:
+            self.append(item)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def append(self, item):
+        """아이템을 y 순서에 맞게 추가합니다."""
+        key = -item.pos_y
+        index = bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self._items.insert(index, item)
+        self._order.append(item)
+
+    def near(self, y_min, y_max):
+        """y_min <= pos_y <= y_max 범위의 아이템들을 아래에서 위 순서로 반환합니다."""
+        start = bisect_left(self._keys, -y_max)
+        end = bisect_right(self._keys, -y_min)
+        return self._items[start:end]
+
+    def has_between(self, y_min, y_max):
+        """y_min < pos_y < y_max 범위(양 끝 제외)에 아이템이 있는지 반환합니다."""
+        index = bisect_right(self._keys, -y_max)
+        return index < len(self._keys) and self._keys[index] < -y_min
+
+    def drop_above(self, y):
+        """pos_y <= y인(y보다 위에 있는) 아이템들을 제거하고 반환합니다."""
+        start = bisect_left(self._keys, -y)
+        return self._drop(start, len(self._keys))
+
+    def drop_below(self, y):
+        """pos_y > y인(y보다 아래에 있는) 아이템들을 제거하고 반환합니다."""
+        end = bisect_left(self._keys, -y)
+        return self._drop(0, end)
+
+    def keep_newest(self, count):
+        """가장 최근에 생성된 count개만 남기고 나머지를 제거해 반환합니다."""
+        excess = len(self._order) - count
+        if excess <= 0:
+            return []
+        removed = self._order[:excess]
+        dropped = {id(item) for item in removed}
+        self._order = self._order[excess:]
+        kept = [(key, item) for key, item in zip(self._keys, self._items)
+                if id(item) not in dropped]
+        self._keys = [key for key, _ in kept]
+        self._items = [item for _, item in kept]
+        return removed
+
+    def _drop(self, start, end):
+        if start >= end:
+            return []
+        removed = self._items[start:end]
+        dropped = {id(item) for item in removed}
+        del self._keys[start:end]
+        del self._items[start:end]
+        self._order = [item for item in self._order if id(item) not in dropped]
+        return removed
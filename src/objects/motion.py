@@ -0,0 +1,118 @@
+import math
+from functools import lru_cache
+
+
+def bounce(pos, direction, speed, span, steps):
+    """
+    0과 span 사이를 speed로 왕복하는 값의 steps 스텝 뒤 상태를 계산합니다.
+    매 스텝 pos += speed * direction 후 pos <= 0이면 0에서, pos >= span이면 span에서
+    방향을 바꾸는 규칙(Platform.update의 이동/크기 변화)과 같은 결과를 O(1)로 구합니다.
+    Args:
+        pos (float): 현재 값
+        direction (int): 1 또는 -1
+        speed (float): 스텝당 변화량
+        span (float): 왕복 구간의 길이
+        steps (int): 진행할 스텝 수
+    Returns:
+        tuple: (값, 방향)
+    """
+    if steps <= 0:
+        return pos, direction
+
+    # 첫 스텝은 그대로 진행해 값을 구간 안으로 정규화
+    pos += speed * direction
+    if pos <= 0:
+        pos, direction = 0, 1
+    elif pos >= span:
+        pos, direction = span, -1
+    steps -= 1
+    if steps == 0 or speed <= 0:
+        return pos, direction
+
+    # 다음 벽에 닿을 때까지 남은 스텝
+    if direction == 1:
+        to_wall = math.ceil((span - pos) / speed)
+    else:
+        to_wall = math.ceil(pos / speed)
+    if steps < to_wall:
+        return pos + steps * speed * direction, direction
+
+    # 벽에 닿은 뒤로는 주기 2L의 삼각파 (위상 0: 0에서 출발, 위상 L: span에서 출발)
+    half = max(1, math.ceil(span / speed))
+    phase = (steps - to_wall + (half if direction == 1 else 0)) % (2 * half)
+    if phase < half:
+        return phase * speed, 1
+    return span - (phase - half) * speed, -1
+
+
+@lru_cache(maxsize=None)
+def _wave_amplitude(speed, limit):
+    """|n * speed| > limit이 되는 첫 정수 n (삼각파의 진폭 칸 수)"""
+    amplitude = int(limit / speed)
+    while amplitude * speed <= limit:
+        amplitude += 1
+    while (amplitude - 1) * speed > limit:
+        amplitude -= 1
+    return amplitude
+
+
+def float_wave(offset, direction, speed, limit, steps):
+    """
+    매 스텝 offset += speed * direction 후 |offset| > limit이면 방향을 바꾸는
+    아이템 상하 움직임의 steps 스텝 뒤 상태를 계산합니다.
+    값은 speed 단위의 정수 칸으로 다뤄 주기(4 * 진폭)를 정확히 맞춥니다.
+    Returns:
+        tuple: (offset, direction)
+    """
+    if steps <= 0 or speed <= 0:
+        return offset, direction
+
+    # 삼각파 위상: [0, A] 상승, [A, 3A] 하강, [3A, 4A) 상승
+    amplitude = _wave_amplitude(speed, limit)
+    n = round(offset / speed)
+    period = 4 * amplitude
+    if direction == 1:
+        phase = n if n >= 0 else n + period
+    else:
+        phase = 2 * amplitude - n
+    phase = (phase + steps) % period
+    if phase < amplitude:
+        return phase * speed, 1
+    if phase < 3 * amplitude:
+        return (2 * amplitude - phase) * speed, -1
+    return (phase - period) * speed, 1
+
+
+def wrap_counter(value, speed, limit, steps):
+    """
+    매 스텝 value += speed 후 value >= limit이면 0으로 되돌리는 카운터의 steps 스텝 뒤 값입니다.
+    """
+    if steps <= 0 or speed <= 0:
+        return value
+    period = math.ceil(limit / speed)  # 0에서 출발해 되돌아가기까지의 스텝
+    n = round(value / speed)
+    return ((n + steps) % period) * speed
+
+
+def blink(visible, since, visible_ticks, hidden_ticks, tick):
+    """
+    보이는 상태 visible_ticks, 사라진 상태 hidden_ticks를 반복하는 발판의
+    tick 시점 상태를 계산합니다.
+    Args:
+        visible (bool): since 틱에 시작된 상태
+        since (int): 현재 상태가 시작된 틱
+        visible_ticks (int): 보이는 상태가 유지되는 틱 수
+        hidden_ticks (int): 사라진 상태가 유지되는 틱 수
+        tick (int): 계산할 틱
+    Returns:
+        tuple: (보이는지 여부, 그 상태가 시작된 틱)
+    """
+    first = visible_ticks if visible else hidden_ticks
+    elapsed = tick - since
+    if elapsed < first:
+        return visible, since
+    second = hidden_ticks if visible else visible_ticks
+    phase = (elapsed - first) % (first + second)
+    if phase < second:
+        return not visible, tick - phase
+    return visible, tick - (phase - second)
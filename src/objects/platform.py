@@ -1,13 +1,41 @@
 import pygame
 import random
-import time
 from ..constants import *
 from ..config.difficulty_settings import DIFFICULTY_SETTINGS
+from ..sim.clock import SimClock
+from .motion import bounce, blink
+from .pool import ObjectPool
+from ..ui.platform_sprites import platform_sprites
+
+# 발판 효과 비트 (Platform.effects에 묶어서 저장)
+EFFECT_MOVING = 1
+EFFECT_TRANSFORMING = 2
+EFFECT_VANISH = 4
 
 
 class Platform:
+    __slots__ = (
+        'x', 'initial_x', 'y', 'initial_width', 'base_width', 'min_width', 'effects',
+        'is_moving', 'direction', 'speed',
+        'is_transforming', 'transform_speed', 'transform_direction', 'center',
+        'is_vanish', 'is_visible', 'last_vanish_time', 'vanish_start_time', 'vanish_tick',
+        '_vanish_timer', '_vanish_pending', '_anchor', 'lod_tick',
+        'prev_x', 'prev_width',
+    )
     # 현재 난이도 설정 (기본값: Normal)
     current_difficulty = DIFFICULTY_SETTINGS["Normal"]
+    # 발판 생성에 사용하는 난수 생성기 (게임이 판마다 시드를 정해 교체함)
+    rng = random.Random()
+    # 사라짐/나타남 전환을 예약하는 시뮬레이션 시계 (게임이 판마다 교체함)
+    clock = SimClock()
+    # 새 발판을 꺼내는 객체 풀 (게임마다 교체함, 모듈 끝에서 기본 풀 생성)
+    pool = None
+    # True면 사라짐/나타남을 타이머 없이 evaluate()에서 시각으로부터 계산 (분석 모드)
+    analytic = False
+    # 모든 발판에 적용되는 너비 (platform_width 버프, None이면 각 발판의 base_width)
+    width_override = None
+    height = PLATFORM_HEIGHT
+    move_range = MOVING_PLATFORM_RANGE
 
     @classmethod
     def set_difficulty(cls, difficulty_name):
@@ -25,53 +53,180 @@ class Platform:
             is_transforming (bool): 크기가 변하는 플랫폼인지 여부
             is_vanish (bool): 사라졌다 나타나는 플랫폼인지 여부
         """
+        self.reinit(x, y, width, is_moving, is_transforming, is_vanish)
+
+    def reinit(self, x, y, width=None, is_moving=False, is_transforming=False, is_vanish=False):
+        """
+        발판을 새로 만든 것과 같은 상태로 다시 초기화합니다. (풀에서 재사용할 때)
+        이전에 쓰던 값이 남지 않도록 종류와 관계없이 모든 속성을 설정합니다.
+        """
         self.x = x
         self.initial_x = x  # 초기 x 위치 저장
         self.y = y
         self.initial_width = width if width is not None else PLATFORM_MAX_WIDTH  # 랜덤 제거
-        self.width = self.initial_width
-        self.height = PLATFORM_HEIGHT
+        self.base_width = self.initial_width  # 움직임 규칙이 사용하는 너비 (버프와 무관)
         self.min_width = max(PLATFORM_MIN_WIDTH, int(
             self.initial_width * self.current_difficulty.transform_min_width_ratio))
 
-        # 아이템 효과 적용 여부
-        self.effects = {
-            'is_moving': is_moving,
-            'is_transforming': is_transforming,
-            'is_vanish': is_vanish
-        }
+        # 아이템 효과 적용 여부 (EFFECT_* 비트)
+        self.effects = ((EFFECT_MOVING if is_moving else 0) |
+                        (EFFECT_TRANSFORMING if is_transforming else 0) |
+                        (EFFECT_VANISH if is_vanish else 0))
+        self._vanish_timer = None  # 예약된 사라짐/나타남 전환 타이머
+        self._vanish_pending = False  # 효과가 꺼진 동안 전환 시각이 지났는지 여부
+        self.lod_tick = None  # LOD 모드에서 마지막으로 매 틱 업데이트된 틱
 
         # 움직임 관련 속성
         self.is_moving = is_moving
+        self.direction = 1  # 1: 오른쪽, -1: 왼쪽
+        self.speed = 0
         if is_moving:
-            self.direction = 1  # 1: 오른쪽, -1: 왼쪽
             height_factor = abs(
                 int((SCREEN_HEIGHT - self.y) / 400))  # 400픽셀당 1씩 증가
             self.speed = min(self.current_difficulty.moving_platform_speed +
                              height_factor, self.current_difficulty.moving_platform_max_speed)
-            self.move_range = MOVING_PLATFORM_RANGE
 
         # 변형 관련 속성
         self.is_transforming = is_transforming
+        self.transform_speed = 0
+        self.transform_direction = -1  # -1: 줄어듦, 1: 늘어남
+        self.center = self.x + self.base_width / 2  # 중심점 저장
+        self.prev_x = self.x  # 이전 틱의 위치와 너비 (그릴 때 보간용)
+        self.prev_width = self.base_width
         if is_transforming:
-            self.transform_speed = random.uniform(
+            self.transform_speed = self.rng.uniform(
                 self.current_difficulty.transform_min_speed,
                 self.current_difficulty.transform_max_speed)
-            self.transform_direction = -1  # -1: 줄어듦, 1: 늘어남
-            self.center = self.x + self.width / 2  # 중심점 저장
 
         # 사라지는 속성
         self.is_vanish = is_vanish
-        if is_vanish:
+        self.is_visible = True
+        self.last_vanish_time = 0
+        self.vanish_start_time = 0
+        self.vanish_tick = self.clock.tick  # 현재 보임/사라짐 상태가 시작된 틱
+        self.start(self.clock.tick)
+
+    def start(self, tick):
+        """
+        tick부터 발판이 움직이고 사라지기 시작하도록 기준 상태와 사라짐 타이머를 다시 맞춥니다.
+        청크 경계를 알기 위해 다음 청크의 첫 발판은 미리 만들어지므로,
+        월드에 넣는 시점에 다시 호출해야 모든 업데이트 모드가 같은 틱에서 출발합니다.
+        """
+        self.cancel_timers()
+        self.is_visible = True
+        self.vanish_tick = tick
+        if self.is_vanish:
+            self.last_vanish_time = self.clock.time
+            if not self.analytic:
+                self.schedule_vanish(
+                    tick + self.clock.ticks(self.current_difficulty.vanish_interval))
+
+        # 시각으로부터 상태를 계산할 때의 기준 상태
+        self.anchor(tick)
+
+    def schedule_vanish(self, due):
+        """due 틱에 사라짐/나타남 전환이 일어나도록 예약합니다."""
+        self._vanish_timer = self.clock.timers.schedule(
+            due, self._vanish_transition)
+
+    def _vanish_transition(self, tick):
+        """
+        예약된 시각에 보이는 상태와 사라진 상태를 전환하고 다음 전환을 예약합니다.
+        보이는 상태는 vanish_interval, 사라진 상태는 vanish_duration만큼 유지됩니다.
+        """
+        self._vanish_timer = None
+        if not self.is_vanish:
+            # 효과가 꺼져 있으면 다시 켜질 때 전환
+            self._vanish_pending = True
+            return
+        clock = self.clock
+        self.vanish_tick = tick
+        if self.is_visible:
+            self.is_visible = False
+            self.vanish_start_time = clock.time
+            self.schedule_vanish(
+                tick + clock.ticks(self.current_difficulty.vanish_duration))
+        else:
             self.is_visible = True
-            self.last_vanish_time = time.time() * 1000
-            self.vanish_start_time = 0
+            self.last_vanish_time = clock.time
+            self.schedule_vanish(
+                tick + clock.ticks(self.current_difficulty.vanish_interval))
+
+    def anchor(self, tick):
+        """
+        현재 속성을 tick 시점의 기준 상태로 저장합니다.
+        이후 state_at/evaluate는 이 기준 상태와 경과 틱만으로 상태를 계산하므로,
+        너비처럼 움직임 규칙에 영향을 주는 속성을 직접 바꾼 뒤에는 다시 호출해야 합니다.
+        """
+        self._anchor = (tick, self.x, self.direction, self.base_width,
+                        self.transform_direction, self.is_visible, self.vanish_tick)
+
+    def state_at(self, tick):
+        """
+        기준 상태로부터 tick 시점의 상태를 O(1)로 계산합니다. 속성은 바꾸지 않습니다.
+        기준 틱보다 이전 시점은 기준 상태를 반환합니다.
+        Returns:
+            tuple: (x, direction, base_width, transform_direction, is_visible, vanish_tick)
+        """
+        start, x, direction, width, transform_direction, is_visible, vanish_tick = self._anchor
+        steps = tick - start
+        if steps <= 0:
+            return x, direction, width, transform_direction, is_visible, vanish_tick
+
+        dt = self.clock.dt
+        if self.is_moving:
+            x, direction = bounce(x, direction, self.speed * dt,
+                                  SCREEN_WIDTH - (self.width_override or width), steps)
+
+        if self.is_transforming:
+            offset, transform_direction = bounce(
+                width - self.min_width, transform_direction, self.transform_speed * dt,
+                self.initial_width - self.min_width, steps)
+            width = self.min_width + offset
+            shown = self.width_override or width
+            x = min(max(self.center - shown / 2, 0), SCREEN_WIDTH - shown)
+
+        if self.is_vanish:
+            clock = self.clock
+            is_visible, vanish_tick = blink(
+                is_visible, vanish_tick,
+                max(1, clock.ticks(self.current_difficulty.vanish_interval)),
+                max(1, clock.ticks(self.current_difficulty.vanish_duration)),
+                tick)
+        return x, direction, width, transform_direction, is_visible, vanish_tick
+
+    def evaluate(self, tick):
+        """tick 시점의 상태를 계산해 속성에 반영합니다."""
+        if not (self.is_moving or self.is_transforming or self.is_vanish):
+            return
+        x, direction, width, transform_direction, is_visible, vanish_tick = self.state_at(
+            tick)
+        self.prev_x = self.x
+        self.prev_width = self.base_width
+        self.x = x
+        self.base_width = width
+        if self.is_moving:
+            self.direction = direction
+        if self.is_transforming:
+            self.transform_direction = transform_direction
+        if self.is_vanish:
+            self.is_visible = is_visible
+            self.vanish_tick = vanish_tick
+
+    def cancel_timers(self):
+        """예약된 전환을 취소합니다. 더 이상 사용하지 않는 발판에 호출합니다."""
+        if self._vanish_timer is not None:
+            self._vanish_timer.cancel()
+            self._vanish_timer = None
 
     def apply_effects(self):
         """아이템 효과를 적용합니다."""
-        self.is_moving = self.effects['is_moving']
-        self.is_transforming = self.effects['is_transforming']
-        self.is_vanish = self.effects['is_vanish']
+        self.is_moving = bool(self.effects & EFFECT_MOVING)
+        self.is_transforming = bool(self.effects & EFFECT_TRANSFORMING)
+        self.is_vanish = bool(self.effects & EFFECT_VANISH)
+        if self.is_vanish and self._vanish_pending:
+            self._vanish_pending = False
+            self.schedule_vanish(self.clock.tick + 1)
 
     def remove_effects(self):
         """아이템 효과를 제거합니다."""
@@ -80,14 +235,20 @@ class Platform:
         self.is_vanish = False
 
     def update(self):
-        """플랫폼의 상태를 업데이트합니다."""
-        current_time = time.time() * 1000
+        """
+        플랫폼의 상태를 업데이트합니다.
+        사라짐/나타남 전환은 clock의 타이머가 처리하므로 여기서는 이동과 크기 변화만 다룹니다.
+        한 틱에 clock.dt 프레임만큼 진행합니다.
+        """
+        if self.is_moving or self.is_transforming:
+            self.prev_x = self.x
+            self.prev_width = self.base_width
 
         if self.is_moving:
             # 이동
-            self.x += self.speed * self.direction
+            self.x += self.speed * self.clock.dt * self.direction
 
-            # 화면 경계에서 방향 전환
+            # 화면 경계에서 방향 전환 (보이는 너비 기준)
             if self.x <= 0:
                 self.x = 0
                 self.direction = 1
@@ -97,36 +258,48 @@ class Platform:
 
         if self.is_transforming:
             # 크기 변화
-            self.width += self.transform_speed * self.transform_direction
+            self.base_width += self.transform_speed * self.clock.dt * self.transform_direction
 
             # 최소/최대 크기에서 방향 전환
-            if self.width <= self.min_width:
-                self.width = self.min_width
+            if self.base_width <= self.min_width:
+                self.base_width = self.min_width
                 self.transform_direction = 1
-            elif self.width >= self.initial_width:
-                self.width = self.initial_width
+            elif self.base_width >= self.initial_width:
+                self.base_width = self.initial_width
                 self.transform_direction = -1
 
-            # 중심점 기준으로 x 위치 조정
-            self.x = self.center - self.width / 2
+            # 중심점 기준으로 x 위치 조정 (보이는 너비 기준)
+            width = self.width
+            self.x = self.center - width / 2
 
             # 화면 경계 처리
             if self.x < 0:
                 self.x = 0
-            elif self.x + self.width > SCREEN_WIDTH:
-                self.x = SCREEN_WIDTH - self.width
+            elif self.x + width > SCREEN_WIDTH:
+                self.x = SCREEN_WIDTH - width
 
-        if self.is_vanish:
-            if self.is_visible:
-                # 보이는 상태에서 VANISH_INTERVAL 시간이 지나면 사라짐
-                if current_time - self.last_vanish_time >= self.current_difficulty.vanish_interval:
-                    self.is_visible = False
-                    self.vanish_start_time = current_time
-            else:
-                # 사라진 상태에서 VANISH_DURATION 시간이 지나면 다시 나타남
-                if current_time - self.vanish_start_time >= self.current_difficulty.vanish_duration:
-                    self.is_visible = True
-                    self.last_vanish_time = current_time
+    @property
+    def width(self):
+        """
+        충돌과 그리기에 사용하는 발판의 너비를 반환합니다.
+        너비 버프(width_override)가 있으면 그 값을, 없으면 base_width를 사용하므로
+        버프를 적용하거나 해제할 때 발판들을 수정할 필요가 없습니다.
+        """
+        return self.width_override or self.base_width
+
+    def interpolate(self, alpha):
+        """
+        이전 틱과 현재 틱 사이 alpha(0~1) 지점의 위치와 너비를 반환합니다. (그리기용)
+        Returns:
+            tuple: (x, 너비). alpha가 1이거나 움직이지 않는 발판이면 현재 값
+        """
+        if alpha >= 1 or not (self.is_moving or self.is_transforming):
+            return self.x, self.width
+        back = 1 - alpha
+        x = self.x - (self.x - self.prev_x) * back
+        width = self.width_override or (
+            self.base_width - (self.base_width - self.prev_width) * back)
+        return x, width
 
     @property
     def right(self):
@@ -148,7 +321,29 @@ class Platform:
         """발판의 하단 y 좌표를 반환합니다."""
         return self.y + self.height
 
-    def draw(self, screen, camera_y):
+    def screen_rect(self, camera_y, alpha=1.0):
+        """
+        화면에 그려질 영역을 반환합니다.
+        Args:
+            camera_y (float): 카메라 위치
+            alpha (float): 이전 틱과 현재 틱 사이의 보간 위치 (1이면 현재 틱)
+        Returns:
+            pygame.Rect | None: 보이지 않는 발판이면 None
+        """
+        if self.is_vanish and not self.is_visible:
+            return None
+        screen_y = self.y - camera_y
+        if screen_y + self.height > 0 and screen_y < SCREEN_HEIGHT:
+            x, width = self.interpolate(alpha)
+            return pygame.Rect(int(x), int(screen_y),
+                               int(width), int(self.height))
+        return None
+
+    def sprite(self, width=None):
+        """너비(None이면 현재 너비)에 맞는 발판 Surface를 반환합니다. 너비가 0 이하면 None."""
+        return platform_sprites.get(int(self.width if width is None else width))
+
+    def draw(self, screen, camera_y, alpha=1.0):
         """발판을 화면에 그립니다."""
         # 사라지는 플랫폼이고 현재 보이지 않는 상태면 그리지 않음
         if self.is_vanish and not self.is_visible:
@@ -156,25 +351,18 @@ class Platform:
 
         screen_y = self.y - camera_y  # 카메라 위치를 고려한 화면상의 y 위치
 
-        # 화면에 보이는 발판만 그리기
+        # 화면에 보이는 발판만 그리기 (엑셀 스타일의 선택된 셀 모양 Surface)
         if screen_y + self.height > 0 and screen_y < SCREEN_HEIGHT:
-            # 엑셀 스타일의 선택된 셀처럼 보이게 그리기
-            pygame.draw.rect(screen, EXCEL_SELECTED_CELL_COLOR, (
-                int(self.x),
-                int(screen_y),
-                int(self.width),
-                int(self.height)
-            ))
-            # 엑셀 스타일의 테두리
-            pygame.draw.rect(screen, EXCEL_GRID_COLOR, (
-                int(self.x),
-                int(screen_y),
-                int(self.width),
-                int(self.height)
-            ), 1)  # 1픽셀 두께의 테두리
-
-    def is_point_above(self, x, y):
-        """주어진 점이 발판 바로 위에 있는지 확인합니다."""
+            x, width = self.interpolate(alpha)
+            sprite = self.sprite(width)
+            if sprite is not None:
+                screen.blit(sprite, (int(x), int(screen_y)))
+
+    def is_point_above(self, x, y, dt=1.0):
+        """
+        주어진 점이 발판 바로 위에 있는지 확인합니다.
+        틱이 FPS 기준 한 프레임보다 짧으면(dt < 1) y 여유 범위도 한 틱 이동량에 맞춰 줄입니다.
+        """
         # 사라진 상태의 플랫폼은 밟을 수 없음
         if self.is_vanish and not self.is_visible:
             return False
@@ -184,7 +372,7 @@ class Platform:
         is_within_x = self.x - x_margin <= x <= self.right + x_margin
 
         # y 좌표가 발판 상단 근처에 있는지 확인 (더 넓은 범위)
-        y_margin = 10  # y축 여유 범위
+        y_margin = 10 * min(dt, 1)  # y축 여유 범위
         is_within_y = self.y - y_margin <= y <= self.y + y_margin
 
         return is_within_x and is_within_y
@@ -217,7 +405,7 @@ class Platform:
         platforms = []
 
         # 첫 번째 발판은 화면 중앙 하단에 생성 (일반 플랫폼으로 고정)
-        first_platform = cls(
+        first_platform = cls.pool.acquire(
             x=SCREEN_WIDTH//2 - PLATFORM_MAX_WIDTH//2,
             y=SCREEN_HEIGHT - 50,  # 화면 하단에 더 가깝게 배치
             width=PLATFORM_MAX_WIDTH
@@ -231,7 +419,7 @@ class Platform:
         for _ in range(count - 1):
             new_platform = cls.create_random(
                 prev_platform.x, prev_platform.y, current_width, prev_platform)
-            current_width = new_platform.width
+            current_width = new_platform.initial_width
             platforms.append(new_platform)
             prev_platform = new_platform
 
@@ -265,39 +453,36 @@ class Platform:
         max_x = min(SCREEN_WIDTH - width, prev_x + safe_jump_distance)
 
         # 범위 내에서 랜덤하게 x 위치 선택
-        x = random.randint(int(min_x), int(max_x))
+        x = cls.rng.randint(int(min_x), int(max_x))
 
         # 수직 간격 결정
         max_jump_height = abs(JUMP_POWER * JUMP_POWER / (2 * GRAVITY))
-        height_gap = random.uniform(
+        height_gap = cls.rng.uniform(
             max_jump_height * 0.6, max_jump_height * 0.8)
         y = prev_y - height_gap
 
         # 플랫폼 타입 결정
-        platform_type = random.random()
+        platform_type = cls.rng.random()
 
         # 이전 플랫폼이 사라지는 플랫폼이었다면 일반 또는 움직이는 플랫폼만 생성 가능
         if prev_platform and hasattr(prev_platform, 'is_vanish') and prev_platform.is_vanish:
             if platform_type < cls.current_difficulty.moving_platform_chance:
-                return cls(x, y, width, is_moving=True)
+                return cls.pool.acquire(x, y, width, is_moving=True)
             else:
-                return cls(x, y, width)
+                return cls.pool.acquire(x, y, width)
 
         # 움직이는 플랫폼
         if platform_type < cls.current_difficulty.moving_platform_chance:
-            return cls(x, y, width, is_moving=True)
+            return cls.pool.acquire(x, y, width, is_moving=True)
         # 변형되는 플랫폼 (20% 확률)
         elif platform_type < cls.current_difficulty.moving_platform_chance + 0.2:
-            return cls(x, y, width, is_transforming=True)
+            return cls.pool.acquire(x, y, width, is_transforming=True)
         # 사라지는 플랫폼
         elif platform_type < cls.current_difficulty.moving_platform_chance + 0.2 + cls.current_difficulty.vanish_platform_chance:
-            return cls(x, y, width, is_vanish=True)
+            return cls.pool.acquire(x, y, width, is_vanish=True)
         # 일반 플랫폼
         else:
-            return cls(x, y, width)
+            return cls.pool.acquire(x, y, width)
+
 
-    def revert_to_original(self):
-        """발판의 너비를 원래 상태로 복구하고 효과를 제거합니다."""
-        self.width = self.initial_width
-        self.is_transformed = False
-        self.remove_effects()
+Platform.pool = ObjectPool(Platform)
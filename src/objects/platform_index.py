@@ -0,0 +1,134 @@
+from bisect import bisect_left, bisect_right
+from collections import deque
+from ..constants import *
+
+
+class _Chunk:
+    """고정 높이 구간 하나에 속한 발판들 (아래에서 위 순서로 정렬)"""
+    __slots__ = ('id', 'keys', 'platforms')
+
+    def __init__(self, chunk_id):
+        self.id = chunk_id  # y // chunk_height (위로 갈수록 작아짐)
+        self.keys = []  # 정렬 키 (-y, 오름차순)
+        self.platforms = []
+
+
+class PlatformIndex:
+    """
+    발판을 y 좌표 순서로 보관하는 인덱스입니다.
+    월드를 고정 높이(chunk_height)의 청크로 나누고, 청크들을 아래에서 위 순서로 deque에 둡니다.
+    가장 높은 발판은 마지막 청크에서 O(1)로 찾고, 아래쪽 청크는 통째로 O(1)에 버립니다.
+    리스트처럼 순회/인덱싱할 수 있고, near()로 특정 높이 구간의 발판만 조회합니다.
+    """
+
+    def __init__(self, platforms=(), chunk_height=WORLD_CHUNK_HEIGHT):
+        self.chunk_height = chunk_height
+        self._chunks = deque()  # 아래(큰 id)에서 위(작은 id)로 빈틈 없이 이어진 청크들
+        self._count = 0
+        self.extend(platforms)
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk.platforms
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("platform index out of range")
+        for chunk in self._chunks:
+            if index < len(chunk.platforms):
+                return chunk.platforms[index]
+            index -= len(chunk.platforms)
+
+    @property
+    def highest(self):
+        """가장 높은(y가 가장 작은) 발판을 반환합니다."""
+        for chunk in reversed(self._chunks):
+            if chunk.platforms:
+                return chunk.platforms[-1]
+        raise IndexError("no platforms")
+
+    @property
+    def chunk_count(self):
+        """보관 중인 청크 수"""
+        return len(self._chunks)
+
+    def chunk_id(self, y):
+        """y 좌표가 속한 청크 번호를 반환합니다."""
+        return int(y // self.chunk_height)
+
+    def _chunk_for(self, chunk_id):
+        """chunk_id 청크를 반환합니다. 없으면 빈 청크로 이어 붙여 만듭니다."""
+        chunks = self._chunks
+        if not chunks:
+            chunks.append(_Chunk(chunk_id))
+            return chunks[0]
+        # 위쪽(작은 id)이나 아래쪽(큰 id)으로 빈틈 없이 확장
+        while chunk_id < chunks[-1].id:
+            chunks.append(_Chunk(chunks[-1].id - 1))
+        while chunk_id > chunks[0].id:
+            chunks.appendleft(_Chunk(chunks[0].id + 1))
+        return chunks[chunks[0].id - chunk_id]
+
+    def append(self, platform):
+        """발판을 y 순서에 맞게 추가합니다."""
+        chunk = self._chunk_for(self.chunk_id(platform.y))
+        key = -platform.y
+        # 새 발판은 대부분 가장 위에 생성되므로 끝에 바로 추가
+        if not chunk.keys or key >= chunk.keys[-1]:
+            chunk.keys.append(key)
+            chunk.platforms.append(platform)
+        else:
+            index = bisect_right(chunk.keys, key)
+            chunk.keys.insert(index, key)
+            chunk.platforms.insert(index, platform)
+        self._count += 1
+
+    def extend(self, platforms):
+        """여러 발판을 추가합니다."""
+        for platform in platforms:
+            self.append(platform)
+
+    def drop_below(self, y):
+        """
+        y보다 완전히 아래(큰 y)에 있는 청크들을 버립니다.
+        Returns:
+            list[Platform]: 제거된 발판들
+        """
+        removed = []
+        chunks = self._chunks
+        while len(chunks) > 1 and chunks[0].id * self.chunk_height > y:
+            chunk = chunks.popleft()
+            removed.extend(chunk.platforms)
+        self._count -= len(removed)
+        return removed
+
+    def near(self, y_min, y_max):
+        """
+        y_min <= y <= y_max 범위의 발판들을 반환합니다.
+        Args:
+            y_min (float): 구간의 위쪽 경계 (작은 y)
+            y_max (float): 구간의 아래쪽 경계 (큰 y)
+        Returns:
+            list[Platform]: 아래에서 위 순서로 정렬된 발판들
+        """
+        chunks = self._chunks
+        if not chunks:
+            return []
+        bottom_id = chunks[0].id
+        first = max(0, bottom_id - self.chunk_id(y_max))
+        last = min(len(chunks) - 1, bottom_id - self.chunk_id(y_min))
+        result = []
+        for index in range(first, last + 1):
+            chunk = chunks[index]
+            start = bisect_left(chunk.keys, -y_max)
+            end = bisect_right(chunk.keys, -y_min)
+            if start == 0 and end == len(chunk.keys):
+                result.extend(chunk.platforms)
+            else:
+                result.extend(chunk.platforms[start:end])
+        return result
@@ -0,0 +1,232 @@
+from ..constants import *
+from .platform import Platform
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성
+    np = None
+
+
+# 배열로 관리하는 발판 속성들 (이름, dtype)
+_COLUMNS = (
+    ('x', 'f8'),
+    ('y', 'f8'),
+    ('base_width', 'f8'),
+    ('initial_width', 'f8'),
+    ('min_width', 'f8'),
+    ('speed', 'f8'),
+    ('direction', 'f8'),
+    ('transform_speed', 'f8'),
+    ('transform_direction', 'f8'),
+    ('center', 'f8'),
+    ('prev_x', 'f8'),
+    ('prev_width', 'f8'),
+    ('last_vanish_time', 'f8'),
+    ('vanish_start_time', 'f8'),
+    ('is_moving', '?'),
+    ('is_transforming', '?'),
+    ('is_vanish', '?'),
+    ('is_visible', '?'),
+    ('alive', '?'),
+)
+
+
+class _Column:
+    """PlatformView의 속성을 PlatformStore 배열의 한 칸에 연결하는 디스크립터"""
+
+    def __init__(self, name, is_bool):
+        self.name = name
+        self.is_bool = is_bool
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        value = getattr(view._store, self.name)[view._row]
+        return bool(value) if self.is_bool else float(value)
+
+    def __set__(self, view, value):
+        getattr(view._store, self.name)[view._row] = value
+
+
+class PlatformView(Platform):
+    """
+    PlatformStore의 한 행을 Platform처럼 다루는 뷰입니다.
+    기존 그리기/충돌 코드는 Platform과 동일한 속성과 메서드로 뷰를 사용할 수 있습니다.
+    """
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store, row):
+        # Platform.__init__은 호출하지 않음 (상태는 store 배열에 있음)
+        self._store = store
+        self._row = row
+        self._vanish_timer = None
+        self._vanish_pending = False
+        self.lod_tick = None
+
+    @property
+    def initial_x(self):
+        return self.x
+
+
+for _name, _dtype in _COLUMNS:
+    if _name != 'alive':
+        setattr(PlatformView, _name, _Column(_name, _dtype == '?'))
+
+
+class PlatformStore:
+    """
+    발판 상태를 NumPy 배열(구조체 배열이 아닌 배열 구조체)로 보관하고
+    매 프레임 모든 발판을 몇 번의 벡터 연산으로 업데이트합니다.
+    """
+
+    def __init__(self, capacity=256):
+        """
+        Args:
+            capacity (int): 초기 배열 크기. 부족하면 두 배씩 늘어남
+        """
+        if np is None:
+            raise ImportError("PlatformStore를 사용하려면 numpy가 필요합니다.")
+        self.capacity = capacity
+        for name, dtype in _COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self._size = 0  # 사용된 적이 있는 행의 수
+        self._free_rows = []  # 재사용 가능한 행 번호
+        self._views = []  # 행 번호 -> 그 행의 뷰 (행을 재사용할 때 뷰도 재사용)
+
+    def __len__(self):
+        return self._size - len(self._free_rows)
+
+    def _grow(self):
+        """배열 크기를 두 배로 늘립니다."""
+        self.capacity *= 2
+        for name, dtype in _COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, platform):
+        """
+        Platform 객체의 상태를 배열로 옮기고 그 행에 연결된 뷰를 반환합니다.
+        Args:
+            platform (Platform): 복사할 발판
+        Returns:
+            PlatformView: 배열 행에 연결된 발판 뷰
+        """
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            if self._size >= self.capacity:
+                self._grow()
+            row = self._size
+            self._size += 1
+
+        self.x[row] = platform.x
+        self.y[row] = platform.y
+        self.base_width[row] = platform.base_width
+        self.initial_width[row] = platform.initial_width
+        self.min_width[row] = platform.min_width
+        self.is_moving[row] = platform.is_moving
+        self.is_transforming[row] = platform.is_transforming
+        self.is_vanish[row] = platform.is_vanish
+        self.speed[row] = getattr(platform, 'speed', 0)
+        self.direction[row] = getattr(platform, 'direction', 1)
+        self.transform_speed[row] = getattr(platform, 'transform_speed', 0)
+        self.transform_direction[row] = getattr(
+            platform, 'transform_direction', -1)
+        self.center[row] = getattr(platform, 'center', platform.center_x)
+        self.prev_x[row] = platform.prev_x
+        self.prev_width[row] = platform.prev_width
+        self.is_visible[row] = getattr(platform, 'is_visible', True)
+        self.last_vanish_time[row] = getattr(platform, 'last_vanish_time', 0)
+        self.vanish_start_time[row] = getattr(
+            platform, 'vanish_start_time', 0)
+        self.alive[row] = True
+        if row < len(self._views):
+            view = self._views[row]
+            PlatformView.__init__(view, self, row)
+        else:
+            view = PlatformView(self, row)
+            self._views.append(view)
+
+        # 시각으로부터 상태를 계산할 때의 기준 상태와 예약된 전환은 뷰가 이어받음
+        view._anchor = platform._anchor
+        view.vanish_tick = platform.vanish_tick
+        if platform._vanish_timer is not None:
+            due = platform._vanish_timer.due
+            platform.cancel_timers()
+            view.schedule_vanish(due)
+        return view
+
+    def release(self, view):
+        """뷰가 가리키는 행을 비우고 재사용 목록에 넣습니다."""
+        self.alive[view._row] = False
+        self.is_moving[view._row] = False
+        self.is_transforming[view._row] = False
+        self.is_vanish[view._row] = False
+        self._free_rows.append(view._row)
+
+    def clear(self):
+        """모든 행을 비웁니다."""
+        self.alive[:] = False
+        self.is_moving[:] = False
+        self.is_transforming[:] = False
+        self.is_vanish[:] = False
+        self._size = 0
+        self._free_rows = []
+
+    def update(self):
+        """
+        모든 발판을 Platform.update와 같은 규칙으로 한 번에 업데이트합니다.
+        사라짐/나타남 전환은 Platform.clock의 타이머가 뷰를 통해 처리합니다.
+        """
+        n = self._size
+        if n == 0:
+            return
+        x = self.x[:n]
+        width = self.base_width[:n]
+        dt = Platform.clock.dt
+
+        # 그릴 때 보간할 수 있도록 이전 틱의 위치와 너비 저장
+        self.prev_x[:n] = x
+        self.prev_width[:n] = width
+
+        # 경계 처리는 보이는 너비(너비 버프가 있으면 그 값) 기준
+        shown = width
+        if Platform.width_override is not None:
+            shown = np.full(n, float(Platform.width_override))
+
+        # 움직이는 발판: 이동 후 화면 경계에서 방향 전환
+        moving = self.is_moving[:n]
+        if moving.any():
+            direction = self.direction[:n]
+            x[moving] += self.speed[:n][moving] * dt * direction[moving]
+            hit_left = moving & (x <= 0)
+            hit_right = moving & ~hit_left & (x + shown >= SCREEN_WIDTH)
+            x[hit_left] = 0
+            direction[hit_left] = 1
+            x[hit_right] = SCREEN_WIDTH - shown[hit_right]
+            direction[hit_right] = -1
+
+        # 크기가 변하는 발판: 너비 변화 후 최소/최대에서 방향 전환, 중심 기준 정렬
+        transforming = self.is_transforming[:n]
+        if transforming.any():
+            transform_direction = self.transform_direction[:n]
+            width[transforming] += (self.transform_speed[:n][transforming] * dt *
+                                    transform_direction[transforming])
+            min_width = self.min_width[:n]
+            initial_width = self.initial_width[:n]
+            hit_min = transforming & (width <= min_width)
+            hit_max = transforming & ~hit_min & (width >= initial_width)
+            width[hit_min] = min_width[hit_min]
+            transform_direction[hit_min] = 1
+            width[hit_max] = initial_width[hit_max]
+            transform_direction[hit_max] = -1
+
+            # 중심 정렬 (너비 버프가 없으면 shown은 width 자체이므로 바뀐 너비가 반영됨)
+            x[transforming] = (self.center[:n][transforming] -
+                               shown[transforming] / 2)
+            under = transforming & (x < 0)
+            over = transforming & ~under & (x + shown > SCREEN_WIDTH)
+            x[under] = 0
+            x[over] = SCREEN_WIDTH - shown[over]
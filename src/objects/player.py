@@ -2,13 +2,29 @@ import pygame
 from ..constants import *
 from ..actions.movement import Movement
 from ..objects.platform import Platform  # Platform 클래스 임포트 추가
+from ..ui.shapes import draw_rect_border
 
 
 class Player:
+    __slots__ = (
+        'pos_x', 'pos_y', 'screen_y', 'velocity_y', 'velocity_x',
+        'is_jumping', 'can_double_jump', 'has_double_jumped',
+        'remaining_double_jumps', 'remaining_jump_boosts',
+        'score', 'max_height', 'is_dead', 'raw_height',
+        'jump_power_multiplier', 'speed_multiplier', 'is_key_reversed',
+        'is_sliding', 'slide_friction',
+        'active_buffs', 'positive_buff', '_rect',
+        'prev_x', 'prev_y', 'render_x', 'render_y',
+    )
+
     def __init__(self, x, y):
         self.pos_x = x
         self.pos_y = y  # 실제 게임 월드에서의 y 위치
         self.screen_y = y  # 화면상의 y 위치
+        self.prev_x = x  # 이전 틱의 위치 (그릴 때 보간용)
+        self.prev_y = y
+        self.render_x = x  # 그릴 위치 (화면 좌표, 이전 틱과 현재 틱 사이를 보간)
+        self.render_y = y
         self.velocity_y = 0
         self.velocity_x = 0  # x축 속도 추가
         self.is_jumping = False
@@ -28,76 +44,12 @@ class Player:
         self.is_sliding = False  # 슬라이딩 상태
         self.slide_friction = 0.98  # 슬라이딩 마찰력
 
-        # 버프 관리 시스템
-        self.active_buffs = set()  # 현재 활성화된 모든 버프
+        # 버프 표시 상태 (BuffEngine이 관리)
+        self.active_buffs = set()  # 현재 활성화된 중첩 가능한 버프들
         self.positive_buff = None  # 현재 활성화된 긍정 버프 (연두색, 노란색)
-        self.buff_start_height = None  # 버프 적용 시점의 높이
-
-    def set_buff(self, buff_type):
-        """현재 활성화된 버프 타입을 설정합니다."""
-        # 버프 적용 시점의 높이 저장
-        self.buff_start_height = self.raw_height
-
-        # 긍정 버프 (연두색, 노란색) 처리
-        if buff_type in ['double_jump', 'jump_boost']:
-            if self.positive_buff is None or self.positive_buff == buff_type:
-                self.positive_buff = buff_type
-                if buff_type == 'double_jump':
-                    self.can_double_jump = True
-                    self.has_double_jumped = False
-                    self.remaining_double_jumps = ITEM_TYPES[buff_type]['duration']
-                elif buff_type == 'jump_boost':
-                    self.remaining_jump_boosts = ITEM_TYPES[buff_type]['duration']
-            return
-
-        # 중첩 가능한 버프 (빨간색, 보라색, 하늘색, 주황색) 처리
-        if buff_type in ['key_reverse', 'ice_slide', 'transform']:
-            self.active_buffs.add(buff_type)
-            if buff_type == 'key_reverse':
-                self.is_key_reversed = True
-            elif buff_type == 'ice_slide':
-                self.is_sliding = True
-                self.velocity_x = 0
 
-    def remove_buff(self, buff_type, platforms):
-        """특정 버프를 제거합니다."""
-        if buff_type == self.positive_buff:
-            self.positive_buff = None
-            if buff_type == 'double_jump':
-                self.can_double_jump = False
-                self.has_double_jumped = False
-                self.remaining_double_jumps = 0
-            elif buff_type == 'jump_boost':
-                self.remaining_jump_boosts = 0
-                self.jump_power_multiplier = 1.0
-        elif buff_type in self.active_buffs:
-            self.active_buffs.remove(buff_type)
-            if buff_type == 'key_reverse':
-                self.is_key_reversed = False
-            elif buff_type == 'ice_slide':
-                self.is_sliding = False
-                self.velocity_x = 0
-            elif buff_type == 'transform':
-                # transform 발판을 원래 상태로 복구
-                for platform in platforms:
-                    if platform.is_transformed:
-                        platform.revert_to_original()
-                        platform.is_transformed = False
-                        platform.width = platform.original_width  # 발판 너비 복구
-
-    def remove_all_buffs(self):
-        """모든 버프를 제거합니다."""
-        self.positive_buff = None
-        self.active_buffs.clear()
-        self.can_double_jump = False
-        self.has_double_jumped = False
-        self.remaining_double_jumps = 0
-        self.remaining_jump_boosts = 0
-        self.jump_power_multiplier = 1.0
-        self.speed_multiplier = 1.0
-        self.is_key_reversed = False
-        self.is_sliding = False
-        self.velocity_x = 0
+        # 충돌 박스 (rect를 읽을 때마다 제자리에서 갱신해 재사용)
+        self._rect = pygame.Rect(0, 0, PLAYER_WIDTH, PLAYER_HEIGHT)
 
     @property
     def border_color(self):
@@ -108,13 +60,17 @@ class Player:
 
     @property
     def rect(self):
-        """플레이어의 충돌 박스를 반환합니다."""
-        return pygame.Rect(
+        """
+        플레이어의 충돌 박스를 반환합니다.
+        매번 같은 Rect를 현재 위치로 갱신해 반환하므로, 값을 보관하려면 copy()해야 합니다.
+        """
+        self._rect.update(
             self.pos_x - PLAYER_WIDTH/2,  # 중심점 기준으로 좌우 위치 계산
             self.pos_y - PLAYER_HEIGHT/2,  # 중심점 기준으로 상하 위치 계산
             PLAYER_WIDTH,
             PLAYER_HEIGHT
         )
+        return self._rect
 
     @property
     def bottom(self):
@@ -126,7 +82,7 @@ class Player:
         """플레이어의 상단 y좌표를 반환합니다."""
         return self.pos_y - PLAYER_HEIGHT/2
 
-    def move(self, direction):
+    def move(self, direction, dt=1.0):
         """플레이어를 좌우로 이동시킵니다."""
         # 키가 반전된 경우 방향을 반대로
         if self.is_key_reversed:
@@ -134,52 +90,53 @@ class Player:
 
         if self.is_sliding:
             # 슬라이딩 중에는 속도를 누적
-            self.velocity_x += direction * PLAYER_SPEED * self.speed_multiplier * 0.1
+            self.velocity_x += direction * PLAYER_SPEED * self.speed_multiplier * 0.1 * dt
             # 최대 속도 제한
             self.velocity_x = max(
                 min(self.velocity_x, PLAYER_SPEED * 2), -PLAYER_SPEED * 2)
         else:
             # 일반 이동
-            Movement.move_horizontal(self, direction * self.speed_multiplier)
+            Movement.move_horizontal(self, direction * self.speed_multiplier, dt)
 
     def jump(self):
         """플레이어가 점프합니다."""
         if not self.is_jumping:
-            # 점프력 증가 아이템이 있는 경우
-            if self.positive_buff == 'jump_boost' and self.remaining_jump_boosts > 0:
-                self.velocity_y = JUMP_POWER * \
-                    ITEM_TYPES['jump_boost']['value']
+            self.velocity_y = JUMP_POWER * self.jump_power_multiplier
+            # 점프력 증가 버프는 점프할 때마다 횟수 차감 (다 쓰면 BuffEngine이 해제)
+            if self.remaining_jump_boosts > 0:
                 self.remaining_jump_boosts -= 1
-                if self.remaining_jump_boosts <= 0:
-                    self.jump_power_multiplier = 1.0
-                    self.positive_buff = None
-            else:
-                self.velocity_y = JUMP_POWER * self.jump_power_multiplier
             self.is_jumping = True
             return True
         elif self.can_double_jump and not self.has_double_jumped and self.remaining_double_jumps > 0:
             self.velocity_y = JUMP_POWER * self.jump_power_multiplier
             self.has_double_jumped = True
             self.remaining_double_jumps -= 1
-            if self.remaining_double_jumps <= 0:
-                self.can_double_jump = False
             return True
         return False
 
-    def update(self, platforms):
-        """플레이어의 상태를 업데이트합니다."""
-        Movement.apply_gravity(self, platforms)
-
-        # 발판에 착지했는지 확인
+    def update(self, platforms, dt=1.0, swept=False):
+        """
+        플레이어의 상태를 한 틱 업데이트합니다.
+        Args:
+            platforms: 플랫폼 객체 리스트 또는 PlatformIndex
+            dt (float): 틱의 길이 (FPS 기준 프레임 수)
+            swept (bool): 착지를 틱 동안의 움직임 전체로 검사할지 여부
+        """
+        Movement.apply_gravity(self, platforms, dt, swept)
+
+        # 발판에 착지했는지 확인 (y 인덱스가 있으면 바닥 근처 발판만 검사)
         is_landing = False
-        for platform in platforms:
-            if platform.is_point_above(self.pos_x, self.bottom):
+        candidates = platforms
+        if hasattr(platforms, 'near'):
+            candidates = platforms.near(self.bottom - 10, self.bottom + 10)
+        for platform in candidates:
+            if platform.is_point_above(self.pos_x, self.bottom, dt):
                 is_landing = True
                 break
 
         # 슬라이딩 상태일 때 x축 속도 적용 (발판에 있을 때만)
         if self.is_sliding and is_landing:
-            self.pos_x += self.velocity_x
+            self.pos_x += self.velocity_x * dt
             # 화면 경계 체크
             if self.pos_x < PLAYER_WIDTH/2:
                 self.pos_x = PLAYER_WIDTH/2
@@ -188,19 +145,11 @@ class Player:
                 self.pos_x = SCREEN_WIDTH - PLAYER_WIDTH/2
                 self.velocity_x = 0
             # 마찰력 적용
-            self.velocity_x *= self.slide_friction
+            self.velocity_x *= self.slide_friction ** dt
         elif self.is_sliding and not is_landing:
             # 공중에서는 슬라이딩 속도를 즉시 0으로 만듦
             self.velocity_x = 0
 
-        # 버프 해제 조건: 상승 10미터 혹은 하강 5미터
-        if self.buff_start_height is not None:
-            height_change = self.raw_height - self.buff_start_height
-            if height_change >= 10 or height_change <= -5:
-                for buff_type in list(self.active_buffs):
-                    self.remove_buff(buff_type, platforms)
-                self.buff_start_height = None
-
         # 착지 상태가 아니면 점프 불가능
         if not is_landing:
             self.is_jumping = True
@@ -214,12 +163,34 @@ class Player:
         if self.screen_y > SCREEN_HEIGHT + PLAYER_HEIGHT:
             self.is_dead = True
 
+    def save_previous(self):
+        """틱을 진행하기 전의 위치를 저장합니다. (그릴 때 보간용)"""
+        self.prev_x = self.pos_x
+        self.prev_y = self.pos_y
+
+    def interpolate(self, camera_y, alpha):
+        """
+        이전 틱과 현재 틱 사이 alpha(0~1) 지점을 그릴 위치로 정합니다.
+        Args:
+            camera_y (float): 그릴 때 사용하는 (보간된) 카메라 위치
+            alpha (float): 1이면 현재 틱의 위치
+        """
+        back = 1 - alpha
+        self.render_x = self.pos_x - (self.pos_x - self.prev_x) * back
+        self.render_y = self.pos_y - (self.pos_y - self.prev_y) * back - camera_y
+
+    def screen_rect(self):
+        """화면에 그려질 플레이어 몸체 영역을 반환합니다."""
+        return pygame.Rect(int(self.render_x - PLAYER_WIDTH/2),
+                           int(self.render_y - PLAYER_HEIGHT/2),
+                           PLAYER_WIDTH, PLAYER_HEIGHT)
+
     def draw(self, screen):
         """플레이어와 활성화된 버프들을 화면에 그립니다."""
         # 플레이어 그리기
         pygame.draw.rect(screen, BLACK, (
-            int(self.pos_x - PLAYER_WIDTH/2),
-            int(self.screen_y - PLAYER_HEIGHT/2),
+            int(self.render_x - PLAYER_WIDTH/2),
+            int(self.render_y - PLAYER_HEIGHT/2),
             PLAYER_WIDTH,
             PLAYER_HEIGHT
         ))
@@ -227,9 +198,9 @@ class Player:
         # 겹겹이 쌓이는 테두리 색상 적용
         border_thickness = 2
         for buff_type in self.active_buffs:
-            pygame.draw.rect(screen, ITEM_TYPES[buff_type]['color'], (
-                int(self.pos_x - PLAYER_WIDTH/2),
-                int(self.screen_y - PLAYER_HEIGHT/2),
+            draw_rect_border(screen, ITEM_TYPES[buff_type]['color'], (
+                int(self.render_x - PLAYER_WIDTH/2),
+                int(self.render_y - PLAYER_HEIGHT/2),
                 PLAYER_WIDTH,
                 PLAYER_HEIGHT
             ), border_thickness)
@@ -237,9 +208,9 @@ class Player:
 
         # 긍정 버프 테두리
         if self.positive_buff:
-            pygame.draw.rect(screen, ITEM_TYPES[self.positive_buff]['color'], (
-                int(self.pos_x - PLAYER_WIDTH/2),
-                int(self.screen_y - PLAYER_HEIGHT/2),
+            draw_rect_border(screen, ITEM_TYPES[self.positive_buff]['color'], (
+                int(self.render_x - PLAYER_WIDTH/2),
+                int(self.render_y - PLAYER_HEIGHT/2),
                 PLAYER_WIDTH,
                 PLAYER_HEIGHT
             ), border_thickness)
@@ -273,6 +244,8 @@ class Player:
     def update_screen_position(self, camera_y):
         """화면상의 위치를 업데이트합니다."""
         self.screen_y = self.pos_y - camera_y
+        self.render_x = self.pos_x
+        self.render_y = self.screen_y
 
     def update_score(self):
         """점수(높이)를 업데이트합니다."""
@@ -0,0 +1,48 @@
+class ObjectPool:
+    """
+    다 쓴 객체를 버리지 않고 보관했다가 다시 초기화해 재사용하는 풀입니다.
+    풀에 넣는 클래스는 생성자와 같은 인자를 받는 reinit() 메서드가 있어야 합니다.
+    """
+
+    def __init__(self, cls):
+        """
+        Args:
+            cls (type): 풀에서 관리할 클래스
+        """
+        self.cls = cls
+        self._free = []  # 재사용을 기다리는 객체들
+        self.created = 0  # 새로 만든 객체 수
+        self.reused = 0  # 재사용한 횟수
+        self.released = 0  # 풀에 돌려받은 횟수
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, *args, **kwargs):
+        """보관 중인 객체가 있으면 다시 초기화해 반환하고, 없으면 새로 만듭니다."""
+        if self._free:
+            obj = self._free.pop()
+            obj.reinit(*args, **kwargs)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.cls(*args, **kwargs)
+
+    def release(self, obj):
+        """더 이상 사용하지 않는 객체를 풀에 돌려줍니다."""
+        self._free.append(obj)
+        self.released += 1
+
+    def stats(self):
+        """
+        풀 사용 통계를 반환합니다.
+        Returns:
+            dict: created, reused, released, available(보관 중), in_use(사용 중)
+        """
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'released': self.released,
+            'available': len(self._free),
+            'in_use': self.created - len(self._free),
+        }
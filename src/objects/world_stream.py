@@ -0,0 +1,41 @@
+from .platform import Platform
+
+
+def platform_stream(x, y, width):
+    """
+    (x, y, width) 발판 위로 이어지는 발판을 끝없이 만드는 제너레이터입니다.
+    다음 발판은 이전 발판이 생성될 때의 위치와 너비를 기준으로 만들므로,
+    이미 만든 발판이 움직이거나 버프로 너비가 바뀌어도 이어지는 발판은 달라지지 않습니다.
+    """
+    while True:
+        platform = Platform.create_random(x, y, width)
+        x, y, width = platform.x, platform.y, platform.initial_width
+        yield platform
+
+
+def chunk_stream(platforms, index):
+    """
+    발판 스트림을 index의 고정 높이 청크 단위로 묶는 제너레이터입니다.
+    다음 청크로 넘어간 첫 발판은 다음 청크를 요청할 때 함께 내보내고,
+    그 전에 스트림을 닫으면(close) 풀에 돌려줍니다.
+    Args:
+        platforms (iterator): 아래에서 위 순서로 발판을 내는 스트림
+        index (PlatformIndex): 청크 번호를 계산할 인덱스
+    Yields:
+        list[Platform]: 같은 청크에 속한 발판들
+    """
+    chunk = []
+    chunk_id = None
+    for platform in platforms:
+        platform_chunk = index.chunk_id(platform.y)
+        if chunk and platform_chunk != chunk_id:
+            try:
+                yield chunk
+            except GeneratorExit:
+                # 스트림을 닫을 때 다음 청크로 넘기려던 발판은 풀에 돌려줌
+                platform.cancel_timers()
+                Platform.pool.release(platform)
+                raise
+            chunk = []
+        chunk_id = platform_chunk
+        chunk.append(platform)
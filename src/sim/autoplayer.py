@@ -0,0 +1,656 @@
+import argparse
+import math
+import statistics
+import time
+from collections import Counter
+from ..constants import *
+from ..config.difficulty_settings import DIFFICULTY_SETTINGS
+from ..game import Game
+from ..objects.motion import bounce, blink
+from .reachability import (PLAYER_MIN_X, PLAYER_MAX_X, check_pair, jump_apex,
+                           landing_tick)
+
+
+FOLLOW_WINDOW = 90  # 착지한 발판에서 다음 점프를 찾아볼 틱 수
+PATIENCE = 240  # 다음 발판으로 이어지지 않아도 점프하기 전까지 기다리는 틱 수
+RESCUE_RANGE = SCREEN_HEIGHT  # 계획 없이 떨어질 때 착지할 발판을 찾는 아래쪽 범위
+DOUBLE_JUMP_RANGE = 2 * jump_apex()[1]  # 2단 점프로 닿을 수 있는 위쪽 범위 (넉넉하게)
+SUPPORT_LOOKAHEAD = 8  # 서 있는 발판이 곧 사라지거나 줄어드는지 미리 보는 틱 수
+DEAD_END_DEPTH = 3  # 막다른 곳인지 확인할 때 가장 높은 발판 위로 이어서 검사하는 발판 수
+
+
+def standing_height(platform):
+    """발판 위에 섰을 때의 실제 높이(m, Player.update_score의 raw_height)를 구합니다."""
+    return max(0, int((SCREEN_HEIGHT - 100 - (platform.y - PLAYER_HEIGHT / 2)) / 100))
+
+
+def predict(platform, steps):
+    """
+    발판의 steps 틱 뒤 상태를 현재 상태에서 계산합니다. (Platform.update와 같은 규칙)
+    Returns:
+        tuple: (x, 너비, 보이는지 여부, 그 틱에 위에 선 플레이어를 옮기는 거리)
+    """
+    x, width = platform.x, platform.base_width
+    dt = platform.clock.dt
+    direction = platform.direction
+    if steps <= 0:
+        carry = platform.speed * direction * dt if platform.is_moving else 0
+        return x, platform.width, platform.is_visible or not platform.is_vanish, carry
+    if platform.is_moving:
+        x, direction = bounce(x, direction, platform.speed * dt,
+                              SCREEN_WIDTH - (platform.width_override or width), steps)
+    if platform.is_transforming:
+        offset, _ = bounce(width - platform.min_width, platform.transform_direction,
+                           platform.transform_speed * dt,
+                           platform.initial_width - platform.min_width, steps)
+        width = platform.min_width + offset
+    shown = platform.width_override or width
+    if platform.is_transforming:
+        x = min(max(platform.center - shown / 2, 0), SCREEN_WIDTH - shown)
+
+    visible = platform.is_visible
+    vanish_tick = getattr(platform, 'vanish_tick', None)
+    if platform.is_vanish and vanish_tick is not None:
+        # 저장소 뷰에는 전환 틱이 없으므로 현재 상태가 유지된다고 봄
+        clock = platform.clock
+        visible, _ = blink(visible, vanish_tick,
+                           max(1, clock.ticks(platform.current_difficulty.vanish_interval)),
+                           max(1, clock.ticks(platform.current_difficulty.vanish_duration)),
+                           clock.tick + steps)
+    carry = platform.speed * direction * dt if platform.is_moving else 0
+    return x, shown, visible or not platform.is_vanish, carry
+
+
+def landing_range(platform, steps):
+    """
+    steps 틱 뒤 플레이어 중심이 이 발판에 착지해 서 있을 수 있는 x 범위를 구합니다.
+    착지는 발판이 움직인 뒤의 x로 검사하고, 움직이는 발판은 그 다음에 플레이어를 한 번 더
+    옮기므로(Movement.apply_gravity) 옮겨진 위치도 발판 위(is_point_above의 여유 2px)여야 합니다.
+    발판이 너무 좁아 그런 범위가 없으면(is_carry_trap) 발판에 실려 가는 범위를 그대로 씁니다.
+    Returns:
+        tuple | None: (왼쪽, 오른쪽). 그때 발판이 사라져 있으면 None
+    """
+    x, width, visible, carry = predict(platform, steps)
+    if not visible:
+        return None
+    left, right = max(x, x - 2 - carry), min(x + width, x + width + 2 - carry)
+    if left > right:
+        return x, x + width
+    return left, right
+
+
+def cross_tick(bottom, velocity_y, y, limit=240):
+    """
+    바닥 높이 bottom, y 속도 velocity_y에서 출발해 바닥이 y를 내려오면서 지나는 틱 수를 구합니다.
+    (Movement.apply_gravity의 착지 조건과 같은 검사)
+    Returns:
+        int | None: 지나는 틱 수. 이미 아래에 있거나 닿지 않으면 None
+    """
+    for tick in range(1, limit + 1):
+        prev = bottom
+        velocity_y += GRAVITY
+        bottom += velocity_y
+        if velocity_y > 0:
+            if prev <= y <= bottom:
+                return tick
+            if prev > y:
+                return None
+    return None
+
+
+def landing_move(x, left, right, step, moves):
+    """
+    한 틱에 step씩 최대 moves번 움직여 플레이어 중심을 [left, right]에 넣는 이동 횟수를 구합니다.
+    Returns:
+        int | None: 이동 횟수 (양수는 오른쪽). 범위 중앙에 가장 가까운 값. 닿지 않으면 None
+    """
+    left, right = max(left, PLAYER_MIN_X), min(right, PLAYER_MAX_X)
+    if left > right:
+        return None
+    if step <= 0 or moves <= 0:
+        return 0 if left <= x <= right else None
+    low = max(-moves, math.ceil((left - x) / step - 1e-9))
+    high = min(moves, math.floor((right - x) / step + 1e-9))
+    if low <= high:
+        return min(max(round(((left + right) / 2 - x) / step), low), high)
+    # 화면 끝에 걸리면 벽 위치에 멈추므로, 벽까지 간 뒤 돌아오면 step 간격에서 벗어난
+    # 위치에도 닿을 수 있음 (벽이 범위 안에 있으면 돌아올 필요 없음)
+    best = None
+    for wall, side in ((PLAYER_MIN_X, -1), (PLAYER_MAX_X, 1)):
+        to_wall = math.ceil(abs(wall - x) / step - 1e-9)
+        near_edge, far_edge = (left, right) if side < 0 else (right, left)
+        back = max(0, math.ceil(abs(near_edge - wall) / step - 1e-9))
+        if back * step > abs(far_edge - wall) + 1e-9:
+            continue  # 돌아오는 위치가 범위를 건너뜀
+        if to_wall + back <= moves and (best is None or to_wall + back < best[0]):
+            best = (to_wall + back, side * to_wall if to_wall else -side * back)
+    return None if best is None else best[1]
+
+
+class AutoPlayer:
+    """
+    헤드리스 실행용 계획 자동 플레이어입니다. HeadlessRunner의 script로 사용할 수 있습니다.
+    - 서 있을 때: 점프 최고 높이 안의 위쪽 발판마다 지금 점프하면 착지 틱에 발판이 어디에
+      있을지 예측하고, 한 틱에 PLAYER_SPEED씩 움직여 닿을 수 있는 발판 중 가장 높은 발판으로
+      점프합니다. 착지한 발판에서 다음 발판으로 이어지지 않으면 PATIENCE틱까지 기다립니다.
+    - 공중에서: 매 틱 목표 발판의 착지 시점 위치를 다시 예측해 좌우 입력을 정합니다.
+    - 계획 없이 떨어지면 아래쪽에서 착지할 발판을 찾고, 필요하면 2단 점프를 사용합니다.
+    - PATIENCE틱을 기다려도 닿을 수 있는 발판이 없으면 아래 발판으로 내려갑니다.
+      높이 버프가 있으면 BUFF_EXPIRE_DROP만큼 내려가 해제될 때까지, 없으면 한 발판만
+      내려가 다른 경로를 찾습니다. 화면 아래로 떨어져 죽지 않는 발판만 고릅니다.
+    궤적은 FPS 기준 틱(dt == 1)을 가정합니다.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """새 판을 시작할 때 계획과 기록을 지웁니다."""
+        self.target = None  # 착지하려는 발판
+        self.land_tick = None  # 목표 발판에 착지할 틱
+        self.support = None  # 마지막으로 서 있던 발판
+        self.highest = None  # 서 본 발판 중 가장 높은 발판
+        self.waited = 0  # 현재 발판에서 기다린 틱 수
+        self.cause = None  # 마지막으로 발판을 벗어난 이유 (죽으면 사망 원인)
+        self.jumps = 0
+        self.leaving = None  # 내려가려고 벗어나는 중인 발판
+        self.drop_target = None  # 내려가서 착지하려는 발판
+        self.clearing = False  # 높이 버프를 해제하려고 계속 내려가는 중인지 여부
+        self.drops = 0
+
+    def __call__(self, frame, game):
+        """
+        현재 상태에서 다음 틱의 입력을 정합니다.
+        Args:
+            frame (int): 현재 프레임 번호
+            game (Game): 실행 중인 게임
+        Returns:
+            int: 입력 비트 마스크
+        """
+        player = game.player
+        tick = game.sim_clock.tick
+        support = self.find_support(game)
+        if support is not None:
+            if support is not self.support:
+                self.waited = 0
+            if support is not self.leaving:
+                self.leaving = self.drop_target = None
+            if self.highest is None or support.y < self.highest.y:
+                self.highest = support
+            self.support = support
+            self.target = None
+            self.cause = None
+            input_bits = self.plan_jump(game, support, tick)
+        else:
+            if self.target is None and self.cause is None:
+                # 점프하지 않았는데 발판을 벗어남
+                support = self.support
+                vanished = support is not None and support.is_vanish and not support.is_visible
+                if self.leaving is not None:
+                    self.cause = 'dropped'
+                    self.drops += 1
+                else:
+                    self.cause = 'vanished' if vanished else 'slipped'
+            input_bits = self.steer(game, tick)
+        if player.is_key_reversed and input_bits & (INPUT_LEFT | INPUT_RIGHT):
+            input_bits ^= INPUT_LEFT | INPUT_RIGHT
+        return input_bits
+
+    @staticmethod
+    def find_support(game):
+        """
+        플레이어가 서 있거나 실려 가는 발판을 반환합니다. 공중이면 None
+        좁은 움직이는 발판(is_carry_trap)에 실려 가는 동안에는 is_jumping이 켜져 있으므로
+        y 속도와 발판 높이로 판단합니다.
+        """
+        player = game.player
+        if player.velocity_y != 0:
+            return None
+        bottom = player.bottom
+        for platform in game.platforms.near(bottom - 0.5, bottom + 0.5):
+            carry = platform.speed * platform.clock.dt if platform.is_moving else 0
+            if platform.x - carry <= player.pos_x <= platform.x + platform.width + carry:
+                return platform
+        return None
+
+    @staticmethod
+    def air_step(player):
+        """공중에서 한 틱에 움직일 수 있는 거리 (슬라이딩 중에는 공중에서 움직이지 않음)"""
+        if player.is_sliding:
+            return 0
+        return PLAYER_SPEED * player.speed_multiplier
+
+    def plan_jump(self, game, support, tick):
+        """서 있을 때: 점프할 발판을 고르거나, 기다리면서 발판 위에 머무는 입력을 반환합니다."""
+        player = game.player
+        if player.is_jumping:
+            # 좁은 발판에 실려 가는 중: 발판이 벽에서 방향을 바꿔 설 수 있을 때까지 기다림
+            self.waited += 1
+            if self.waited > PATIENCE:
+                return self.plan_drop(game, support) or 0
+            return 0
+        if self.clearing:
+            if self.height_buffs(game):
+                drop = self.plan_drop(game, support)
+                if drop is not None:
+                    return drop
+            self.clearing = False
+        jump_power = JUMP_POWER * player.jump_power_multiplier
+        step = self.air_step(player)
+        _, apex = jump_apex(jump_power)
+
+        best = fallback = goal = None
+        for platform in reversed(game.platforms.near(support.y - apex, support.y - 1)):
+            n = landing_tick(support.y - platform.y, jump_power)
+            if n is None:
+                continue
+            landing = landing_range(platform, n)
+            if landing is None:
+                continue
+            left, right = landing
+            if goal is None:
+                # 가장 높은 후보의 착지 범위에서 지금 위치와 가장 가까운 지점
+                goal = min(max(player.pos_x, left), right)
+            move = landing_move(player.pos_x, left, right, step, n)
+            if move is None:
+                continue
+            if fallback is None:
+                fallback = (platform, n, move)
+            # 벽을 거쳐 가는 경우에도 착지 위치는 착지 범위 안
+            landing_x = min(max(player.pos_x + move * step, left, PLAYER_MIN_X),
+                            right, PLAYER_MAX_X)
+            if self.has_follow_up(game, platform, n, landing_x, jump_power, step):
+                best = (platform, n, move)
+                break
+
+        self.waited += 1
+        support_ends = self.support_ends(game, support)
+        if best is None and fallback is not None and (self.waited > PATIENCE or support_ends):
+            best = fallback
+        if best is None and fallback is None and self.waited > PATIENCE:
+            drop = self.plan_drop(game, support)
+            if drop is not None:
+                return drop
+        if best is not None:
+            platform, n, move = best
+            self.target = platform
+            self.land_tick = tick + n
+            self.jumps += 1
+            return INPUT_JUMP | self.move_bits(move)
+        return self.hold(game, support, goal)
+
+    @staticmethod
+    def support_ends(game, support):
+        """
+        SUPPORT_LOOKAHEAD틱 안에 발판이 사라지거나, 크기가 바뀌어 지금 위치에서 걸어서는
+        발판 위에 남을 수 없게 되는지 확인합니다. (움직이는 발판은 사라지는지만 봄)
+        """
+        player = game.player
+        step = 0 if player.is_sliding else PLAYER_SPEED * player.speed_multiplier
+        for steps in range(1, SUPPORT_LOOKAHEAD + 1):
+            support_range = landing_range(support, steps)
+            if support_range is None:
+                return True
+            if (not support.is_moving and
+                    landing_move(player.pos_x, *support_range, step, steps) is None):
+                return True
+        return False
+
+    @staticmethod
+    def height_buffs(game):
+        """적용 중인 높이 버프들의 획득 높이(m) 목록"""
+        buffs = game.buffs
+        return [info['start_height'] for buff_type, info in buffs.active.items()
+                if buff_type != buffs.positive]
+
+    def plan_drop(self, game, support):
+        """
+        닿을 수 있는 위쪽 발판이 없을 때: 아래 발판을 골라 그쪽 끝으로 걸어 내려갑니다.
+        높이 버프가 있으면 모든 버프가 해제되는 높이의 발판 중 가장 높은 발판을, 그런 발판이
+        없으면 가장 낮은 발판을 고르고, 해제될 때까지 착지할 때마다 다시 내려갑니다(clearing).
+        높이 버프가 없으면 바로 아래 발판으로 내려가 다른 경로를 찾습니다.
+        Returns:
+            int | None: 입력 비트. 안전하게 내려갈 발판이 없으면 None
+        """
+        player = game.player
+        # 카메라는 플레이어가 CAMERA_FOLLOW_THRESHOLD보다 위에 있으면 아래로도 따라오므로 그 위의
+        # 발판은 안전하고, 그 아래에서는 착지해도 화면 아래 경계(Player.update의 사망 조건)를
+        # 넘지 않는 발판만 안전함
+        lowest = max(game.camera_y + SCREEN_HEIGHT + PLAYER_HEIGHT * 1.5,
+                     CAMERA_FOLLOW_THRESHOLD + PLAYER_HEIGHT / 2) - 1
+        lowest = min(lowest, support.y + SCREEN_HEIGHT)
+        platforms = [platform for platform in game.platforms.near(support.y + 1, lowest)
+                     if platform is not support and
+                     (platform.is_visible or not platform.is_vanish)]
+        if not platforms:
+            return None
+
+        starts = self.height_buffs(game)
+        if starts:
+            clear_height = min(starts) - BUFF_EXPIRE_DROP
+            cleared = [platform for platform in platforms
+                       if standing_height(platform) <= clear_height]
+            # platforms는 아래에서 위 순서
+            target = cleared[-1] if cleared else platforms[0]
+            self.clearing = True
+        else:
+            target = platforms[-1]
+            self.clearing = False
+
+        self.leaving = support
+        self.drop_target = target
+        # 목표 쪽 끝으로 걸어 나감. 그쪽 끝이 화면 끝에 막혀 있으면 반대쪽 끝으로
+        left_open = support.x - 2 > PLAYER_MIN_X
+        right_open = support.x + support.width + 2 < PLAYER_MAX_X
+        center = target.x + target.width / 2
+        if support.x <= center <= support.x + support.width:
+            # 목표가 바로 아래에 있으면 가까운 끝으로
+            center = player.pos_x + (1 if player.pos_x - support.x > support.width / 2 else -1)
+        direction = 1 if center > player.pos_x else -1
+        if not (right_open if direction > 0 else left_open):
+            direction = -direction
+        return self.move_bits(direction)
+
+    def dead_end(self, game):
+        """
+        서 본 가장 높은 발판부터 위로 DEAD_END_DEPTH개의 발판까지, 이웃한 두 발판 사이를
+        버프 없이 점프할 수 없는 곳이 있는지 확인합니다. 발판은 한 줄로 이어져 생성되므로
+        (바로 위 발판 너머는 점프 최고 높이보다 높음) 이 경우 버프 없이는 누구도 더 오를 수
+        없는 막다른 곳입니다.
+        Returns:
+            str | None: 닿지 못하는 이유(check_pair의 원인). 모두 닿을 수 있으면 None
+        """
+        source = self.highest
+        if source is None:
+            return None
+        chain = [source] + game.platforms.near(source.y - SCREEN_HEIGHT,
+                                               source.y - 1)[:DEAD_END_DEPTH]
+        for lower, upper in zip(chain, chain[1:]):
+            reachable, _, reason, _ = check_pair(lower, upper, start=game.sim_clock.tick)
+            if not reachable:
+                return reason
+        return None
+
+    def has_follow_up(self, game, platform, n, landing_x, jump_power, step):
+        """
+        platform의 landing_x에 n틱 뒤 착지한 다음, 그 발판이 보이는 동안 FOLLOW_WINDOW틱 안에
+        위쪽 발판으로 점프할 수 있는 시점이 있는지 확인합니다.
+        착지한 뒤 기다리는 동안 발판 위를 걸어서 움직일 수 있다고 봅니다.
+        """
+        _, apex = jump_apex(jump_power)
+        above = game.platforms.near(platform.y - apex, platform.y - 1)
+        if not above:
+            return True  # 아직 생성되지 않은 위쪽은 알 수 없으므로 이어진다고 봄
+        walk = PLAYER_SPEED * game.player.speed_multiplier
+        for wait in range(n, n + FOLLOW_WINDOW):
+            x, width, visible, _ = predict(platform, wait)
+            if not visible:
+                return False  # 착지한 발판이 사라지기 전에 점프하지 못함
+            # 기다리는 동안 걸어서 갈 수 있는 범위 (발판 밖으로는 나가지 않음)
+            reach = walk * (wait - n)
+            start_left = max(x, landing_x - reach)
+            start_right = min(x + width, landing_x + reach)
+            if start_left > start_right:
+                continue
+            for target in above:
+                landing = landing_tick(platform.y - target.y, jump_power)
+                if landing is None:
+                    continue
+                target_range = landing_range(target, wait + landing)
+                if target_range is None:
+                    continue
+                gap = max(target_range[0] - start_right, start_left - target_range[1], 0)
+                if gap <= step * landing:
+                    return True
+        return False
+
+    def hold(self, game, support, goal=None):
+        """
+        발판 위에서 기다리며 goal(다음 점프에 유리한 x) 쪽으로 움직입니다.
+        다음 틱에도 발판 위에 남는 경우에만 움직이고, 슬라이딩 중에는 속도를 조절해 멈춥니다.
+        """
+        player = game.player
+        position = player.pos_x
+        support_range = landing_range(support, 1)
+        if support_range is None:
+            return 0  # 다음 틱에 사라지므로 어떻게 해도 떨어짐
+        left, right = support_range
+        margin = min(PLAYER_SPEED, (right - left) / 2)
+        if goal is None:
+            goal = position
+        goal = min(max(goal, left + margin), right - margin)
+
+        if player.is_sliding:
+            # 속도는 틱마다 accel씩 바뀌므로 멈추는 데 필요한 거리 안이면 반대로 눌러 감속
+            accel = PLAYER_SPEED * player.speed_multiplier * 0.1
+            velocity = player.velocity_x
+            distance = goal - position
+            if abs(distance) < 1 and abs(velocity) < accel:
+                return 0
+            if velocity * distance > 0 and velocity * velocity / (2 * accel) >= abs(distance):
+                return self.move_bits(-velocity)
+            return self.move_bits(distance)
+
+        # 이동은 발판이 움직이기 전에 일어나므로 다음 틱 발판 범위와 비교
+        step = PLAYER_SPEED * player.speed_multiplier
+        direction = (goal > position + step / 2) - (goal < position - step / 2)
+        if direction and left <= position + direction * step <= right:
+            return self.move_bits(direction)
+        if left <= position <= right:
+            return 0
+        return self.move_bits(1 if position < (left + right) / 2 else -1)
+
+    def steer(self, game, tick):
+        """공중에서: 목표 발판의 착지 시점 위치로 좌우 입력을 정합니다."""
+        player = game.player
+        step = self.air_step(player)
+        if self.target is not None:
+            remaining = self.land_tick - tick
+            if remaining > 0:
+                landing = landing_range(self.target, remaining)
+                if landing is not None:
+                    move = landing_move(player.pos_x, *landing, step, remaining)
+                    if move is not None:
+                        return self.move_bits(move)
+            # 착지할 틱이 지났거나 더 이상 닿을 수 없음
+            self.target = None
+            self.cause = 'missed'
+        return self.rescue(game, tick, step)
+
+    def rescue(self, game, tick, step):
+        """계획 없이 떨어지는 중: 아래쪽에서 착지할 발판을 찾고, 없으면 2단 점프를 시도합니다."""
+        player = game.player
+        bottom = player.bottom
+        top = bottom - DOUBLE_JUMP_RANGE
+        if self.leaving is not None:
+            top = self.leaving.y + 1  # 내려가는 중에는 벗어난 발판보다 아래로만
+        platforms = game.platforms.near(top, bottom + RESCUE_RANGE)
+        if self.drop_target in platforms:
+            # 내려가는 중이면 고른 발판을 먼저 시도
+            platforms = [platform for platform in platforms if platform is not self.drop_target]
+            platforms.append(self.drop_target)
+        options = [(player.velocity_y, 0)]
+        if player.can_double_jump and not player.has_double_jumped and player.remaining_double_jumps > 0:
+            options.append((JUMP_POWER * player.jump_power_multiplier, INPUT_JUMP))
+        for velocity_y, jump_bit in options:
+            for platform in reversed(platforms):
+                n = cross_tick(bottom, velocity_y, platform.y)
+                if n is None:
+                    continue
+                landing = landing_range(platform, n)
+                if landing is None:
+                    continue
+                move = landing_move(player.pos_x, *landing, step, n)
+                if move is not None:
+                    self.target = platform
+                    self.land_tick = tick + n
+                    return jump_bit | self.move_bits(move)
+        return 0
+
+    @staticmethod
+    def move_bits(move):
+        """이동 횟수의 부호를 좌우 입력 비트로 바꿉니다."""
+        if move > 0:
+            return INPUT_RIGHT
+        if move < 0:
+            return INPUT_LEFT
+        return 0
+
+
+def play(game, autoplayer, difficulty, seed, max_frames, stall_frames):
+    """
+    한 판을 자동 플레이어로 진행합니다.
+    높이는 난이도 점수 배율(score_multiplier)을 적용하지 않은 실제 높이로 잽니다.
+    Returns:
+        dict: seed, 높이(m), 점수, 프레임 수,
+            끝난 방식('died', 'dead_end', 'stalled', 'frame_limit'),
+            끝난 이유(사망 원인, 막다른 곳의 원인, 멈췄을 때 적용 중인 버프),
+            점프/내려가기 수, 계획에 쓴 시간(초)
+    """
+    game.start(difficulty, seed)
+    autoplayer.reset()
+    player = game.player
+    best_height = 0
+    best_frame = 0
+    planning = 0.0
+    end = 'frame_limit'
+    outcome = None
+    frame = 0
+    for frame in range(max_frames):
+        start = time.perf_counter()
+        input_bits = autoplayer(frame, game)
+        planning += time.perf_counter() - start
+        game.update(input_bits)
+        if player.raw_height > best_height:
+            best_height = player.raw_height
+            best_frame = frame
+        if player.is_dead:
+            end = 'died'
+            outcome = autoplayer.cause or 'unknown'
+            break
+        if frame - best_frame > stall_frames:
+            reason = autoplayer.dead_end(game)
+            if reason is not None:
+                # 생성된 발판이 이어지지 않아 더 오를 수 없음 (난이도의 한계)
+                end = 'dead_end'
+                outcome = reason
+            else:
+                # 버프 때문에 갇히는 경우를 구분하도록 적용 중인 버프를 붙임
+                end = 'stalled'
+                outcome = '+'.join(sorted(game.buffs.active)) or 'no_buff'
+            break
+    return {
+        'seed': game.seed,
+        'height': best_height,
+        'score': player.max_height,
+        'frames': frame + 1,
+        'end': end,
+        'outcome': outcome,
+        'jumps': autoplayer.jumps,
+        'drops': autoplayer.drops,
+        'planning': planning,
+    }
+
+
+def _height_stats(runs):
+    """판들의 높이 통계 (판이 없으면 None)"""
+    heights = [run['height'] for run in runs]
+    if not heights:
+        return None
+    return {
+        'count': len(heights),
+        'mean': statistics.mean(heights),
+        'median': statistics.median(heights),
+        'min': min(heights),
+        'max': max(heights),
+    }
+
+
+def benchmark(difficulty, seeds, seed=0, max_frames=36000, stall_frames=1800,
+              game_options=None):
+    """
+    여러 시드로 한 난이도를 자동 플레이하고 결과를 모읍니다.
+    더 오르지 못하고 멈춘 판 중 발판이 이어지지 않는 막다른 곳(dead_end)은 난이도의 한계로
+    높이 통계에 넣고, 그 밖의 멈춘 판(stalled)은 자동 플레이어의 한계이므로 빼고 따로 셉니다.
+    Args:
+        difficulty (str): 난이도 이름
+        seeds (int): 플레이할 판 수 (시드는 seed, seed + 1, ...)
+        seed (int): 시작 시드
+        max_frames (int): 한 판의 최대 프레임 수
+        stall_frames (int): 최고 높이가 이만큼의 프레임 동안 오르지 않으면 판을 끝냄
+        game_options (dict, optional): Game에 넘길 추가 옵션 (예: {'analytic': True})
+    Returns:
+        dict: 판별 결과, 멈춘 판을 뺀 높이 통계(height), 멈춘 판의 높이 통계(stalled_height),
+            사망 원인별/막다른 곳의 원인별/멈춘 버프별 횟수,
+            초당 시뮬레이션 프레임, 계획에 쓴 시간 비율
+    """
+    game = Game(headless=True, **(game_options or {}))
+    autoplayer = AutoPlayer()
+    runs = []
+    start = time.perf_counter()
+    for run_seed in range(seed, seed + seeds):
+        runs.append(play(game, autoplayer, difficulty, run_seed, max_frames, stall_frames))
+    elapsed = time.perf_counter() - start
+
+    frames = sum(run['frames'] for run in runs)
+    stalled = [run for run in runs if run['end'] == 'stalled']
+    return {
+        'difficulty': difficulty,
+        'runs': runs,
+        'height': _height_stats([run for run in runs if run['end'] != 'stalled']),
+        'stalled_height': _height_stats(stalled),
+        'deaths': Counter(run['outcome'] for run in runs if run['end'] == 'died'),
+        'dead_ends': Counter(run['outcome'] for run in runs if run['end'] == 'dead_end'),
+        'stalls': Counter(run['outcome'] for run in stalled),
+        'frame_limit': sum(run['end'] == 'frame_limit' for run in runs),
+        'drops': sum(run['drops'] for run in runs),
+        'frames': frames,
+        'elapsed': elapsed,
+        'fps': frames / elapsed if elapsed > 0 else 0.0,
+        'planning_share': sum(run['planning'] for run in runs) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def _format_heights(stats):
+    if stats is None:
+        return "none"
+    return (f"{stats['count']} runs, mean={stats['mean']:.1f}m median={stats['median']}m "
+            f"min={stats['min']}m max={stats['max']}m")
+
+
+def _format_counts(counter):
+    return ", ".join(f"{name}={count}" for name, count in counter.most_common()) or "none"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="자동 플레이어로 난이도별 도달 높이 측정")
+    parser.add_argument("--difficulty", action="append",
+                        choices=list(DIFFICULTY_SETTINGS.keys()),
+                        help="플레이할 난이도 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--seeds", type=int, default=20, help="난이도마다 플레이할 판 수")
+    parser.add_argument("--seed", type=int, default=0, help="시작 시드")
+    parser.add_argument("--frames", type=int, default=36000, help="한 판의 최대 프레임 수")
+    parser.add_argument("--stall", type=int, default=1800,
+                        help="최고 높이가 이 프레임 수 동안 오르지 않으면 판을 끝냄")
+    parser.add_argument("--analytic", action="store_true",
+                        help="발판/아이템 상태를 시각으로부터 직접 계산하는 분석 모드")
+    parser.add_argument("--lod", action="store_true",
+                        help="화면 주변 구간의 발판/아이템만 매 틱 업데이트")
+    args = parser.parse_args(argv)
+
+    for difficulty in args.difficulty or list(DIFFICULTY_SETTINGS.keys()):
+        result = benchmark(difficulty, args.seeds, args.seed, args.frames, args.stall,
+                           game_options={'analytic': args.analytic, 'lod': args.lod})
+        print(f"[{difficulty}] {args.seeds} runs, {result['frames']} frames in "
+              f"{result['elapsed']:.2f}s ({result['fps']:.0f} fps, "
+              f"planning {result['planning_share']:.0%}, drops {result['drops']})")
+        print(f"  height: {_format_heights(result['height'])}")
+        print(f"  deaths: {_format_counts(result['deaths'])}; "
+              f"dead ends: {_format_counts(result['dead_ends'])}; "
+              f"frame_limit={result['frame_limit']}")
+        print(f"  stalled: {_format_heights(result['stalled_height'])}; "
+              f"{_format_counts(result['stalls'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+import argparse
+import contextlib
+import json
+import os
+import platform as platform_module
+import random
+import sys
+import time
+import tracemalloc
+
+# pygame 임포트 안내 문구가 표준 출력의 JSON과 섞이지 않도록 숨김
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+from ..constants import *
+from ..actions.movement import Movement
+from ..game import Game
+from ..objects.item import Item
+from ..objects.item_index import ItemIndex
+from ..objects.platform import Platform
+from ..objects.platform_index import PlatformIndex
+from ..objects.player import Player
+
+
+# 시나리오: 이름 -> (발판 수, 발판 종류, 아이템 수)
+SCENARIOS = {
+    'platforms_10': (10, 'static', 0),
+    'platforms_200': (200, 'static', 0),
+    'platforms_2000': (2000, 'static', 0),
+    'vanishing_200': (200, 'vanish', 0),
+    'moving_200': (200, 'moving', 0),
+    'items_50': (200, 'static', 50),
+}
+
+
+class _AlwaysSpawn(random.Random):
+    """random()이 항상 0을 반환해 generate_items가 매번 아이템 배치 경로를 타게 합니다."""
+
+    def random(self):
+        return 0.0
+
+
+def build_world(game, platform_count, kind, item_count):
+    """
+    게임의 발판과 아이템을 시나리오에 맞게 다시 구성합니다.
+    플레이어가 서 있는 첫 발판은 항상 고정 발판이라 측정 중에 플레이어가 죽지 않고,
+    가장 높은 발판이 생성 기준선보다 위에 있어 update 중에 발판 수가 바뀌지 않습니다.
+    """
+    for platform in game.platforms:
+        platform.cancel_timers()
+    base_y = SCREEN_HEIGHT - 50
+    spacing = max(100, (SCREEN_HEIGHT * 2 + 200) / max(1, platform_count - 1))
+    platforms = [Platform(SCREEN_WIDTH//2 - PLATFORM_MAX_WIDTH//2, base_y,
+                          PLATFORM_MAX_WIDTH)]
+    for i in range(1, platform_count):
+        x = 20 + (i * 97) % (SCREEN_WIDTH - PLATFORM_MAX_WIDTH - 40)
+        platforms.append(Platform(x, base_y - i * spacing, PLATFORM_MAX_WIDTH,
+                                  is_moving=kind == 'moving',
+                                  is_vanish=kind == 'vanish'))
+    if game.platform_store is not None:
+        game.platform_store.clear()
+        platforms = [game.platform_store.add(p) for p in platforms]
+    game.platforms = PlatformIndex(platforms)
+    game.start_world_stream()
+
+    # 아이템은 플레이어와 겹치지 않도록 화면 양쪽 가장자리에 배치
+    game.items = ItemIndex()
+    item_types = list(ITEM_TYPES.keys())
+    for i in range(item_count):
+        x = 40 if i % 2 == 0 else SCREEN_WIDTH - 40
+        y = base_y - 100 - i * (SCREEN_HEIGHT * 1.5 / max(1, item_count))
+        game.items.append(Item(x, y, item_types[i % len(item_types)]))
+
+    first = game.platforms[0]
+    game.player.pos_x = first.center_x
+    game.player.pos_y = first.y - PLAYER_HEIGHT/2
+    game.player.velocity_y = 0
+    game.player.is_jumping = False
+    game.camera_y = 0
+
+
+def summarize(samples):
+    """호출별 측정값(초)을 마이크로초 단위 통계로 요약합니다."""
+    samples = sorted(samples)
+    count = len(samples)
+    mean = sum(samples) / count
+    return {
+        'calls': count,
+        'mean_us': mean * 1e6,
+        'median_us': samples[count // 2] * 1e6,
+        'p95_us': samples[min(count - 1, int(count * 0.95))] * 1e6,
+        'min_us': samples[0] * 1e6,
+        'calls_per_sec': 1.0 / mean if mean > 0 else 0.0,
+    }
+
+
+def time_calls(func, iterations, setup=None):
+    """
+    func를 iterations번 호출하며 호출마다 걸린 시간을 잽니다.
+    setup은 매 호출 전에 실행되며 측정 시간에 포함되지 않습니다.
+    """
+    samples = []
+    perf_counter = time.perf_counter
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return summarize(samples)
+
+
+def bench_scenario(game, name, iterations):
+    """
+    한 시나리오에서 각 핫 패스를 측정합니다.
+    Returns:
+        list[dict]: 측정 항목별 결과
+    """
+    platform_count, kind, item_count = SCENARIOS[name]
+    results = []
+
+    def record(op, stats):
+        results.append({'scenario': name, 'op': op,
+                        'platforms': platform_count,
+                        'items': item_count, **stats})
+
+    def reset_world():
+        build_world(game, platform_count, kind, item_count)
+
+    # update: 입력 없이 플레이어가 첫 발판 위에 서 있는 상태
+    reset_world()
+    record('update', time_calls(lambda: game.update(0), iterations))
+
+    # draw: 헤드리스 오프스크린 화면에 전체 그리기와 변경 영역 그리기
+    reset_world()
+    record('draw', time_calls(game.draw, iterations))
+    game.dirty_rects = True
+    game.last_frame = None
+    record('draw_dirty', time_calls(game.draw, iterations))
+    game.dirty_rects = False
+
+    # apply_gravity: 서 있는 플레이어는 매 호출 같은 발판에 다시 착지하므로 상태가 유지됨
+    reset_world()
+    player = game.player
+    record('apply_gravity', time_calls(
+        lambda: Movement.apply_gravity(player, game.platforms), iterations))
+    platform_list = list(game.platforms)
+    record('apply_gravity_list', time_calls(
+        lambda: Movement.apply_gravity(player, platform_list), iterations))
+
+    # generate_platforms: 매번 화면 높이만큼 올라간 플레이어를 기준으로 새 발판 생성
+    reset_world()
+    record('generate_platforms_idle', time_calls(
+        game.generate_platforms, iterations))
+
+    def climb():
+        game.player.pos_y = game.platforms.highest.y + SCREEN_HEIGHT
+    record('generate_platforms', time_calls(
+        game.generate_platforms, iterations, setup=climb))
+
+    # generate_items: 실제 생성 확률과 매번 생성하는 경우
+    reset_world()
+    items = list(game.items)
+
+    def restore_items():
+        game.items = ItemIndex(items)
+    record('generate_items', time_calls(
+        game.generate_items, iterations, setup=restore_items))
+    rng = game.rng
+    game.rng = _AlwaysSpawn()
+    record('generate_items_spawn', time_calls(
+        game.generate_items, iterations, setup=restore_items))
+    game.rng = rng
+    return results
+
+
+def object_size(factory, count=1000):
+    """factory()로 만든 객체 하나가 차지하는 평균 메모리(바이트)를 tracemalloc으로 잽니다."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(objects)) / count
+
+
+def frame_allocation(game, frames):
+    """update 한 번이 일시적으로 할당하는 메모리(시작 대비 최고치, 바이트)의 프레임 평균입니다."""
+    tracemalloc.start()
+    total = 0
+    for _ in range(frames):
+        start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        game.update(0)
+        total += tracemalloc.get_traced_memory()[1] - start
+    tracemalloc.stop()
+    return total / frames
+
+
+def measure_memory(game, frames=200):
+    """
+    객체 하나당 메모리와 프레임당 할당량을 잽니다.
+    Returns:
+        dict: 항목 이름 -> 바이트
+    """
+    build_world(game, *SCENARIOS['items_50'])
+    return {
+        'platform_bytes': object_size(lambda: Platform(0, 0, PLATFORM_MAX_WIDTH)),
+        'moving_platform_bytes': object_size(
+            lambda: Platform(0, 0, PLATFORM_MAX_WIDTH, is_moving=True)),
+        'item_bytes': object_size(lambda: Item(0, 0, 'jump_boost')),
+        'player_bytes': object_size(lambda: Player(0, 0)),
+        'update_alloc_bytes': frame_allocation(game, frames),
+    }
+
+
+def run_benchmarks(scenarios=None, iterations=200, platform_store=False,
+                   difficulty="Normal", seed=0, analytic=False, lod=False,
+                   memory=False):
+    """
+    시나리오별 벤치마크를 실행합니다.
+    Returns:
+        dict: 실행 환경 정보(meta)와 측정 결과(results)
+    """
+    # 게임의 경고 출력이 JSON 출력과 섞이지 않도록 표준 오류로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        game = Game(headless=True, platform_store=platform_store, seed=seed,
+                    analytic=analytic, lod=lod)
+        game.start(difficulty)
+        results = []
+        for name in scenarios or SCENARIOS:
+            results.extend(bench_scenario(game, name, iterations))
+        report = {}
+        if memory:
+            report['memory'] = measure_memory(game)
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'pygame': pygame.version.ver,
+            'machine': platform_module.platform(),
+            'iterations': iterations,
+            'platform_store': platform_store,
+            'analytic': analytic,
+            'lod': lod,
+            'difficulty': difficulty,
+            'seed': seed,
+        },
+        'results': results,
+        **report,
+    }
+
+
+def compare(report, baseline):
+    """
+    두 실행 결과의 평균 시간을 (시나리오, 항목)별로 비교합니다.
+    Returns:
+        list[tuple]: (시나리오, 항목, 기준 평균, 현재 평균, 배율)
+    """
+    base = {(r['scenario'], r['op']): r['mean_us'] for r in baseline['results']}
+    rows = []
+    for r in report['results']:
+        key = (r['scenario'], r['op'])
+        if key in base:
+            ratio = r['mean_us'] / base[key] if base[key] > 0 else 0.0
+            rows.append((*key, base[key], r['mean_us'], ratio))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="핫 패스 벤치마크 (JSON 출력)")
+    parser.add_argument("--scenario", action="append",
+                        choices=list(SCENARIOS.keys()),
+                        help="실행할 시나리오 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--store", action="store_true",
+                        help="PlatformStore(NumPy)로 발판 관리")
+    parser.add_argument("--analytic", action="store_true",
+                        help="발판/아이템을 시각으로부터 직접 계산하는 분석 모드")
+    parser.add_argument("--lod", action="store_true",
+                        help="화면 주변 구간의 발판/아이템만 매 틱 업데이트하는 LOD 모드")
+    parser.add_argument("--memory", action="store_true",
+                        help="객체당 메모리와 프레임당 할당량(tracemalloc)도 측정")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.scenario, args.iterations, args.store,
+                            analytic=args.analytic, lod=args.lod,
+                            memory=args.memory)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for scenario, op, before, after, ratio in compare(report, baseline):
+            print(f"{scenario:16} {op:24} {before:10.1f}us -> "
+                  f"{after:10.1f}us  x{ratio:.2f}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import math
+from ..constants import *
+
+
+class Timer:
+    """TimerWheel에 예약된 콜백 하나입니다. cancel()로 취소할 수 있습니다."""
+    __slots__ = ('due', 'callback', 'cancelled')
+
+    def __init__(self, due, callback):
+        self.due = due  # 실행될 틱
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    틱 단위 계층형 타이머 휠입니다.
+    단계마다 TIMER_WHEEL_SLOTS개의 칸이 있고, 아래 단계 한 바퀴가 위 단계 한 칸이 됩니다.
+    먼 타이머는 위 단계에 두었다가 때가 가까워지면 아래 단계로 내려보내므로,
+    매 틱에는 이번 틱에 실행될 타이머만 처리합니다.
+    """
+    LEVELS = 4
+
+    def __init__(self, tick=0):
+        self.tick = tick  # 마지막으로 처리한 틱
+        self._bits = TIMER_WHEEL_SLOTS.bit_length() - 1
+        self._mask = TIMER_WHEEL_SLOTS - 1
+        self._wheels = [[[] for _ in range(TIMER_WHEEL_SLOTS)]
+                        for _ in range(self.LEVELS)]
+        self._overflow = []  # 휠 범위를 넘어서는 타이머
+
+    def schedule(self, due, callback):
+        """
+        due 틱에 callback(tick)을 실행하도록 예약합니다.
+        이미 지난 틱이면 다음 틱에 실행합니다.
+        Returns:
+            Timer: 취소할 때 사용하는 핸들
+        """
+        timer = Timer(max(due, self.tick + 1), callback)
+        self._insert(timer)
+        return timer
+
+    def _insert(self, timer):
+        delta = timer.due - self.tick
+        for level in range(self.LEVELS):
+            if delta < 1 << (self._bits * (level + 1)):
+                slot = (timer.due >> (self._bits * level)) & self._mask
+                self._wheels[level][slot].append(timer)
+                return
+        self._overflow.append(timer)
+
+    def advance(self):
+        """한 틱 진행하고 이번 틱에 도래한 타이머를 실행합니다."""
+        self.tick += 1
+        tick = self.tick
+
+        # 위 단계 칸의 시작 틱이면 그 칸의 타이머를 아래 단계로 내려보냄
+        for level in range(1, self.LEVELS + 1):
+            if tick & ((1 << (self._bits * level)) - 1):
+                break
+            if level == self.LEVELS:
+                timers, self._overflow = self._overflow, []
+            else:
+                slot = (tick >> (self._bits * level)) & self._mask
+                timers = self._wheels[level][slot]
+                self._wheels[level][slot] = []
+            for timer in timers:
+                if not timer.cancelled:
+                    self._insert(timer)
+
+        slot = tick & self._mask
+        timers = self._wheels[0][slot]
+        if timers:
+            self._wheels[0][slot] = []
+            for timer in timers:
+                if not timer.cancelled:
+                    timer.callback(tick)
+
+
+class SimClock:
+    """
+    판 하나의 시뮬레이션 시계입니다. Game.update가 advance()로 한 틱씩 진행하며,
+    시간에 따른 상태 전환은 timers에 예약해 두었다가 해당 틱에만 처리합니다.
+    한 틱의 길이는 1/rate초이고, 물리 계산은 틱마다 dt(FPS 기준 프레임 수)만큼 진행합니다.
+    """
+
+    def __init__(self, rate=SIM_RATE):
+        """
+        Args:
+            rate (int): 초당 틱 수 (Hz)
+        """
+        self.timers = TimerWheel()
+        self.rate = rate
+        self.dt = FPS / rate  # 한 틱에 진행하는 FPS 기준 프레임 수 (rate == FPS면 1)
+
+    @property
+    def tick(self):
+        """현재 틱 (판 시작 후 진행된 틱 수)"""
+        return self.timers.tick
+
+    @property
+    def time(self):
+        """현재 시뮬레이션 시간 (ms)"""
+        return self.timers.tick * 1000 / self.rate
+
+    def ticks(self, ms):
+        """ms를 틱 수로 바꿉니다. (올림, ms 이상 지난 첫 틱)"""
+        return math.ceil(ms * self.rate / 1000)
+
+    def advance(self):
+        """한 틱 진행합니다."""
+        self.timers.advance()
+
+    def call_later(self, ms, callback):
+        """
+        ms 뒤의 틱에 callback(tick)을 실행하도록 예약합니다.
+        Returns:
+            Timer: 취소할 때 사용하는 핸들
+        """
+        return self.timers.schedule(self.tick + self.ticks(ms), callback)
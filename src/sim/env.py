@@ -0,0 +1,412 @@
+import argparse
+import heapq
+import multiprocessing
+from bisect import insort
+import random
+import time
+from ..constants import *
+from ..config.difficulty_settings import DIFFICULTY_SETTINGS
+from ..game import Game
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 의존성
+    np = None
+
+
+# 행동 번호 -> 입력 비트
+ACTIONS = (
+    0,                         # 0: 가만히
+    INPUT_LEFT,                # 1: 왼쪽
+    INPUT_RIGHT,               # 2: 오른쪽
+    INPUT_JUMP,                # 3: 점프
+    INPUT_JUMP | INPUT_LEFT,   # 4: 점프 + 왼쪽
+    INPUT_JUMP | INPUT_RIGHT,  # 5: 점프 + 오른쪽
+)
+
+# 관측 벡터 구성 (값 개수)
+PLAYER_FEATURES = 9  # x, x 속도, y 속도, 공중 여부, 2단 점프 가능, 점프력/속도 배율, 키 반전, 슬라이딩
+PLATFORM_FEATURES = 7  # 있음, 왼쪽/오른쪽 끝 dx, dy, x 속도, 크기 변화 여부, 밟을 수 있음
+ITEM_FEATURES = 4  # 있음, dx, dy, 종류
+
+ITEM_TYPE_IDS = {name: index + 1 for index, name in enumerate(ITEM_TYPES)}
+
+
+class GameEnv:
+    """
+    한 판을 Gym 형식의 환경으로 감싼 클래스입니다.
+    화면을 그리지 않고 step()마다 한 틱을 진행하며, 관측은 플레이어 상태와
+    가장 가까운 발판/아이템들로 만든 고정 길이 실수 목록입니다.
+    보상은 최고 높이(점수)가 늘어난 만큼이고, 플레이어가 죽으면 판이 끝납니다.
+    """
+
+    def __init__(self, difficulty="Normal", num_platforms=5, num_items=3,
+                 max_steps=None, seed=None, game_options=None):
+        """
+        Args:
+            difficulty (str): 난이도 이름
+            num_platforms (int): 관측에 넣을 가까운 발판 수
+            num_items (int): 관측에 넣을 가까운 아이템 수
+            max_steps (int, optional): 한 판의 최대 틱 수. 넘으면 truncated
+            seed (int, optional): 판마다 시드를 뽑는 기준 시드
+            game_options (dict, optional): Game에 넘길 추가 옵션 (예: {'analytic': True})
+        """
+        self.game = Game(headless=True, seed=seed, **(game_options or {}))
+        self.game.profiler.enabled = False  # 단계별 시간 측정은 step 처리량만 떨어뜨림
+        self.difficulty = difficulty
+        self.num_platforms = num_platforms
+        self.num_items = num_items
+        self.max_steps = max_steps
+        self.observation_size = (PLAYER_FEATURES + num_platforms * PLATFORM_FEATURES +
+                                 num_items * ITEM_FEATURES)
+        self.action_count = len(ACTIONS)
+        self.steps = 0
+        self.best_height = 0
+
+    def reset(self, seed=None):
+        """
+        새 판을 시작합니다.
+        Args:
+            seed (int, optional): 이번 판의 시드. None이면 기준 시드에서 뽑음
+        Returns:
+            tuple: (관측, info)
+        """
+        self.game.start(self.difficulty, seed)
+        self.steps = 0
+        self.best_height = 0
+        return self.observe(), {'seed': self.game.seed}
+
+    def step(self, action):
+        """
+        행동 하나로 한 틱을 진행합니다.
+        Args:
+            action (int): ACTIONS의 번호
+        Returns:
+            tuple: (관측, 보상, terminated(죽음), truncated(max_steps 도달), info)
+        """
+        game = self.game
+        game.update(ACTIONS[action])
+        self.steps += 1
+        player = game.player
+        reward = player.max_height - self.best_height
+        self.best_height = player.max_height
+        terminated = player.is_dead
+        truncated = (not terminated and self.max_steps is not None and
+                     self.steps >= self.max_steps)
+        info = {'height': player.max_height, 'steps': self.steps}
+        return self.observe(), reward, terminated, truncated, info
+
+    def observe(self):
+        """
+        현재 상태의 관측을 만듭니다. 거리는 화면 크기, 속도는 기준 속도로 나눈 값입니다.
+        Returns:
+            list[float]: observation_size개의 값
+        """
+        game = self.game
+        player = game.player
+        px = player.pos_x
+        bottom = player.bottom
+        obs = [
+            px / SCREEN_WIDTH,
+            player.velocity_x / PLAYER_SPEED,
+            player.velocity_y / -JUMP_POWER,
+            float(player.is_jumping),
+            float(player.can_double_jump and not player.has_double_jumped),
+            player.jump_power_multiplier,
+            player.speed_multiplier,
+            float(player.is_key_reversed),
+            float(player.is_sliding),
+        ]
+
+        # 가까운 발판 (플레이어 바닥 기준 화면 높이 안쪽을 거리순으로)
+        platforms = game.platforms.near(bottom - SCREEN_HEIGHT, bottom + SCREEN_HEIGHT)
+        nearest = self.nearest_platforms(platforms, px, bottom)
+        for platform in nearest:
+            velocity = platform.speed * platform.direction if platform.is_moving else 0
+            obs += (1.0,
+                    (platform.x - px) / SCREEN_WIDTH,
+                    (platform.right - px) / SCREEN_WIDTH,
+                    (platform.y - bottom) / SCREEN_HEIGHT,
+                    velocity / PLAYER_SPEED,
+                    float(platform.is_transforming),
+                    float(not platform.is_vanish or platform.is_visible))
+        obs += [0.0] * (PLATFORM_FEATURES * (self.num_platforms - len(nearest)))
+
+        # 가까운 아이템 (아직 수집하지 않은 것만)
+        py = player.pos_y
+        items = [item for item in game.items.near(py - SCREEN_HEIGHT, py + SCREEN_HEIGHT)
+                 if not item.is_collected]
+        nearest = heapq.nsmallest(self.num_items, items,
+                                  key=lambda item: (item.pos_y - py) ** 2 +
+                                  (item.pos_x - px) ** 2)
+        for item in nearest:
+            obs += (1.0,
+                    (item.pos_x - px) / SCREEN_WIDTH,
+                    (item.pos_y - py) / SCREEN_HEIGHT,
+                    ITEM_TYPE_IDS.get(item.item_type, 0) / len(ITEM_TYPE_IDS))
+        obs += [0.0] * (ITEM_FEATURES * (self.num_items - len(nearest)))
+        return obs
+
+    def nearest_platforms(self, platforms, px, bottom):
+        """
+        y 순서로 정렬된 platforms(아래에서 위)에서 (px, bottom)에 가까운 발판을
+        num_platforms개까지 거리순으로 고릅니다. 거리가 같으면 platforms 순서를 따릅니다.
+        bottom에서 위아래로 y 거리가 가까운 쪽부터 나아가므로, y 거리만으로 이미 고른 발판보다
+        멀어지면 나머지는 볼 필요가 없습니다.
+        """
+        count = self.num_platforms
+        if count <= 0:
+            return []
+        above = len(platforms)
+        while above > 0 and platforms[above - 1].y < bottom:
+            above -= 1
+        below = above - 1
+        chosen = []  # (거리 제곱, platforms 안 순서, 발판), 거리순
+        while below >= 0 or above < len(platforms):
+            if above >= len(platforms) or (
+                    below >= 0 and platforms[below].y - bottom <= bottom - platforms[above].y):
+                index = below
+                below -= 1
+            else:
+                index = above
+                above += 1
+            platform = platforms[index]
+            dy = platform.y - bottom
+            if len(chosen) == count and dy * dy > chosen[-1][0]:
+                break
+            distance = dy * dy + max(platform.x - px, px - platform.right, 0) ** 2
+            if len(chosen) < count or (distance, index) < chosen[-1][:2]:
+                insort(chosen, (distance, index, platform))
+                del chosen[count:]
+        return [platform for _, _, platform in chosen]
+
+
+class _EnvGroup:
+    """한 프로세스 안에서 GameEnv 여러 개를 차례로 진행합니다. (끝난 판은 자동으로 다시 시작)"""
+
+    def __init__(self, count, seed, env_options):
+        self.envs = [GameEnv(seed=None if seed is None else seed + index, **env_options)
+                     for index in range(count)]
+
+    def reset(self, seed):
+        return [env.reset(None if seed is None else seed + index)
+                for index, env in enumerate(self.envs)]
+
+    def step(self, actions):
+        results = []
+        for env, action in zip(self.envs, actions):
+            obs, reward, terminated, truncated, info = env.step(action)
+            if terminated or truncated:
+                info['final_observation'] = obs
+                obs, reset_info = env.reset()
+                info['seed'] = reset_info['seed']
+            results.append((obs, reward, terminated, truncated, info))
+        return results
+
+    def step_many(self, action_rows):
+        """행동 목록(틱마다 환경 순서의 행동)만큼 여러 틱을 진행하고 틱별 결과 목록을 반환합니다."""
+        return [self.step(actions) for actions in action_rows]
+
+
+def _worker(conn, count, seed, env_options):
+    """작업 프로세스: 환경 묶음 하나를 만들고 파이프로 받은 명령을 처리합니다."""
+    group = _EnvGroup(count, seed, env_options)
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == 'step':
+                conn.send(group.step(data))
+            elif command == 'step_many':
+                conn.send(group.step_many(data))
+            elif command == 'reset':
+                conn.send(group.reset(data))
+            else:
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+
+class VectorEnv:
+    """
+    독립된 GameEnv num_envs개를 한 번에 진행하는 벡터 환경입니다.
+    관측/보상/종료 여부를 환경 순서대로 NumPy 배열로 묶어 반환합니다.
+    끝난 환경은 자동으로 다시 시작하고, 끝나기 직전의 관측은 info['final_observation']에 담습니다.
+    workers를 지정하면 환경들을 그 수만큼의 작업 프로세스에 나눠 병렬로 진행합니다.
+    작업 프로세스는 step마다 파이프 왕복(행동 전송, 결과 직렬화)이 한 번씩 생기고
+    환경 한 틱은 그보다 짧으므로, CPU 코어가 여러 개이고 작업 프로세스마다 환경이 많을 때만
+    현재 프로세스보다 빠릅니다. 행동을 미리 정할 수 있으면 step_many로 여러 틱을
+    왕복 한 번에 진행해 이 비용을 나눌 수 있습니다.
+    """
+
+    def __init__(self, num_envs, workers=0, seed=None, **env_options):
+        """
+        Args:
+            num_envs (int): 환경 수
+            workers (int): 작업 프로세스 수. 0이면 현재 프로세스에서 차례로 진행
+            seed (int, optional): 기준 시드. i번째 환경은 seed + i를 사용
+            **env_options: GameEnv에 넘길 옵션 (difficulty, num_platforms, ...)
+        """
+        if np is None:
+            raise ImportError("VectorEnv를 사용하려면 numpy가 필요합니다.")
+        self.num_envs = num_envs
+        self.action_count = len(ACTIONS)
+        num_platforms = env_options.get('num_platforms', 5)
+        num_items = env_options.get('num_items', 3)
+        self.observation_size = (PLAYER_FEATURES + num_platforms * PLATFORM_FEATURES +
+                                 num_items * ITEM_FEATURES)
+
+        # 환경을 작업 프로세스마다 고르게 나눔
+        workers = min(workers, num_envs)
+        self._groups = None
+        self._workers = []
+        if workers <= 0:
+            self._groups = [_EnvGroup(num_envs, seed, env_options)]
+            return
+        start = 0
+        for index in range(workers):
+            count = num_envs // workers + (1 if index < num_envs % workers else 0)
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker, daemon=True,
+                args=(child, count, None if seed is None else seed + start, env_options))
+            process.start()
+            child.close()
+            self._workers.append((parent, process, count))
+            start += count
+
+    def _call(self, command, per_group):
+        """환경 묶음마다 명령을 보내고(작업 프로세스는 동시에 진행) 묶음별 결과 목록을 반환합니다."""
+        if self._groups is not None:
+            return [getattr(self._groups[0], command)(per_group[0])]
+        for (conn, _, _), data in zip(self._workers, per_group):
+            conn.send((command, data))
+        return [conn.recv() for conn, _, _ in self._workers]
+
+    def _split(self, values):
+        """환경 순서의 값 목록을 환경 묶음별로 나눕니다."""
+        if self._groups is not None:
+            return [values]
+        chunks, start = [], 0
+        for _, _, count in self._workers:
+            chunks.append(values[start:start + count])
+            start += count
+        return chunks
+
+    def reset(self, seed=None):
+        """
+        모든 환경을 새로 시작합니다.
+        Args:
+            seed (int, optional): i번째 환경의 시드는 seed + i. None이면 각 환경의 기준 시드에서 뽑음
+        Returns:
+            tuple: (관측 배열 (num_envs, observation_size), info 목록)
+        """
+        if seed is None:
+            per_group = [None] * max(1, len(self._workers))
+        else:
+            per_group = [None if chunk is None else chunk[0]
+                         for chunk in self._split(list(range(seed, seed + self.num_envs)))]
+        results = [result for group in self._call('reset', per_group) for result in group]
+        obs = np.array([obs for obs, _ in results], dtype=np.float32)
+        return obs, [info for _, info in results]
+
+    def step(self, actions):
+        """
+        모든 환경을 행동 하나씩으로 한 틱 진행합니다.
+        Args:
+            actions (sequence[int]): 환경마다의 ACTIONS 번호
+        Returns:
+            tuple: (관측 배열, 보상 배열, terminated 배열, truncated 배열, info 목록)
+        """
+        per_group = self._split([int(action) for action in actions])
+        results = [result for group in self._call('step', per_group) for result in group]
+        obs, rewards, terminated, truncated, infos = zip(*results)
+        return (np.array(obs, dtype=np.float32),
+                np.array(rewards, dtype=np.float32),
+                np.array(terminated, dtype=bool),
+                np.array(truncated, dtype=bool),
+                list(infos))
+
+    def step_many(self, action_rows):
+        """
+        미리 정한 행동으로 여러 틱을 진행합니다. 작업 프로세스와는 왕복 한 번으로 처리합니다.
+        Args:
+            action_rows (sequence): 틱마다 환경 순서의 ACTIONS 번호 목록 (steps, num_envs)
+        Returns:
+            tuple: (관측 배열 (steps, num_envs, observation_size), 보상 배열,
+                terminated 배열, truncated 배열 (steps, num_envs), 틱별 info 목록)
+        """
+        rows = [self._split([int(action) for action in actions]) for actions in action_rows]
+        per_group = [[row[index] for row in rows] for index in range(max(1, len(self._workers)))]
+        groups = self._call('step_many', per_group)
+        # 틱마다 묶음별 결과를 환경 순서로 이어 붙인 뒤 값 종류별로 모음
+        obs, rewards, terminated, truncated, infos = zip(*(
+            zip(*[result for group in groups for result in group[step]])
+            for step in range(len(rows))))
+        return (np.array(obs, dtype=np.float32),
+                np.array(rewards, dtype=np.float32),
+                np.array(terminated, dtype=bool),
+                np.array(truncated, dtype=bool),
+                [list(step_infos) for step_infos in infos])
+
+    def close(self):
+        """작업 프로세스를 종료합니다."""
+        for conn, process, _ in self._workers:
+            try:
+                conn.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+            process.join()
+        self._workers = []
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벡터 환경 처리량 측정 (무작위 행동)")
+    parser.add_argument("--envs", type=int, default=8)
+    parser.add_argument("--steps", type=int, default=5000, help="환경마다 진행할 틱 수")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="작업 프로세스 수 (0이면 현재 프로세스에서 진행)")
+    parser.add_argument("--batch", type=int, default=1,
+                        help="작업 프로세스와 한 번 왕복할 때 진행할 틱 수 (step_many)")
+    parser.add_argument("--difficulty", default="Normal",
+                        choices=list(DIFFICULTY_SETTINGS.keys()))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--analytic", action="store_true",
+                        help="발판/아이템 상태를 시각으로부터 직접 계산하는 분석 모드")
+    parser.add_argument("--lod", action="store_true",
+                        help="화면 주변 구간의 발판/아이템만 매 틱 업데이트")
+    args = parser.parse_args(argv)
+
+    env = VectorEnv(args.envs, workers=args.workers, seed=args.seed,
+                    difficulty=args.difficulty,
+                    game_options={'analytic': args.analytic, 'lod': args.lod})
+    rng = random.Random(args.seed)
+    env.reset(args.seed)
+    episodes = 0
+    best_height = 0
+    start = time.perf_counter()
+    for first in range(0, args.steps, args.batch):
+        rows = [[rng.randrange(env.action_count) for _ in range(args.envs)]
+                for _ in range(min(args.batch, args.steps - first))]
+        if len(rows) == 1:
+            _, _, terminated, truncated, infos = env.step(rows[0])
+            terminated, truncated, infos = terminated[None], truncated[None], [infos]
+        else:
+            _, _, terminated, truncated, infos = env.step_many(rows)
+        for step_done, step_infos in zip(terminated | truncated, infos):
+            for done, info in zip(step_done, step_infos):
+                best_height = max(best_height, info['height'])
+                episodes += bool(done)
+    elapsed = time.perf_counter() - start
+    env.close()
+
+    total = args.envs * args.steps
+    print(f"{args.envs} envs x {args.steps} steps in {elapsed:.2f}s "
+          f"({total / elapsed:.0f} steps/s), workers={args.workers}, batch={args.batch}, "
+          f"episodes={episodes}, best={best_height}m, obs={env.observation_size}")
+
+
+if __name__ == "__main__":
+    main()
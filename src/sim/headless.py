@@ -0,0 +1,150 @@
+import argparse
+import os
+import time
+from ..constants import *
+from ..config.difficulty_settings import DIFFICULTY_SETTINGS
+from ..game import Game
+from .autoplayer import AutoPlayer
+
+
+def climb_script(frame, game):
+    """
+    기본 스크립트 입력: 착지해 있으면 점프하고, 90프레임마다 좌우 방향을 바꿉니다.
+    Args:
+        frame (int): 현재 프레임 번호
+        game (Game): 실행 중인 게임
+    Returns:
+        int: 입력 비트 마스크
+    """
+    input_bits = INPUT_RIGHT if (frame // 90) % 2 == 0 else INPUT_LEFT
+    if not game.player.is_jumping:
+        input_bits |= INPUT_JUMP
+    return input_bits
+
+
+class HeadlessRunner:
+    def __init__(self, difficulty="Normal", script=None, auto_reset=True,
+                 game_options=None):
+        """
+        화면 없이 고정 스텝으로 게임을 실행하는 러너를 초기화합니다.
+        Args:
+            difficulty (str): 난이도 이름 ("Easy", "Normal", "Hard")
+            script (callable, optional): (frame, game) -> 입력 비트. None이면 climb_script
+            auto_reset (bool): 플레이어가 죽으면 자동으로 게임을 다시 시작할지 여부
+            game_options (dict, optional): Game에 넘길 추가 옵션 (예: {'analytic': True})
+        """
+        self.game = Game(headless=True, **(game_options or {}))
+        self.game.start(difficulty)
+        self.difficulty = difficulty
+        self.script = script or climb_script
+        self.auto_reset = auto_reset
+
+    def run(self, frames):
+        """
+        지정한 프레임 수만큼 draw() 없이 최대한 빠르게 update()를 반복합니다.
+        Args:
+            frames (int): 시뮬레이션할 프레임 수
+        Returns:
+            dict: 프레임 수, 경과 시간, 초당 시뮬레이션 프레임, 사망 횟수, 최고 높이, 객체 풀 통계
+        """
+        game = self.game
+        script = self.script
+        deaths = 0
+        best_height = 0
+        simulated = 0
+
+        start = time.perf_counter()
+        for frame in range(frames):
+            if game.player.is_dead:
+                deaths += 1
+                best_height = max(best_height, game.player.max_height)
+                if not self.auto_reset:
+                    break
+                game.reset_game()
+                if hasattr(script, 'reset'):
+                    script.reset()  # AutoPlayer처럼 판마다 상태를 갖는 스크립트
+            game.update(script(frame, game))
+            simulated += 1
+        elapsed = time.perf_counter() - start
+
+        best_height = max(best_height, game.player.max_height)
+        updated = game.profiler.counters.get('updated_objects')
+        return {
+            'difficulty': self.difficulty,
+            'frames': simulated,
+            'elapsed': elapsed,
+            'fps': simulated / elapsed if elapsed > 0 else 0.0,
+            'deaths': deaths,
+            'best_height': best_height,
+            'updated_per_frame': updated.mean() if updated else 0.0,  # 최근 프레임 평균
+            'pools': game.pool_stats(),
+        }
+
+
+def _numbered(path, run_index, runs):
+    """여러 번 실행할 때 결과 파일 이름에 실행 번호를 붙입니다."""
+    if runs == 1:
+        return path
+    base, ext = os.path.splitext(path)
+    return f"{base}-{run_index}{ext}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="헤드리스 배치 시뮬레이션")
+    parser.add_argument("--frames", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--difficulty", default="Normal",
+                        choices=list(DIFFICULTY_SETTINGS.keys()))
+    parser.add_argument("--analytic", action="store_true",
+                        help="발판/아이템 상태를 시각으로부터 직접 계산하는 분석 모드")
+    parser.add_argument("--lod", action="store_true",
+                        help="화면 주변 구간의 발판/아이템만 매 틱 업데이트")
+    parser.add_argument("--item-placement", choices=['frame', 'chunk'], default='frame',
+                        help="아이템 배치 방식 (매 프레임 생성 또는 청크 생성 시 배치)")
+    parser.add_argument("--sim-rate", type=int, default=SIM_RATE,
+                        help="초당 시뮬레이션 틱 수 (낮추면 같은 게임 시간을 더 적은 틱으로 계산)")
+    parser.add_argument("--swept", action="store_true", default=None,
+                        help="착지를 틱 동안의 움직임 전체로 검사 (기본: sim-rate가 FPS보다 낮을 때만)")
+    parser.add_argument("--auto", action="store_true",
+                        help="climb_script 대신 계획 자동 플레이어(AutoPlayer)로 입력")
+    parser.add_argument("--profile", action="store_true",
+                        help="단계별 시간 통계(p50/p95/p99) 출력")
+    parser.add_argument("--trace", help="Chrome trace-event JSON 저장 경로")
+    parser.add_argument("--cprofile", help="cProfile 결과(.prof) 저장 경로")
+    args = parser.parse_args(argv)
+
+    for run_index in range(args.runs):
+        runner = HeadlessRunner(args.difficulty,
+                                script=AutoPlayer() if args.auto else None,
+                                game_options={'analytic': args.analytic,
+                                              'lod': args.lod,
+                                              'item_placement': args.item_placement,
+                                              'sim_rate': args.sim_rate,
+                                              'swept_collision': args.swept})
+        profiler = runner.game.profiler
+        if args.trace:
+            profiler.start_trace()
+        if args.cprofile:
+            profiler.start_cprofile()
+        result = runner.run(args.frames)
+        if args.cprofile:
+            profiler.stop_cprofile(
+                _numbered(args.cprofile, run_index, args.runs))
+        if args.trace:
+            profiler.stop_trace(_numbered(args.trace, run_index, args.runs))
+
+        print(f"[run {run_index}] {result['difficulty']}: "
+              f"{result['frames']} frames in {result['elapsed']:.2f}s "
+              f"({result['fps']:.0f} fps), deaths={result['deaths']}, "
+              f"best={result['best_height']}m, "
+              f"updated/frame={result['updated_per_frame']:.1f}")
+        pools = result['pools']
+        print("  pools: " + ", ".join(
+            f"{name} created={stats['created']} reused={stats['reused']}"
+            for name, stats in pools.items()))
+        if args.profile:
+            print(profiler.format_summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+import cProfile
+import json
+import pstats
+import time
+from array import array
+from collections import deque
+from ..constants import *
+
+
+class RingBuffer:
+    """
+    최근 capacity개의 측정값만 보관하는 고정 크기 버퍼입니다.
+    가득 차면 가장 오래된 값을 덮어쓰므로 메모리 사용량이 늘지 않습니다.
+    """
+
+    def __init__(self, capacity=PROFILER_HISTORY_SIZE):
+        self.capacity = capacity
+        self._values = array('d', bytes(8 * capacity))
+        self._index = 0  # 다음에 쓸 위치
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value):
+        """값을 추가합니다."""
+        self._values[self._index] = value
+        self._index = (self._index + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def values(self, last=None):
+        """
+        오래된 값부터 순서대로 반환합니다.
+        Args:
+            last (int, optional): 최근 last개만 반환
+        """
+        count = self._count if last is None else min(last, self._count)
+        start = (self._index - count) % self.capacity
+        if start + count <= self.capacity:
+            return self._values[start:start + count].tolist()
+        return (self._values[start:].tolist() +
+                self._values[:self._index].tolist())
+
+    def mean(self, last=None):
+        """평균을 반환합니다. 값이 없으면 0."""
+        values = self.values(last)
+        return sum(values) / len(values) if values else 0.0
+
+    def percentile(self, q):
+        """q(0~100) 백분위수를 반환합니다. 값이 없으면 0."""
+        values = sorted(self.values())
+        if not values:
+            return 0.0
+        index = min(len(values) - 1, int(len(values) * q / 100))
+        return values[index]
+
+    def clear(self):
+        self._index = 0
+        self._count = 0
+
+
+class FrameProfiler:
+    """
+    프레임을 단계(phase)별로 나누어 시간을 재는 프로파일러입니다.
+    mark()로 기준 시각을 잡고 단계가 끝날 때마다 lap(이름)을 호출하면
+    직전 기준 시각부터의 시간이 해당 단계의 링 버퍼에 기록됩니다.
+    추적(trace) 중에는 각 구간을 Chrome trace-event 형식으로 내보낼 수 있습니다.
+    """
+
+    def __init__(self, capacity=PROFILER_HISTORY_SIZE, enabled=True):
+        """
+        Args:
+            capacity (int): 단계/카운터마다 보관할 최근 측정값 수
+            enabled (bool): False면 측정하지 않음
+        """
+        self.capacity = capacity
+        self.enabled = enabled
+        self.phases = {}  # 단계 이름 -> RingBuffer (초)
+        self.counters = {}  # 카운터 이름 -> RingBuffer
+        self._mark = time.perf_counter()
+        self._trace = None  # 추적 중이면 (이름, 시작, 길이) deque
+        self._trace_counters = None
+        self._trace_origin = 0.0
+        self._cprofile = None
+
+    def mark(self):
+        """단계 측정의 기준 시각을 현재로 잡고 그 시각을 반환합니다."""
+        self._mark = time.perf_counter()
+        return self._mark
+
+    def lap(self, name):
+        """직전 기준 시각부터 지금까지를 name 단계로 기록하고 기준 시각을 옮깁니다."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.record(name, now - self._mark, self._mark)
+        self._mark = now
+
+    def since(self, name, start):
+        """start 시각부터 지금까지를 name 단계로 기록합니다. (여러 단계를 묶은 구간용)"""
+        if not self.enabled:
+            return
+        self.record(name, time.perf_counter() - start, start)
+
+    def record(self, name, duration, start=None):
+        """
+        단계 하나의 측정값을 기록합니다.
+        Args:
+            name (str): 단계 이름
+            duration (float): 걸린 시간 (초)
+            start (float, optional): 시작 시각 (perf_counter 기준, 추적용)
+        """
+        buffer = self.phases.get(name)
+        if buffer is None:
+            buffer = self.phases[name] = RingBuffer(self.capacity)
+        buffer.append(duration)
+        if self._trace is not None and start is not None:
+            self._trace.append((name, start, duration))
+
+    def counter(self, name, value):
+        """발판 수 같은 카운터 값을 기록합니다."""
+        if not self.enabled:
+            return
+        buffer = self.counters.get(name)
+        if buffer is None:
+            buffer = self.counters[name] = RingBuffer(self.capacity)
+        buffer.append(value)
+        if self._trace_counters is not None:
+            self._trace_counters.append((name, time.perf_counter(), value))
+
+    def summary(self):
+        """
+        단계별 통계를 반환합니다.
+        Returns:
+            dict: 단계 이름 -> {count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}
+        """
+        result = {}
+        for name, buffer in self.phases.items():
+            values = buffer.values()
+            result[name] = {
+                'count': len(values),
+                'mean_ms': buffer.mean() * 1000,
+                'p50_ms': buffer.percentile(50) * 1000,
+                'p95_ms': buffer.percentile(95) * 1000,
+                'p99_ms': buffer.percentile(99) * 1000,
+                'max_ms': max(values) * 1000 if values else 0.0,
+            }
+        return result
+
+    def format_summary(self):
+        """summary()를 표 형태의 문자열로 만듭니다."""
+        lines = [f"{'phase':20} {'count':>6} {'mean':>8} {'p50':>8} "
+                 f"{'p95':>8} {'p99':>8} {'max':>8}  (ms)"]
+        for name, stats in sorted(self.summary().items()):
+            lines.append(f"{name:20} {stats['count']:6d} {stats['mean_ms']:8.3f} "
+                         f"{stats['p50_ms']:8.3f} {stats['p95_ms']:8.3f} "
+                         f"{stats['p99_ms']:8.3f} {stats['max_ms']:8.3f}")
+        if self.counters:
+            lines.append(f"{'counter':20} {'count':>6} {'mean':>8} {'max':>8} {'last':>8}")
+            for name, buffer in sorted(self.counters.items()):
+                values = buffer.values()
+                lines.append(f"{name:20} {len(values):6d} {buffer.mean():8.1f} "
+                             f"{max(values):8.1f} {values[-1]:8.1f}")
+        return "\n".join(lines)
+
+    @property
+    def tracing(self):
+        return self._trace is not None
+
+    def start_trace(self, max_events=PROFILER_TRACE_EVENTS):
+        """단계 구간 추적을 시작합니다. 최근 max_events개의 구간만 보관합니다."""
+        self._trace = deque(maxlen=max_events)
+        self._trace_counters = deque(maxlen=max_events)
+        self._trace_origin = time.perf_counter()
+
+    def stop_trace(self, path=None):
+        """
+        추적을 멈추고 Chrome trace-event 형식의 딕셔너리를 반환합니다.
+        Args:
+            path (str, optional): 지정하면 JSON 파일로 저장 (chrome://tracing, Perfetto에서 열 수 있음)
+        """
+        if self._trace is None:
+            return None
+        origin = self._trace_origin
+        events = [{'name': name, 'ph': 'X', 'pid': 1, 'tid': 1,
+                   'ts': (start - origin) * 1e6, 'dur': duration * 1e6}
+                  for name, start, duration in self._trace]
+        events.extend({'name': name, 'ph': 'C', 'pid': 1,
+                       'ts': (at - origin) * 1e6, 'args': {name: value}}
+                      for name, at, value in self._trace_counters)
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms'}
+        self._trace = None
+        self._trace_counters = None
+        if path is not None:
+            with open(path, 'w') as f:
+                json.dump(trace, f)
+        return trace
+
+    @property
+    def profiling(self):
+        return self._cprofile is not None
+
+    def start_cprofile(self):
+        """cProfile 수집을 시작합니다."""
+        self._cprofile = cProfile.Profile()
+        self._cprofile.enable()
+
+    def stop_cprofile(self, path=None):
+        """
+        cProfile 수집을 멈추고 pstats.Stats를 반환합니다.
+        Args:
+            path (str, optional): 지정하면 .prof 파일로 저장 (snakeviz 등에서 열 수 있음)
+        """
+        if self._cprofile is None:
+            return None
+        profile = self._cprofile
+        profile.disable()
+        self._cprofile = None
+        if path is not None:
+            profile.dump_stats(path)
+        return pstats.Stats(profile)
+
+    def clear(self):
+        """기록된 측정값을 모두 비웁니다."""
+        self.phases.clear()
+        self.counters.clear()
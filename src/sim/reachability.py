@@ -0,0 +1,381 @@
+import argparse
+import heapq
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections import Counter
+from ..constants import *
+from ..config.difficulty_settings import DIFFICULTY_SETTINGS
+from ..objects.platform import Platform
+from ..objects.pool import ObjectPool
+from ..objects.world_stream import platform_stream
+from .clock import SimClock
+
+
+# 플레이어 중심이 있을 수 있는 x 범위 (Movement.move_horizontal의 화면 경계 처리)
+PLAYER_MIN_X = PLAYER_WIDTH / 2
+PLAYER_MAX_X = SCREEN_WIDTH - PLAYER_WIDTH / 2
+
+INITIAL_PLATFORMS = 10  # Game.reset_game이 처음에 만드는 발판 수
+DEFAULT_HORIZON = 900  # 발판 위에서 기다릴 수 있는 최대 틱 수 (15초)
+
+_pool = ObjectPool(Platform)  # 검사용 체인의 발판 풀 (프로세스마다 하나)
+
+
+def jump_offset(n, jump_power=JUMP_POWER):
+    """
+    점프한 틱을 1번째로 세어 n번째 틱이 끝났을 때 플레이어 바닥의 y 변화량입니다. (위가 음수)
+    매 틱 velocity_y += GRAVITY, pos_y += velocity_y로 진행하는 궤적 (dt == 1)입니다.
+    """
+    return n * jump_power + GRAVITY * n * (n + 1) / 2
+
+
+def jump_apex(jump_power=JUMP_POWER):
+    """
+    점프 궤적의 최고점을 구합니다.
+    Returns:
+        tuple: (마지막으로 올라가는 틱, 최고 높이)
+    """
+    tick = int(-jump_power / GRAVITY)
+    return tick, -min(jump_offset(tick, jump_power), jump_offset(tick + 1, jump_power))
+
+
+# 기본 점프 궤적의 최고 높이 (연속 공식의 MAX_JUMP_HEIGHT보다 약간 낮음)
+APEX_TICK, JUMP_APEX = jump_apex()
+
+
+def landing_tick(height, jump_power=JUMP_POWER):
+    """
+    height만큼 위에 있는 발판 상단을 플레이어 바닥이 내려오면서 지나는 틱을 구합니다.
+    Movement.apply_gravity는 이 틱에만 착지를 검사하므로 착지 여부는 이 틱의 x로 정해집니다.
+    Args:
+        height (float): 발판 상단까지의 높이 (이전 발판 상단 기준, 위가 양수)
+        jump_power (float): 점프 속도 (점프력 버프가 있으면 JUMP_POWER * 배율)
+    Returns:
+        int | None: 점프한 틱을 1로 센 착지 틱. 점프 최고 높이보다 높으면 None
+    """
+    if jump_power == JUMP_POWER:
+        apex_tick, apex = APEX_TICK, JUMP_APEX
+    else:
+        apex_tick, apex = jump_apex(jump_power)
+    if height > apex:
+        return None
+    # jump_offset(n) >= -height를 만족하는 내려오는 구간의 첫 n (이차방정식의 큰 근)
+    b = jump_power + GRAVITY / 2
+    n = max(apex_tick, math.ceil((-b + math.sqrt(b * b - 2 * GRAVITY * height)) / GRAVITY))
+    while jump_offset(n, jump_power) < -height:  # 부동소수점 오차 보정
+        n += 1
+    while n > apex_tick and jump_offset(n - 1, jump_power) >= -height:
+        n -= 1
+    return n
+
+
+def platform_kind(platform):
+    """발판 종류 이름을 반환합니다."""
+    if platform.is_moving:
+        return 'moving'
+    if platform.is_transforming:
+        return 'transforming'
+    if platform.is_vanish:
+        return 'vanish'
+    return 'static'
+
+
+def _envelope(platform):
+    """발판이 시간에 따라 차지할 수 있는 가장 넓은 x 범위를 반환합니다."""
+    if platform.is_moving:
+        return 0, SCREEN_WIDTH
+    if platform.is_transforming:
+        width = platform.initial_width
+        x = min(max(platform.center - width / 2, 0), SCREEN_WIDTH - width)
+        return x, x + width
+    return platform.x, platform.x + platform.base_width
+
+
+def _shortfall(source, target, reach):
+    """
+    source 범위에서 출발해 target 범위에 플레이어 중심을 놓기까지 모자란 거리를 구합니다.
+    Returns:
+        tuple: (모자란 거리, 원인). 0 이하면 도달 가능.
+            target이 플레이어가 갈 수 없는 화면 가장자리에 있으면 원인은 'edge'
+    """
+    left, right = max(target[0], PLAYER_MIN_X), min(target[1], PLAYER_MAX_X)
+    if left > right:
+        return left - right, 'edge'
+    start_left, start_right = max(source[0], PLAYER_MIN_X), min(source[1], PLAYER_MAX_X)
+    return max(left - start_right, start_left - right, 0) - reach, 'distance'
+
+
+def check_pair(source, target, horizon=DEFAULT_HORIZON, start=0):
+    """
+    source 발판에서 점프 한 번으로 target 발판에 착지할 수 있는지 확인합니다.
+    플레이어는 source가 보이는 동안 source 위 어디에서든 원하는 틱에 점프할 수 있고,
+    공중에서 매 틱 PLAYER_SPEED씩 좌우로 움직일 수 있다고 봅니다. (아이템 버프 없음)
+    움직이는/변형/사라지는 발판은 state_at으로 점프 틱과 착지 틱의 상태를 계산해
+    start부터 horizon 틱 동안의 모든 점프 시점을 검사합니다.
+    움직이는 발판은 착지 검사 뒤에 플레이어를 한 틱만큼 더 옮기므로(Movement.apply_gravity)
+    옮겨진 위치도 발판 위(is_point_above의 여유 2px)여야 서 있는 상태가 되어 다시 점프할 수 있습니다.
+    그럴 수 없는 좁은 발판(is_carry_trap)에서는 화면 끝에서 방향을 바꾸는 틱에만 점프할 수 있습니다.
+    Args:
+        source (Platform): 출발 발판
+        target (Platform): 착지할 발판
+        horizon (int): 검사할 점프 틱의 범위
+        start (int): 처음 검사할 점프 틱 (실행 중인 게임에서는 현재 틱)
+    Returns:
+        tuple: (도달 가능 여부, 모자란 거리(px), 원인, 점프 틱)
+            원인은 'height', 'edge', 'distance', 'timing'(위치는 맞지만 그때 사라져 있음),
+            'carry'(source가 is_carry_trap이라 방향을 바꿀 때만 점프할 수 있는데 그때는 닿지 않음) 중 하나
+    """
+    height = source.y - target.y
+    n = landing_tick(height)
+    if n is None:
+        return False, height - JUMP_APEX, 'height', None
+    reach = PLAYER_SPEED * n
+
+    # 시간에 따른 가장 넓은 범위로도 닿지 않으면 검사할 필요가 없음
+    shortfall, reason = _shortfall(_envelope(source), _envelope(target), reach)
+    if shortfall > 0:
+        return False, shortfall, reason, None
+    dynamic = [platform for platform in (source, target)
+               if platform.is_moving or platform.is_transforming or platform.is_vanish]
+    if not dynamic:
+        return True, shortfall, reason, 0
+
+    best = math.inf
+    best_reason = reason
+    source_trap = is_carry_trap(source)
+    target_trap = is_carry_trap(target)
+    # 좁은 움직이는 발판에서는 방향을 바꾸는 틱에만 서 있는 상태가 되어 점프할 수 있음
+    if source_trap:
+        ticks = _bounce_ticks(source, start, start + horizon)
+    else:
+        ticks = range(start, start + horizon)
+    for tick in ticks:
+        x, _, width, _, source_visible, _ = source.state_at(tick)
+        target_x, direction, target_width, _, target_visible, _ = target.state_at(tick + n)
+        left, right = target_x, target_x + target_width
+        if target.is_moving and not target_trap:
+            # 착지한 뒤 옮겨진 위치에서도 서 있을 수 있는 범위
+            carry = target.speed * direction
+            left, right = left + max(0, -2 - carry), right + min(0, 2 - carry)
+        shortfall, reason = _shortfall((x, x + width), (left, right), reach)
+        if shortfall < best:
+            best, best_reason = shortfall, reason
+        if source_visible and target_visible:
+            if shortfall <= 0:
+                return True, shortfall, reason, tick
+    if source_trap:
+        return False, max(best, 0), 'carry', None
+    if best <= 0:
+        return False, 0, 'timing', None
+    return False, best, best_reason, None
+
+
+def is_carry_trap(platform):
+    """
+    움직이는 발판이 한 틱에 플레이어를 옮기는 거리가 너비와 여유(2px)를 넘어서
+    착지해도 서 있는 상태가 되지 못하는지(방향을 바꿀 때까지 점프할 수 없는지) 반환합니다.
+    """
+    return platform.is_moving and platform.speed - 2 > platform.base_width
+
+
+def _bounce_ticks(platform, start, stop):
+    """움직이는 발판이 화면 끝에서 방향을 바꾸는 틱들을 start 뒤부터 stop 전까지 차례로 냅니다."""
+    x, direction = platform.state_at(start)[:2]
+    speed = platform.speed * platform.clock.dt
+    span = SCREEN_WIDTH - platform.base_width
+    tick = start + math.ceil((span - x if direction == 1 else x) / speed)
+    half = max(1, math.ceil(span / speed))  # 한쪽 끝에서 반대쪽 끝까지의 틱 수 (motion.bounce)
+    while tick < stop:
+        # 부동소수점 오차에 대비해 주변 틱에서 실제로 방향이 바뀐 틱을 찾음
+        for candidate in (tick, tick - 1, tick + 1):
+            if start < candidate < stop and (platform.state_at(candidate)[1] !=
+                                             platform.state_at(candidate - 1)[1]):
+                yield candidate
+                break
+        tick += half
+
+
+def activate(difficulty, seed):
+    """
+    발판 생성에 쓰는 Platform의 공유 상태를 검사용으로 설정합니다. (Game.activate와 같은 역할)
+    분석 모드로 설정해 사라짐 타이머를 예약하지 않고 state_at으로만 상태를 계산합니다.
+    """
+    Platform.rng = random.Random(seed)
+    Platform.clock = SimClock(FPS)
+    Platform.analytic = True
+    Platform.current_difficulty = DIFFICULTY_SETTINGS[difficulty]
+    Platform.width_override = None
+    Platform.pool = _pool
+
+
+def generate_chain(difficulty, seed, length):
+    """
+    게임과 같은 순서로 발판을 length개 만듭니다.
+    Game.reset_game처럼 초기 발판을 만든 뒤 그 위로는 platform_stream으로 이어 붙입니다.
+    Returns:
+        list[Platform]: 아래에서 위 순서의 발판들 (다 쓰면 release_chain으로 돌려줌)
+    """
+    activate(difficulty, seed)
+    chain = Platform.create_initial_platforms(min(length, INITIAL_PLATFORMS))
+    if length > len(chain):
+        highest = chain[-1]
+        stream = platform_stream(highest.x, highest.y, highest.initial_width)
+        chain.extend(next(stream) for _ in range(length - len(chain)))
+    return chain
+
+
+def release_chain(chain):
+    """검사가 끝난 발판들을 풀에 돌려줍니다."""
+    for platform in chain:
+        Platform.pool.release(platform)
+
+
+def check_chain(difficulty, seed, length, horizon=DEFAULT_HORIZON):
+    """
+    발판 체인의 이웃한 발판 쌍마다 check_pair로 도달 가능 여부를 확인합니다.
+    생성 규칙상 발판 간격이 점프 최고 높이의 절반보다 크므로 두 칸 위 발판에는
+    직접 닿을 수 없고, 한 쌍이라도 도달할 수 없으면 체인을 끝까지 오를 수 없습니다.
+    Returns:
+        list[dict]: 도달할 수 없는 발판 쌍의 정보
+    """
+    chain = generate_chain(difficulty, seed, length)
+    failures = []
+    for index in range(len(chain) - 1):
+        source, target = chain[index], chain[index + 1]
+        reachable, shortfall, reason, _ = check_pair(source, target, horizon)
+        if not reachable:
+            failures.append({
+                'difficulty': difficulty,
+                'seed': seed,
+                'index': index,
+                'reason': reason,
+                'shortfall': round(shortfall, 1),
+                'kinds': f"{platform_kind(source)}->{platform_kind(target)}",
+                'height': round(source.y - target.y, 1),
+                'dx': round(target.x - source.x, 1),
+                'widths': (source.initial_width, target.initial_width),
+            })
+    release_chain(chain)
+    return failures
+
+
+def _severity(case):
+    """최악 사례 정렬 키: 모자란 거리가 클수록, 같으면 시드와 순번이 작을수록 앞"""
+    return case['shortfall'], -case['seed'], -case['index']
+
+
+def _sweep_batch(task):
+    """
+    작업 프로세스: 시드 범위 하나의 체인들을 검사하고 집계를 반환합니다.
+    Args:
+        task (tuple): (난이도, 시작 시드, 체인 수, 체인 길이, horizon, 보고할 최악 사례 수)
+    """
+    difficulty, seed, count, length, horizon, worst = task
+    reasons = Counter()
+    kinds = Counter()
+    failed_chains = 0
+    cases = []
+    for chain_seed in range(seed, seed + count):
+        failures = check_chain(difficulty, chain_seed, length, horizon)
+        failed_chains += bool(failures)
+        for failure in failures:
+            reasons[failure['reason']] += 1
+            kinds[failure['kinds']] += 1
+        cases = heapq.nlargest(worst, cases + failures, key=_severity)
+    return {
+        'difficulty': difficulty,
+        'chains': count,
+        'pairs': count * (length - 1),
+        'failed_chains': failed_chains,
+        'reasons': reasons,
+        'kinds': kinds,
+        'worst': cases,
+    }
+
+
+def sweep(difficulties, chains, length, workers=0, seed=0, horizon=DEFAULT_HORIZON,
+          worst=5, batch=200):
+    """
+    난이도마다 chains개의 체인을 만들어 검사하고 결과를 난이도별로 합칩니다.
+    체인 i의 시드는 seed + i이므로 결과에 나온 시드로 같은 체인을 다시 만들 수 있습니다.
+    Args:
+        difficulties (list[str]): 검사할 난이도 이름들
+        chains (int): 난이도마다 검사할 체인 수
+        length (int): 체인의 발판 수
+        workers (int): 작업 프로세스 수. 0이면 현재 프로세스에서 검사
+        seed (int): 시작 시드
+        horizon (int): check_pair의 점프 틱 범위
+        worst (int): 난이도마다 보고할 최악 사례 수
+        batch (int): 작업 하나가 검사하는 체인 수
+    Returns:
+        dict: 난이도 이름 -> 집계 (chains, pairs, failed_chains, reasons, kinds, worst)
+    """
+    tasks = [(difficulty, start, min(batch, seed + chains - start), length, horizon, worst)
+             for difficulty in difficulties
+             for start in range(seed, seed + chains, batch)]
+    if workers > 0:
+        with multiprocessing.Pool(workers) as pool:
+            results = list(pool.imap_unordered(_sweep_batch, tasks))
+    else:
+        results = [_sweep_batch(task) for task in tasks]
+
+    totals = {}
+    for result in results:
+        total = totals.setdefault(result['difficulty'], {
+            'chains': 0, 'pairs': 0, 'failed_chains': 0,
+            'reasons': Counter(), 'kinds': Counter(), 'worst': []})
+        for key in ('chains', 'pairs', 'failed_chains', 'reasons', 'kinds'):
+            total[key] += result[key]
+        total['worst'] = heapq.nlargest(worst, total['worst'] + result['worst'],
+                                        key=_severity)
+    return {difficulty: totals[difficulty] for difficulty in difficulties}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="발판 생성기의 도달 가능성 검사")
+    parser.add_argument("--difficulty", action="append",
+                        choices=list(DIFFICULTY_SETTINGS.keys()),
+                        help="검사할 난이도 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--chains", type=int, default=10000, help="난이도마다 검사할 체인 수")
+    parser.add_argument("--length", type=int, default=100, help="체인의 발판 수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="작업 프로세스 수 (0이면 현재 프로세스에서 검사)")
+    parser.add_argument("--seed", type=int, default=0, help="시작 시드")
+    parser.add_argument("--horizon", type=int, default=DEFAULT_HORIZON,
+                        help="발판 위에서 기다릴 수 있는 최대 틱 수")
+    parser.add_argument("--worst", type=int, default=5, help="난이도마다 보고할 최악 사례 수")
+    args = parser.parse_args(argv)
+
+    difficulties = args.difficulty or list(DIFFICULTY_SETTINGS.keys())
+    start = time.perf_counter()
+    results = sweep(difficulties, args.chains, args.length, args.workers, args.seed,
+                    args.horizon, args.worst)
+    elapsed = time.perf_counter() - start
+
+    pairs = sum(result['pairs'] for result in results.values())
+    print(f"jump apex {JUMP_APEX:.1f}px, {pairs} pairs in {elapsed:.1f}s "
+          f"({pairs / elapsed:.0f} pairs/s, workers={args.workers})")
+    for difficulty, result in results.items():
+        failures = sum(result['reasons'].values())
+        print(f"\n[{difficulty}] {result['chains']} chains x {args.length} platforms")
+        print(f"  unreachable pairs:  {failures}/{result['pairs']} "
+              f"({failures / result['pairs']:.4%})")
+        print(f"  unclimbable chains: {result['failed_chains']}/{result['chains']} "
+              f"({result['failed_chains'] / result['chains']:.2%})")
+        if failures:
+            print("  by reason: " + ", ".join(
+                f"{reason}={count}" for reason, count in result['reasons'].most_common()))
+            print("  by kind:   " + ", ".join(
+                f"{kind}={count}" for kind, count in result['kinds'].most_common()))
+            print("  worst cases:")
+            for case in result['worst']:
+                print(f"    seed={case['seed']} index={case['index']} {case['kinds']} "
+                      f"{case['reason']} short={case['shortfall']}px "
+                      f"height={case['height']} dx={case['dx']} widths={case['widths']}")
+
+
+if __name__ == "__main__":
+    main()
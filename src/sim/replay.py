@@ -0,0 +1,167 @@
+import argparse
+import hashlib
+import json
+import time
+from ..constants import *
+from ..config.difficulty_settings import DIFFICULTY_SETTINGS
+from ..game import Game
+from .headless import climb_script
+
+
+class Replay:
+    def __init__(self, seed, difficulty, inputs, sim_rate=SIM_RATE):
+        """
+        한 판을 재현하는 데 필요한 시드, 난이도, 틱별 입력입니다.
+        Args:
+            seed (int): 판의 시드
+            difficulty (str): 난이도 이름
+            inputs (bytes): 틱별 입력 비트 (틱당 1바이트)
+            sim_rate (int): 기록할 때의 초당 시뮬레이션 틱 수 (같은 값으로 재생해야 재현됨)
+        """
+        self.seed = seed
+        self.difficulty = difficulty
+        self.inputs = bytes(inputs)
+        self.sim_rate = sim_rate
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def to_dict(self):
+        """입력을 (입력 비트, 반복 횟수) 묶음으로 압축한 딕셔너리를 반환합니다."""
+        runs = []
+        for bits in self.inputs:
+            if runs and runs[-1][0] == bits:
+                runs[-1][1] += 1
+            else:
+                runs.append([bits, 1])
+        return {'seed': self.seed, 'difficulty': self.difficulty,
+                'fps': self.sim_rate, 'frames': len(self.inputs), 'inputs': runs}
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict()로 만든 딕셔너리에서 리플레이를 복원합니다."""
+        inputs = bytearray()
+        for bits, count in data['inputs']:
+            inputs.extend(bytes([bits]) * count)
+        return cls(data['seed'], data['difficulty'], inputs,
+                   data.get('fps', SIM_RATE))
+
+    def save(self, path):
+        """리플레이를 JSON 파일로 저장합니다."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        """JSON 파일에서 리플레이를 읽습니다."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def play(self, game, on_frame=None):
+        """
+        기록된 입력으로 game.update를 구동해 판을 그대로 재현합니다.
+        Args:
+            game (Game): 재생에 사용할 게임 (보통 headless)
+            on_frame (callable, optional): 매 프레임 뒤에 game을 인자로 호출
+        """
+        game.start(self.difficulty, self.seed)
+        for bits in self.inputs:
+            game.update(bits)
+            if on_frame is not None:
+                on_frame(game)
+
+
+class InputRecorder:
+    """
+    Game.recorder에 연결하면 판마다 프레임별 입력 비트를 기록합니다.
+    reset_game이 호출될 때마다 새 판 기록을 시작하고 이전 판은 finished에 보관합니다.
+    """
+
+    def __init__(self):
+        self.seed = None
+        self.difficulty = None
+        self.sim_rate = SIM_RATE
+        self.inputs = bytearray()
+        self.finished = []  # 끝난 판들의 Replay
+
+    def begin(self, seed, difficulty, sim_rate=SIM_RATE):
+        """새 판 기록을 시작합니다."""
+        if self.seed is not None:
+            self.finished.append(self.replay())
+        self.seed = seed
+        self.difficulty = difficulty
+        self.sim_rate = sim_rate
+        self.inputs = bytearray()
+
+    def record(self, input_bits):
+        """한 프레임의 입력 비트를 기록합니다."""
+        self.inputs.append(input_bits)
+
+    def replay(self):
+        """현재 판의 기록을 Replay로 반환합니다."""
+        return Replay(self.seed, self.difficulty, self.inputs, self.sim_rate)
+
+
+class TrajectoryHash:
+    """매 프레임 플레이어 상태를 누적 해시해 두 실행이 같은 궤적인지 비교합니다."""
+
+    def __init__(self):
+        self._hash = hashlib.sha1()
+
+    def __call__(self, game):
+        player = game.player
+        self._hash.update(repr((player.pos_x, player.pos_y, player.velocity_y,
+                                player.max_height, player.is_dead)).encode())
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="입력 기록 및 리플레이")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser(
+        "record", help="스크립트 입력으로 한 판을 기록")
+    record_parser.add_argument("output")
+    record_parser.add_argument("--frames", type=int, default=5000)
+    record_parser.add_argument("--seed", type=int, default=0)
+    record_parser.add_argument("--difficulty", default="Normal",
+                               choices=list(DIFFICULTY_SETTINGS.keys()))
+    record_parser.add_argument("--sim-rate", type=int, default=SIM_RATE,
+                               help="초당 시뮬레이션 틱 수")
+
+    play_parser = subparsers.add_parser("play", help="기록된 판을 헤드리스로 재생")
+    play_parser.add_argument("replay")
+    play_parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        game = Game(headless=True, sim_rate=args.sim_rate)
+        game.recorder = InputRecorder()
+        trajectory = TrajectoryHash()
+        game.start(args.difficulty, args.seed)
+        for frame in range(args.frames):
+            if game.player.is_dead:
+                break
+            game.update(climb_script(frame, game))
+            trajectory(game)
+        replay = game.recorder.replay()
+        replay.save(args.output)
+        print(f"recorded {len(replay)} frames (seed={replay.seed}, "
+              f"{replay.difficulty}) trajectory={trajectory.hexdigest()[:16]}")
+    else:
+        replay = Replay.load(args.replay)
+        game = Game(headless=True, sim_rate=replay.sim_rate)
+        for _ in range(args.repeat):
+            trajectory = TrajectoryHash()
+            start = time.perf_counter()
+            replay.play(game, trajectory)
+            elapsed = time.perf_counter() - start
+            print(f"replayed {len(replay)} frames in {elapsed:.3f}s "
+                  f"({len(replay) / elapsed:.0f} fps) "
+                  f"trajectory={trajectory.hexdigest()[:16]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import pygame
+from ..constants import *
+from .text_cache import get_font
+
+
+class ExcelBackground:
+    """
+    엑셀 스타일 배경을 미리 그려 두고 매 프레임 재사용합니다.
+    격자와 열 헤더는 카메라와 무관하므로 한 번만 그리고,
+    카메라에 따라 바뀌는 행 번호는 글리프를 캐시해 두었다가 다시 사용합니다.
+    """
+    COLUMNS = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
+    MAX_ROW_GLYPHS = 512  # 캐시할 최대 행 번호 글리프 수
+
+    def __init__(self):
+        self.font = get_font(24)
+        self.visible_rows = SCREEN_HEIGHT // EXCEL_CELL_HEIGHT
+        self.static_layer = self._render_static_layer()
+        self.row_glyphs = {}  # 행 번호 -> (글리프, 행 상단 기준 위치)
+
+    def _render_static_layer(self):
+        """흰 배경, 열 헤더, 격자를 한 장의 Surface로 그립니다."""
+        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        layer.fill(WHITE)
+
+        # 열 헤더 배경과 텍스트
+        pygame.draw.rect(layer, EXCEL_COLUMN_HEADER_COLOR,
+                         (0, 0, SCREEN_WIDTH, EXCEL_HEADER_HEIGHT))
+        for i, col in enumerate(self.COLUMNS):
+            x = i * EXCEL_CELL_WIDTH + EXCEL_CELL_WIDTH//2
+            text = self.font.render(col, True, EXCEL_HEADER_FONT_COLOR)
+            text_rect = text.get_rect(center=(x, EXCEL_HEADER_HEIGHT//2))
+            layer.blit(text, text_rect)
+
+        # 격자 (행 번호와 겹치지 않으므로 미리 그려도 결과가 같음)
+        for i in range(self.visible_rows + 2):
+            y = i * EXCEL_CELL_HEIGHT + EXCEL_HEADER_HEIGHT
+            pygame.draw.line(layer, EXCEL_GRID_COLOR,
+                             (0, y), (SCREEN_WIDTH, y))
+
+        for i in range(len(self.COLUMNS) + 1):
+            x = i * EXCEL_CELL_WIDTH
+            pygame.draw.line(layer, EXCEL_GRID_COLOR,
+                             (x, 0), (x, SCREEN_HEIGHT))
+        return layer
+
+    def _row_glyph(self, row_num):
+        """행 번호 글리프와 행 상단 기준 그리기 위치를 반환합니다."""
+        glyph = self.row_glyphs.get(row_num)
+        if glyph is None:
+            if len(self.row_glyphs) >= self.MAX_ROW_GLYPHS:
+                self.row_glyphs.clear()
+            text = self.font.render(
+                str(row_num + 1), True, EXCEL_HEADER_FONT_COLOR)
+            text_rect = text.get_rect(
+                midright=(EXCEL_CELL_WIDTH - 5, EXCEL_CELL_HEIGHT//2))
+            glyph = (text, text_rect.topleft)
+            self.row_glyphs[row_num] = glyph
+        return glyph
+
+    def restore(self, screen, rect, camera_y):
+        """
+        rect 영역만 배경으로 다시 칠합니다.
+        행 번호 글리프가 rect 밖으로 번지지 않도록 호출 측에서 clip을 rect로 설정해야 합니다.
+        """
+        screen.blit(self.static_layer, rect.topleft, rect)
+        if rect.left >= EXCEL_CELL_WIDTH:
+            return
+
+        # rect와 겹치는 행의 번호만 다시 그림
+        first = max(0, (rect.top - EXCEL_HEADER_HEIGHT) // EXCEL_CELL_HEIGHT)
+        last = min(self.visible_rows + 1,
+                   (rect.bottom - EXCEL_HEADER_HEIGHT) // EXCEL_CELL_HEIGHT)
+        start_row = int(camera_y // EXCEL_CELL_HEIGHT)
+        for i in range(first, last + 1):
+            text, (offset_x, offset_y) = self._row_glyph(i + start_row)
+            y = i * EXCEL_CELL_HEIGHT + EXCEL_HEADER_HEIGHT
+            screen.blit(text, (offset_x, y + offset_y))
+
+    def draw(self, screen, camera_y):
+        """배경을 화면에 그립니다."""
+        screen.blit(self.static_layer, (0, 0))
+
+        # 행 번호
+        start_row = int(camera_y // EXCEL_CELL_HEIGHT)
+        for i in range(self.visible_rows + 2):
+            text, (offset_x, offset_y) = self._row_glyph(i + start_row)
+            y = i * EXCEL_CELL_HEIGHT + EXCEL_HEADER_HEIGHT
+            screen.blit(text, (offset_x, y + offset_y))
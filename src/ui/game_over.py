@@ -1,10 +1,13 @@
 import pygame
 from ..constants import *
+from ..objects.platform import Platform
+from .text_cache import get_font, text_cache
+from .widgets import Button, Label, RetainedView
 
 
 class GameOver:
     def __init__(self):
-        self.font = pygame.font.Font(None, FONT_SIZE)
+        self.font = get_font(FONT_SIZE)
         self.retry_button = pygame.Rect(
             RETRY_BUTTON_POS[0],
             RETRY_BUTTON_POS[1],
@@ -15,12 +18,12 @@ class GameOver:
     def draw(self, screen, score):
         """게임 오버 화면을 그립니다."""
         # 게임 오버 텍스트
-        game_over_text = self.font.render('GAME OVER', True, RED)
+        game_over_text = text_cache.render(self.font, 'GAME OVER', RED)
         game_over_rect = game_over_text.get_rect(center=GAMEOVER_TEXT_POS)
         screen.blit(game_over_text, game_over_rect)
 
         # 최종 점수
-        score_text = self.font.render(f'Score: {score}m', True, WHITE)
+        score_text = text_cache.render(self.font, f'Score: {score}m', WHITE)
         score_rect = score_text.get_rect(
             center=(GAMEOVER_TEXT_POS[0], GAMEOVER_TEXT_POS[1] + 40)
         )
@@ -28,10 +31,64 @@ class GameOver:
 
         # Retry 버튼
         pygame.draw.rect(screen, WHITE, self.retry_button)
-        retry_text = self.font.render('Retry', True, BLACK)
+        retry_text = text_cache.render(self.font, 'Retry', BLACK)
         retry_text_rect = retry_text.get_rect(center=self.retry_button.center)
         screen.blit(retry_text, retry_text_rect)
 
     def check_retry_click(self, pos):
         """Retry 버튼 클릭을 확인합니다."""
         return self.retry_button.collidepoint(pos)
+
+
+class GameOverOverlay:
+    def __init__(self, retry_button, change_difficulty_button):
+        """
+        게임 화면 위에 덮는 게임오버 오버레이입니다.
+        반투명 배경은 한 번만 만들고, 위젯은 (최종 점수, 실제 높이)가 바뀔 때만 다시 구성합니다.
+        Args:
+            retry_button (pygame.Rect): Retry 버튼 영역
+            change_difficulty_button (pygame.Rect): Change Difficulty 버튼 영역
+        """
+        self.font = get_font(FONT_SIZE)
+        self.big_font = get_font(FONT_SIZE + 20)
+        self.retry_button = retry_button
+        self.change_difficulty_button = change_difficulty_button
+
+        # 반투명한 흰색 오버레이 (엑셀 스타일)
+        self.shade = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.shade.fill(WHITE)
+        self.shade.set_alpha(220)
+
+        # 최종 점수와 실제 높이가 바뀔 때만 다시 구성되는 위젯 레이어 (투명 배경)
+        self.view = RetainedView(self.build_widgets)
+
+    def build_widgets(self, state):
+        """(최종 점수, 실제 높이)에 맞는 게임오버 위젯들을 만듭니다."""
+        final_score, height = state
+        return [
+            # 게임오버 텍스트
+            Label('Game Over', self.big_font, RED,
+                  (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 150)),
+            # 최종 점수
+            Label(f'Final Score: {final_score}m', self.font, EXCEL_FONT_COLOR,
+                  (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100)),
+            # 실제 높이 (배율 제외)
+            Label(f'Actual Height: {height}m', self.font, EXCEL_FONT_COLOR,
+                  (SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 60)),
+            # Retry 버튼 (엑셀 스타일)
+            Button(self.retry_button, EXCEL_SELECTED_CELL_COLOR, EXCEL_GRID_COLOR, 1,
+                   labels=[Label("RETRY", self.font, EXCEL_FONT_COLOR,
+                                 self.retry_button.center)]),
+            # Change Difficulty 버튼 (엑셀 스타일)
+            Button(self.change_difficulty_button, EXCEL_SELECTED_CELL_COLOR,
+                   EXCEL_GRID_COLOR, 1,
+                   labels=[Label("Change Difficulty", self.font, EXCEL_FONT_COLOR,
+                                 self.change_difficulty_button.center)]),
+        ]
+
+    def draw(self, screen, final_score):
+        """현재 화면 위에 게임오버 오버레이를 그립니다."""
+        # 실제 높이 계산 (배율 제외, ScoreUI와 같은 방식)
+        height = int(final_score / Platform.current_difficulty.score_multiplier)
+        screen.blit(self.shade, (0, 0))
+        screen.blit(self.view.surface((final_score, height)), (0, 0))
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+import pygame
+from ..constants import *
+from .shapes import draw_rect_border
+
+
+class PlatformSpriteCache:
+    """
+    정수 너비별로 발판 Surface(채우기 + 1px 테두리)를 만들어 두는 LRU 캐시입니다.
+    변형 발판은 여러 너비를 거치므로 최대 개수를 제한합니다.
+    """
+
+    def __init__(self, max_size=PLATFORM_SPRITE_CACHE_SIZE):
+        """
+        Args:
+            max_size (int): 보관할 최대 Surface 수
+        """
+        self.max_size = max_size
+        self._sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, width):
+        """
+        너비에 맞는 발판 Surface를 반환합니다.
+        Args:
+            width (int): 발판 너비 (정수)
+        Returns:
+            pygame.Surface | None: 너비가 0 이하면 None
+        """
+        if width <= 0:
+            return None
+        sprite = self._sprites.get(width)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(width)
+            return sprite
+
+        self.misses += 1
+        sprite = pygame.Surface((width, PLATFORM_HEIGHT))
+        # 창이 있으면 화면 픽셀 형식으로 변환해 blit 속도를 높임
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        # 엑셀 스타일의 선택된 셀처럼 보이게 채우고 1픽셀 테두리를 그림
+        sprite.fill(EXCEL_SELECTED_CELL_COLOR)
+        draw_rect_border(sprite, EXCEL_GRID_COLOR,
+                         (0, 0, width, PLATFORM_HEIGHT), 1)
+        self._sprites[width] = sprite
+        if len(self._sprites) > self.max_size:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def stats(self):
+        """캐시 적중/실패 통계를 반환합니다."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._sprites), 'max_size': self.max_size}
+
+
+# 모든 발판이 공유하는 스프라이트 캐시
+platform_sprites = PlatformSpriteCache()
@@ -1,12 +1,13 @@
 import pygame
 from ..constants import *
 from ..objects.platform import Platform
+from .text_cache import get_font, text_cache
 
 
 class ScoreUI:
     def __init__(self):
-        self.font = pygame.font.Font(None, 36)  # 기본 폰트, 크기 36
-        self.small_font = pygame.font.Font(None, 24)  # 작은 폰트
+        self.font = get_font(36)  # 기본 폰트, 크기 36
+        self.small_font = get_font(24)  # 작은 폰트
         self.pos = (10, 10)  # 좌측 상단 위치
 
     def draw(self, screen, score, max_height):
@@ -20,11 +21,12 @@ class ScoreUI:
 
         # 메인 점수 텍스트 (배율 적용된 점수)
         height_text = f"Score: {score}m / {max_height}m"
-        text_surface = self.font.render(height_text, True, EXCEL_FONT_COLOR)
+        text_surface = text_cache.render(
+            self.font, height_text, EXCEL_FONT_COLOR)
         screen.blit(text_surface, self.pos)
 
         # 실제 높이 텍스트
         actual_height_text = f"Actual Height: {raw_height}m (x{multiplier} bonus)"
-        bonus_surface = self.small_font.render(
-            actual_height_text, True, EXCEL_FONT_COLOR)
+        bonus_surface = text_cache.render(
+            self.small_font, actual_height_text, EXCEL_FONT_COLOR)
         screen.blit(bonus_surface, (self.pos[0], self.pos[1] + 30))
@@ -0,0 +1,24 @@
+import pygame
+
+
+def draw_rect_border(surface, color, rect, width=1):
+    """
+    사각형 테두리를 그립니다. pygame.draw.rect(..., width)와 같은 결과를 내지만,
+    clip이 설정된 상태에서도 잘린 사각형이 아닌 원래 사각형의 테두리를 그립니다.
+    Args:
+        surface (pygame.Surface): 그릴 Surface
+        color (tuple): 테두리 색상
+        rect (pygame.Rect | tuple): 사각형 영역
+        width (int): 테두리 두께 (안쪽으로 그려짐)
+    """
+    x, y, w, h = rect
+    if w <= 0 or h <= 0:
+        return
+    width = min(width, w, h)
+    # Surface.fill은 음수 좌표를 잘라내지 않고 밀어내므로 직접 clip 영역과 교차시킴
+    clip = surface.get_clip()
+    for edge in ((x, y, w, width), (x, y + h - width, w, width),
+                 (x, y, width, h), (x + w - width, y, width, h)):
+        edge = clip.clip(edge)
+        if edge.width and edge.height:
+            surface.fill(color, edge)
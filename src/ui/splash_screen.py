@@ -1,13 +1,15 @@
 import pygame
 from ..constants import *
 from ..config.difficulty_settings import DIFFICULTY_SETTINGS
+from .text_cache import get_font
+from .widgets import Button, Label, RetainedView
 
 
 class SplashScreen:
     def __init__(self):
-        self.font = pygame.font.Font(None, FONT_SIZE)
-        self.title_font = pygame.font.Font(None, FONT_SIZE * 2)
-        self.small_font = pygame.font.Font(None, FONT_SIZE - 8)  # 작은 폰트 크기 조정
+        self.font = get_font(FONT_SIZE)
+        self.title_font = get_font(FONT_SIZE * 2)
+        self.small_font = get_font(FONT_SIZE - 8)  # 작은 폰트 크기 조정
 
         # 난이도 버튼들 크기와 위치 설정
         button_width = 120  # 버튼 너비
@@ -36,13 +38,14 @@ class SplashScreen:
         # 선택된 난이도 (기본값: Normal)
         self.selected_difficulty = "Normal"
 
-    def draw(self, screen):
-        screen.fill(BLACK)
+        # 선택된 난이도가 바뀔 때만 다시 구성되는 화면
+        self.view = RetainedView(self.build_widgets, background=BLACK)
 
-        # 타이틀 그리기
-        title = self.title_font.render("Platform Jumper", True, WHITE)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4))
-        screen.blit(title, title_rect)
+    def build_widgets(self, selected_difficulty):
+        """선택된 난이도에 맞는 스플래시 화면 위젯들을 만듭니다."""
+        # 타이틀
+        widgets = [Label("Platform Jumper", self.title_font, WHITE,
+                         (SCREEN_WIDTH//2, SCREEN_HEIGHT//4))]
 
         # 조작법 가이드 추가
         guide_texts = [
@@ -53,19 +56,15 @@ class SplashScreen:
 
         guide_y = SCREEN_HEIGHT//4 + 60
         for text in guide_texts:
-            guide_surface = self.font.render(text, True, WHITE)
-            guide_rect = guide_surface.get_rect(
-                center=(SCREEN_WIDTH//2, guide_y))
-            screen.blit(guide_surface, guide_rect)
+            widgets.append(
+                Label(text, self.font, WHITE, (SCREEN_WIDTH//2, guide_y)))
             guide_y += 30
 
-        # 난이도 선택 텍스트
-        difficulty_text = self.font.render("Select Difficulty:", True, WHITE)
-        difficulty_rect = difficulty_text.get_rect(
-            center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 250))  # 난이도 버튼 위에 표시
-        screen.blit(difficulty_text, difficulty_rect)
+        # 난이도 선택 텍스트 (난이도 버튼 위에 표시)
+        widgets.append(Label("Select Difficulty:", self.font, WHITE,
+                             (SCREEN_WIDTH//2, SCREEN_HEIGHT - 250)))
 
-        # 난이도 버튼 그리기
+        # 난이도 버튼
         difficulties = [
             (self.easy_button, "Easy",
              DIFFICULTY_SETTINGS["Easy"].score_multiplier),
@@ -76,31 +75,26 @@ class SplashScreen:
         ]
 
         for button, text, multiplier in difficulties:
-            color = WHITE if text == self.selected_difficulty else BLACK
-            pygame.draw.rect(screen, color, button)
-            pygame.draw.rect(screen, WHITE, button, 2)
-
-            # 난이도 텍스트
-            text_surface = self.font.render(text, True,
-                                            BLACK if text == self.selected_difficulty else WHITE)
-            text_rect = text_surface.get_rect(
-                center=(button.centerx, button.centery - 10))
-            screen.blit(text_surface, text_rect)
-
-            # 점수 배율 텍스트
-            multiplier_text = self.small_font.render(f"x{multiplier:.1f}", True,
-                                                     BLACK if text == self.selected_difficulty else WHITE)
-            multiplier_rect = multiplier_text.get_rect(
-                center=(button.centerx, button.centery + 10))
-            screen.blit(multiplier_text, multiplier_rect)
-
-        # Start Game 버튼 그리기
-        pygame.draw.rect(screen, BLACK, self.start_button)
-        pygame.draw.rect(screen, WHITE, self.start_button, 2)
-
-        start_text = self.font.render("Start Game", True, WHITE)
-        start_rect = start_text.get_rect(center=self.start_button.center)
-        screen.blit(start_text, start_rect)
+            is_selected = text == selected_difficulty
+            text_color = BLACK if is_selected else WHITE
+            widgets.append(Button(
+                button, WHITE if is_selected else BLACK, WHITE, 2, labels=[
+                    # 난이도 텍스트
+                    Label(text, self.font, text_color,
+                          (button.centerx, button.centery - 10)),
+                    # 점수 배율 텍스트
+                    Label(f"x{multiplier:.1f}", self.small_font, text_color,
+                          (button.centerx, button.centery + 10)),
+                ]))
+
+        # Start Game 버튼
+        widgets.append(Button(self.start_button, BLACK, WHITE, 2, labels=[
+            Label("Start Game", self.font, WHITE, self.start_button.center)]))
+        return widgets
+
+    def draw(self, screen):
+        """스플래시 화면을 그립니다. 화면 구성은 난이도가 바뀔 때만 다시 만듭니다."""
+        screen.blit(self.view.surface(self.selected_difficulty), (0, 0))
 
     def handle_click(self, pos):
         # 난이도 버튼 클릭 처리
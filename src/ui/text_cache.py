@@ -0,0 +1,80 @@
+from collections import OrderedDict
+import pygame
+from ..constants import *
+
+
+# 크기(및 폰트 파일)별로 한 번만 로드한 폰트 객체
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """
+    공유 폰트를 반환합니다. 같은 (폰트 파일, 크기)는 한 번만 로드합니다.
+    Args:
+        size (int): 폰트 크기
+        name (str, optional): 폰트 파일 경로. None이면 pygame 기본 폰트
+    Returns:
+        pygame.font.Font: 폰트 객체
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """
+    렌더링된 텍스트 Surface를 (폰트, 텍스트, 색상, 안티앨리어싱) 키로 보관하는 LRU 캐시입니다.
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """
+        Args:
+            max_size (int): 보관할 최대 Surface 수
+        """
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """
+        텍스트를 렌더링합니다. 캐시에 있으면 이전에 만든 Surface를 반환합니다.
+        반환된 Surface는 공유되므로 수정하면 안 됩니다.
+        """
+        key = (font, text, color, antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)  # 가장 오래 사용하지 않은 항목 제거
+        return surface
+
+    def clear(self):
+        """캐시와 통계를 비웁니다."""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """캐시 적중/실패 통계를 반환합니다."""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._surfaces),
+            'max_size': self.max_size,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+
+# UI 전체가 공유하는 텍스트 캐시
+text_cache = TextCache()
@@ -0,0 +1,93 @@
+import pygame
+from ..constants import *
+from .text_cache import text_cache
+
+
+class Label:
+    def __init__(self, text, font, color, center):
+        """
+        가운데 정렬된 텍스트 위젯입니다.
+        Args:
+            text (str): 표시할 텍스트
+            font (pygame.font.Font): 폰트
+            color (tuple): 글자 색상
+            center (tuple): 텍스트 중심 좌표
+        """
+        self.text = text
+        self.font = font
+        self.color = color
+        self.center = center
+
+    def draw(self, surface):
+        """텍스트를 그립니다."""
+        text_surface = text_cache.render(self.font, self.text, self.color)
+        surface.blit(text_surface, text_surface.get_rect(center=self.center))
+
+
+class Button:
+    def __init__(self, rect, fill_color, border_color, border_width=1, labels=()):
+        """
+        배경, 테두리, 라벨로 이루어진 버튼 위젯입니다.
+        Args:
+            rect (pygame.Rect): 버튼 영역
+            fill_color (tuple): 배경 색상
+            border_color (tuple): 테두리 색상
+            border_width (int): 테두리 두께
+            labels (list[Label]): 버튼 위에 그릴 라벨들
+        """
+        self.rect = rect
+        self.fill_color = fill_color
+        self.border_color = border_color
+        self.border_width = border_width
+        self.labels = list(labels)
+
+    def draw(self, surface):
+        """버튼을 그립니다."""
+        pygame.draw.rect(surface, self.fill_color, self.rect)
+        pygame.draw.rect(surface, self.border_color,
+                         self.rect, self.border_width)
+        for label in self.labels:
+            label.draw(surface)
+
+
+class RetainedView:
+    """
+    상태 키가 바뀔 때만 위젯들을 다시 구성하는 화면 레이어입니다.
+    build(state)가 반환한 위젯들을 한 장의 Surface에 합성해 두고,
+    같은 상태에서는 합성된 Surface를 그대로 재사용합니다.
+    """
+
+    def __init__(self, build, background=None, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        """
+        Args:
+            build (callable): state -> list[위젯]
+            background (tuple, optional): 배경 색상. None이면 투명 Surface
+            size (tuple): Surface 크기
+        """
+        self.build = build
+        self.background = background
+        self.size = size
+        self._state = None
+        self._surface = None
+        self.compose_count = 0  # 다시 구성한 횟수 (통계용)
+
+    def surface(self, state):
+        """
+        state에 해당하는 합성 Surface를 반환합니다.
+        상태가 바뀌었을 때만 위젯을 다시 그립니다.
+        """
+        if self._surface is None or state != self._state:
+            if self.background is None:
+                self._surface = pygame.Surface(self.size, pygame.SRCALPHA)
+            else:
+                self._surface = pygame.Surface(self.size)
+                self._surface.fill(self.background)
+            for widget in self.build(state):
+                widget.draw(self._surface)
+            self._state = state
+            self.compose_count += 1
+        return self._surface
+
+    def invalidate(self):
+        """다음 호출 때 다시 구성하도록 캐시를 비웁니다."""
+        self._surface = None
@@ -0,0 +1,54 @@
+from src.constants import ITEM_TYPES
+from src.game import Game
+from src.objects.item import Item
+
+
+def pick_up(game, item_type):
+    """플레이어 위치에 아이템을 놓고 먹은 것처럼 효과를 적용합니다."""
+    item = Item(game.player.pos_x, game.player.pos_y, item_type)
+    return game.buffs.apply(item.collect())
+
+
+def started_game():
+    game = Game(headless=True, seed=0)
+    game.start("Normal")
+    return game
+
+
+def test_pickup_replaces_positive_buff():
+    game = started_game()
+    player = game.player
+    assert pick_up(game, 'jump_boost')
+    assert pick_up(game, 'double_jump')
+    assert list(game.buffs.active) == ['double_jump']
+    assert player.positive_buff == 'double_jump'
+    assert player.can_double_jump
+    assert player.jump_power_multiplier == 1.0  # 이전 버프 효과는 되돌림
+
+
+def test_pickup_replaces_height_buff():
+    game = started_game()
+    player = game.player
+    assert pick_up(game, 'key_reverse')
+    assert pick_up(game, 'speed_reduce')
+    assert list(game.buffs.active) == ['speed_reduce']
+    assert player.active_buffs == {'speed_reduce'}
+    assert not player.is_key_reversed
+
+
+def test_pickup_after_height_buff_clears_width_override():
+    game = started_game()
+    assert pick_up(game, 'platform_width')
+    assert game.width_override is not None
+    assert pick_up(game, 'jump_boost')
+    assert game.width_override is None
+    assert game.player.active_buffs == set()
+
+
+def test_same_buff_restarts():
+    game = started_game()
+    player = game.player
+    pick_up(game, 'jump_boost')
+    player.remaining_jump_boosts = 1
+    assert pick_up(game, 'jump_boost')
+    assert game.buffs.remaining('jump_boost') == ITEM_TYPES['jump_boost']['duration']
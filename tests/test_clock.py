@@ -0,0 +1,106 @@
+import pytest
+from src.config.difficulty_settings import DIFFICULTY_SETTINGS
+from src.constants import FPS, TIMER_WHEEL_SLOTS
+from src.sim.clock import SimClock, TimerWheel
+
+
+LEVEL_1 = TIMER_WHEEL_SLOTS  # 1단계 한 칸의 틱 수
+LEVEL_2 = TIMER_WHEEL_SLOTS ** 2
+LEVEL_3 = TIMER_WHEEL_SLOTS ** 3
+
+
+class SmallWheel(TimerWheel):
+    """범위를 넘는 타이머를 빨리 만들 수 있도록 단계를 줄인 휠"""
+    LEVELS = 2
+
+
+def run(wheel, dues, until):
+    """dues마다 타이머를 예약하고 until틱까지 진행해 (예약 틱, 실행된 틱) 목록을 반환합니다."""
+    fired = []
+    for due in dues:
+        wheel.schedule(due, lambda tick, due=due: fired.append((due, tick)))
+    while wheel.tick < until:
+        wheel.advance()
+    return sorted(fired)
+
+
+def test_timers_fire_at_due_across_level_boundaries():
+    dues = [1, LEVEL_1 - 1, LEVEL_1, LEVEL_1 + 1, 2 * LEVEL_1 - 1, 2 * LEVEL_1,
+            LEVEL_2 - 1, LEVEL_2, LEVEL_2 + 1, LEVEL_3 - 1, LEVEL_3, LEVEL_3 + 1]
+    assert run(TimerWheel(), dues, LEVEL_3 + 2) == [(due, due) for due in dues]
+
+
+def test_timers_fire_at_due_from_unaligned_start():
+    start = LEVEL_2 - 5
+    dues = [start + 1, LEVEL_2, LEVEL_2 + 1, LEVEL_2 + LEVEL_1, start + LEVEL_2 + 3]
+    assert run(TimerWheel(start), dues, start + LEVEL_2 + 4) == [(due, due) for due in dues]
+
+
+def test_overflow_timers_fire_at_due():
+    wheel = SmallWheel()
+    dues = [LEVEL_2 - 1, LEVEL_2, LEVEL_2 + 1, 2 * LEVEL_2 + 7]
+    fired = []
+    for due in dues:
+        wheel.schedule(due, lambda tick, due=due: fired.append((due, tick)))
+    assert len(wheel._overflow) == 3  # 두 단계 휠의 범위는 LEVEL_2틱 미만
+    assert run(wheel, [], 2 * LEVEL_2 + 8) == []
+    assert fired == [(due, due) for due in dues]
+
+
+def test_past_due_fires_next_tick():
+    wheel = TimerWheel(10)
+    assert run(wheel, [3, 10], 11) == [(3, 11), (10, 11)]
+
+
+@pytest.mark.parametrize("due", [5, LEVEL_1 + 5, LEVEL_2 + 5])
+def test_cancelled_timer_does_not_fire(due):
+    wheel = TimerWheel()
+    fired = []
+    cancelled = wheel.schedule(due, fired.append)
+    wheel.schedule(due, lambda tick: fired.append(-tick))
+    cancelled.cancel()
+    while wheel.tick <= due:
+        wheel.advance()
+    assert fired == [-due]
+
+
+def test_cancelled_overflow_timer_does_not_fire():
+    wheel = SmallWheel()
+    fired = []
+    wheel.schedule(LEVEL_2 + 3, fired.append).cancel()
+    while wheel.tick <= LEVEL_2 + 3:
+        wheel.advance()
+    assert fired == []
+
+
+@pytest.mark.parametrize("rate, ms, ticks", [
+    (30, 0, 0), (30, 1, 1), (30, 33, 1), (30, 34, 2), (30, 100, 3), (30, 1000, 30),
+    (60, 0, 0), (60, 1, 1), (60, 16, 1), (60, 17, 2), (60, 50, 3), (60, 1000, 60),
+    (120, 0, 0), (120, 1, 1), (120, 8, 1), (120, 9, 2), (120, 25, 3), (120, 1000, 120),
+])
+def test_ticks_rounds_up(rate, ms, ticks):
+    assert SimClock(rate).ticks(ms) == ticks
+
+
+@pytest.mark.parametrize("rate", [30, 60, 120])
+def test_difficulty_intervals_round_to_first_tick_after(rate):
+    # ms 이상 지난 첫 틱: 그 틱의 시간은 ms 이상이고 바로 앞 틱은 ms 미만
+    clock = SimClock(rate)
+    for settings in DIFFICULTY_SETTINGS.values():
+        for ms in (settings.vanish_interval, settings.vanish_duration):
+            ticks = clock.ticks(ms)
+            assert ticks * 1000 / rate >= ms
+            assert (ticks - 1) * 1000 / rate < ms
+
+
+@pytest.mark.parametrize("rate", [30, 60, 120])
+def test_call_later_fires_after_delay(rate):
+    clock = SimClock(rate)
+    assert clock.dt == FPS / rate
+    fired = []
+    clock.call_later(250, fired.append)
+    while not fired:
+        clock.advance()
+    assert fired == [clock.tick]
+    assert clock.time >= 250
+    assert clock.time - 1000 / rate < 250
@@ -0,0 +1,26 @@
+import random
+import pytest
+from src.sim.env import VectorEnv
+
+
+def action_rows(num_envs, steps, seed=0):
+    rng = random.Random(seed)
+    return [[rng.randrange(6) for _ in range(num_envs)] for _ in range(steps)]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_step_many_matches_step(workers):
+    np = pytest.importorskip("numpy")
+    rows = action_rows(3, 40)
+    env = VectorEnv(3, workers=workers, seed=5)
+    env.reset(5)
+    expected = [env.step(actions) for actions in rows]
+    env.reset(5)
+    obs, rewards, terminated, truncated, infos = env.step_many(rows)
+    env.close()
+    assert obs.shape == (len(rows), 3, env.observation_size)
+    np.testing.assert_array_equal(obs, [step[0] for step in expected])
+    np.testing.assert_array_equal(rewards, [step[1] for step in expected])
+    np.testing.assert_array_equal(terminated, [step[2] for step in expected])
+    np.testing.assert_array_equal(truncated, [step[3] for step in expected])
+    assert infos == [step[4] for step in expected]
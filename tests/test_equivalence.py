@@ -0,0 +1,111 @@
+import pytest
+from src.constants import SCREEN_WIDTH, WORLD_CHUNK_HEIGHT
+from src.game import Game
+from src.objects.platform import Platform
+from src.sim.autoplayer import AutoPlayer
+from src.sim.replay import TrajectoryHash
+
+
+SEED = 11
+DIFFICULTY = "Normal"
+FRAMES = 4000  # 청크(화면 높이) 여러 개를 오르고 너비 버프도 얻는 길이 (약 31m)
+
+
+def replay_hash(inputs, **options):
+    """기록한 입력을 주어진 업데이트 모드로 다시 실행해 궤적 해시를 구합니다."""
+    game = Game(headless=True, seed=SEED, **options)
+    game.start(DIFFICULTY, SEED)
+    trajectory = TrajectoryHash()
+    for input_bits in inputs:
+        game.update(input_bits)
+        trajectory(game)
+    return trajectory.hexdigest()
+
+
+@pytest.fixture(scope="module")
+def recorded_run():
+    """객체 모드에서 AutoPlayer로 오르며 입력과 궤적 해시, 오른 높이를 기록합니다."""
+    game = Game(headless=True, seed=SEED)
+    game.start(DIFFICULTY, SEED)
+    autoplayer = AutoPlayer()
+    trajectory = TrajectoryHash()
+    inputs = []
+    for frame in range(FRAMES):
+        input_bits = autoplayer(frame, game)
+        inputs.append(input_bits)
+        game.update(input_bits)
+        trajectory(game)
+    assert not game.player.is_dead
+    return inputs, trajectory.hexdigest(), game.player.raw_height
+
+
+def test_recorded_run_climbs_several_chunks(recorded_run):
+    inputs, _, height = recorded_run
+    assert height * 100 > 2 * WORLD_CHUNK_HEIGHT
+
+
+def test_chunk_platforms_start_at_insertion(recorded_run):
+    # 다음 청크의 첫 발판은 미리 만들어지지만, 기준 틱과 사라짐 타이머는 넣은 틱에서 시작해야 함
+    inputs, _, _ = recorded_run
+    game = Game(headless=True, seed=SEED)
+    game.start(DIFFICULTY, SEED)
+    clock = game.sim_clock
+    interval = clock.ticks(game.difficulty.vanish_interval)
+    seen = {id(platform) for platform in game.platforms}
+    inserted = 0
+    for input_bits in inputs:
+        game.update(input_bits)
+        for platform in game.platforms:
+            if id(platform) in seen:
+                continue
+            seen.add(id(platform))
+            inserted += 1
+            assert platform._anchor[0] == clock.tick
+            if platform.is_vanish:
+                assert platform._vanish_timer.due == clock.tick + interval
+    assert inserted > 0
+
+
+def test_analytic_matches_objects(recorded_run):
+    inputs, expected, _ = recorded_run
+    assert replay_hash(inputs, analytic=True) == expected
+
+
+@pytest.mark.parametrize("sim_band", [None, (300, 900)])
+def test_lod_matches_objects(recorded_run, sim_band):
+    # 좁은 구간에서는 발판이 구간을 자주 벗어났다가 다시 들어옴
+    inputs, expected, _ = recorded_run
+    assert replay_hash(inputs, lod=True, sim_band=sim_band) == expected
+
+
+@pytest.mark.parametrize("width_override", [None, 10])
+def test_moving_platform_bounces_on_shown_width(width_override):
+    game = Game(headless=True, seed=SEED)
+    game.start(DIFFICULTY, SEED)
+    game.width_override = width_override
+    game.activate()
+    clock = game.sim_clock
+    platform = Platform(SCREEN_WIDTH - 80, 0, 60, is_moving=True)
+    rightmost = 0
+    for _ in range(200):
+        clock.advance()
+        platform.update()
+        rightmost = max(rightmost, platform.right)
+        assert platform.state_at(clock.tick)[:2] == pytest.approx((platform.x, platform.direction))
+    assert rightmost == SCREEN_WIDTH  # 보이는 너비의 오른쪽 끝이 벽에 닿을 때 방향을 바꿈
+
+
+def test_platform_store_bounces_on_shown_width():
+    pytest.importorskip("numpy")
+    from src.objects.platform_store import PlatformStore
+    game = Game(headless=True, seed=SEED)
+    game.start(DIFFICULTY, SEED)
+    game.width_override = 10
+    game.activate()
+    platform = Platform(SCREEN_WIDTH - 80, 0, 60, is_moving=True)
+    store = PlatformStore()
+    view = store.add(Platform(SCREEN_WIDTH - 80, 0, 60, is_moving=True))
+    for _ in range(200):
+        platform.update()
+        store.update()
+        assert (view.x, view.direction) == pytest.approx((platform.x, platform.direction))
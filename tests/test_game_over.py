@@ -0,0 +1,14 @@
+import pygame
+from src.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from src.game import Game
+
+
+def test_overlay_recomposes_only_when_score_changes():
+    game = Game(headless=True, seed=0)
+    game.start("Normal")
+    overlay = game.game_over_overlay
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    for score in (30, 30, 30, 45, 45):
+        overlay.draw(screen, score)
+    assert overlay.view.compose_count == 2
+    assert overlay.view._state == (45, 30)  # (최종 점수, 배율 1.5를 뺀 실제 높이)
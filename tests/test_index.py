@@ -0,0 +1,124 @@
+import random
+from types import SimpleNamespace
+import pytest
+from src.objects.item_index import ItemIndex
+from src.objects.platform_index import PlatformIndex
+
+
+CHUNK = 800
+
+
+def platforms(*ys):
+    return [SimpleNamespace(y=y) for y in ys]
+
+
+def items(*ys):
+    return [SimpleNamespace(pos_y=y) for y in ys]
+
+
+def ys(objects):
+    return [getattr(obj, 'y', getattr(obj, 'pos_y', None)) for obj in objects]
+
+
+# 청크 경계(0, -800, -1600)와 그 양옆
+EDGE_YS = (801, 800, 799, 1, 0, -1, -799, -800, -801, -1599, -1600, -1601)
+
+
+@pytest.fixture
+def edge_index():
+    return PlatformIndex(platforms(*EDGE_YS), chunk_height=CHUNK)
+
+
+@pytest.mark.parametrize("y_min, y_max", [
+    (-800, 0), (0, 0), (-800, -800), (-801, -799), (-1, 1), (0, 800),
+    (-1600, -800), (-1600.5, 799.5), (-5000, 5000), (1000, 2000), (-0.5, -0.25),
+])
+def test_platform_near_includes_both_edges(edge_index, y_min, y_max):
+    expected = sorted((y for y in EDGE_YS if y_min <= y <= y_max), reverse=True)
+    assert ys(edge_index.near(y_min, y_max)) == expected
+
+
+def test_platform_near_matches_linear_scan():
+    rng = random.Random(0)
+    values = [rng.uniform(-4000, 800) for _ in range(300)]
+    index = PlatformIndex(platforms(*values), chunk_height=CHUNK)
+    for _ in range(200):
+        y_min = rng.uniform(-4500, 1000)
+        y_max = y_min + rng.uniform(0, 2000)
+        expected = sorted((y for y in values if y_min <= y <= y_max), reverse=True)
+        assert ys(index.near(y_min, y_max)) == expected
+
+
+def test_platform_drop_below_drops_whole_chunks(edge_index):
+    # 청크 0(0 <= y < 800)의 위쪽 경계는 0이므로 y=0에서는 남고 그보다 위에서 버려짐
+    assert ys(edge_index.drop_below(0)) == [801, 800]
+    assert ys(edge_index.drop_below(-1)) == [799, 1, 0]
+    assert len(edge_index) == len(EDGE_YS) - 5
+    assert ys(edge_index)[0] == -1
+    assert edge_index.near(0, 2000) == []
+
+
+def test_platform_drop_below_keeps_last_chunk(edge_index):
+    edge_index.drop_below(-10000)
+    assert edge_index.chunk_count == 1
+    assert ys(edge_index) == [-1601]
+
+
+def test_platform_highest_after_eviction():
+    index = PlatformIndex(platforms(500, -300, -900), chunk_height=CHUNK)
+    index.drop_below(-100)
+    assert index.highest.y == -900
+    # 빈 청크를 건너뛰고 위쪽에 추가
+    index.append(SimpleNamespace(y=-3300))
+    assert index.highest.y == -3300
+    index.drop_below(-2500)
+    assert index.highest.y == -3300
+    assert ys(index) == [-3300]
+
+
+def test_platform_highest_of_empty_index():
+    with pytest.raises(IndexError):
+        PlatformIndex().highest
+
+
+def test_platform_append_out_of_order():
+    index = PlatformIndex(platforms(-100, -700, -400, 200, -1200), chunk_height=CHUNK)
+    assert ys(index) == [200, -100, -400, -700, -1200]
+    assert index[2].y == -400
+    assert index[-1].y == -1200
+
+
+def test_item_near_includes_both_edges():
+    index = ItemIndex(items(100, 0, -50, -100, -200))
+    assert ys(index.near(-100, 0)) == [0, -50, -100]
+
+
+@pytest.mark.parametrize("y_min, y_max, expected", [
+    (-100, 0, True),     # -50
+    (-50, 0, False),     # 양 끝 제외
+    (-100, -50, False),
+    (-51, -49, True),
+    (-1000, -100, False),
+    (100, 1000, False),
+    (-1000, 1000, True),
+])
+def test_item_has_between_excludes_edges(y_min, y_max, expected):
+    index = ItemIndex(items(100, 0, -50, -100))
+    assert index.has_between(y_min, y_max) is expected
+
+
+def test_item_drop_above_and_below():
+    index = ItemIndex(items(100, 0, -50, -100, -200))
+    assert ys(index.drop_above(-100)) == [-100, -200]  # pos_y <= y
+    assert ys(index.drop_below(0)) == [100]  # pos_y > y
+    assert ys(index) == [0, -50]
+    assert index.drop_above(-1000) == []
+    assert index.drop_below(1000) == []
+
+
+def test_item_drop_keeps_creation_order():
+    created = items(-10, 50, -30, 20)
+    index = ItemIndex(created)
+    index.drop_below(30)
+    assert index.keep_newest(2) == [created[0]]
+    assert ys(index) == [20, -30]
@@ -0,0 +1,61 @@
+import pytest
+from src.game import Game
+from src.objects.item import Item
+from src.objects.platform import Platform
+from src.objects.player import Player
+from src.sim.benchmark import SCENARIOS, build_world, frame_allocation
+from src.sim.headless import climb_script
+from src.sim.replay import TrajectoryHash
+
+
+UPDATE_ALLOC_BUDGET = 2048  # headless update 한 번의 평균 할당 상한 (바이트, 현재 약 600)
+TRAJECTORY_HASH = 'd67ce17977ca'  # seed 42, Hard, climb_script 4000프레임 (60Hz)
+
+
+def trajectory_hash(platform_store=False, frames=4000):
+    """고정 시드로 climb_script를 실행해 플레이어 궤적 해시(앞 12자리)를 구합니다."""
+    game = Game(headless=True, platform_store=platform_store, seed=42)
+    game.start("Hard")
+    trajectory = TrajectoryHash()
+    for frame in range(frames):
+        if game.player.is_dead:
+            game.reset_game()
+        game.update(climb_script(frame, game))
+        trajectory(game)
+    return trajectory.hexdigest()[:12]
+
+
+@pytest.mark.parametrize("factory", [
+    lambda: Platform(0, 0, 60),
+    lambda: Platform(0, 0, 60, is_moving=True, is_transforming=True, is_vanish=True),
+    lambda: Item(0, 0, 'jump_boost'),
+    lambda: Player(0, 0),
+])
+def test_entities_have_no_instance_dict(factory):
+    # __slots__를 거치지 않는 속성이 생기면 객체마다 __dict__가 다시 붙음
+    assert not hasattr(factory(), '__dict__')
+
+
+def test_player_rect_is_reused():
+    player = Player(100, 200)
+    rect = player.rect
+    player.pos_x += 5
+    assert player.rect is rect
+    assert rect.centerx == player.pos_x  # 같은 Rect가 현재 위치로 갱신됨
+
+
+def test_update_allocation_budget():
+    game = Game(headless=True, seed=0)
+    game.start("Normal")
+    build_world(game, *SCENARIOS['items_50'])
+    frame_allocation(game, 20)  # 캐시와 풀이 채워질 때까지 예열
+    assert frame_allocation(game, 200) < UPDATE_ALLOC_BUDGET
+
+
+def test_trajectory_hash_is_stable():
+    assert trajectory_hash() == TRAJECTORY_HASH
+
+
+def test_platform_store_matches_objects():
+    pytest.importorskip("numpy")
+    assert trajectory_hash(platform_store=True) == TRAJECTORY_HASH
@@ -0,0 +1,88 @@
+import pytest
+from src.actions.movement import Movement
+from src.constants import GRAVITY, PLAYER_HEIGHT, PLAYER_SPEED
+from src.game import Game
+from src.objects.platform import Platform
+from src.objects.player import Player
+
+
+DT = 4  # 15Hz 틱 (FPS 기준 4프레임)
+
+
+@pytest.fixture(autouse=True)
+def active_game():
+    """Platform의 공유 상태(시계, 난이도)를 설정합니다."""
+    game = Game(headless=True, seed=0)
+    game.start("Normal")
+    return game
+
+
+def falling_player(x, bottom, velocity_y=5):
+    """바닥이 bottom에 있고 아래로 떨어지는 중인 플레이어를 만듭니다."""
+    player = Player(x, bottom - PLAYER_HEIGHT / 2)
+    player.velocity_y = velocity_y
+    player.is_jumping = True
+    return player
+
+
+def run_long_tick(swept):
+    """발판 상단을 틱 중간에 지나며, 틱 끝에는 발판 오른쪽 밖에 있는 플레이어 (가로 60px 발판)"""
+    platform = Platform(100, 500, 60)
+    player = falling_player(150, 490)
+    player.save_previous()
+    Movement.move_horizontal(player, 1, DT)  # 150 -> 166
+    Movement.apply_gravity(player, [platform], DT, swept=swept)
+    return player, platform
+
+
+def test_long_tick_lands_with_swept_collision():
+    player, platform = run_long_tick(swept=True)
+    assert player.pos_x == 150 + PLAYER_SPEED * DT
+    assert player.bottom == platform.y
+    assert player.velocity_y == 0
+    assert not player.is_jumping
+
+
+def test_long_tick_tunnels_with_discrete_collision():
+    player, platform = run_long_tick(swept=False)
+    assert player.bottom > platform.y  # 틱 끝 x만 보면 발판을 지나쳐 떨어짐
+    assert player.is_jumping
+
+
+def moving_platform():
+    """틱 동안 x 100 -> 120으로 움직인 발판"""
+    platform = Platform(120, 500, 60, is_moving=True)
+    platform.prev_x = 100
+    platform.prev_width = platform.base_width
+    return platform
+
+
+@pytest.mark.parametrize("x, expected", [
+    (165, 110),   # 틱 중간의 발판 [110, 170] 안
+    (175, None),  # 틱 끝 [120, 180]에는 있지만 닿는 시점에는 밖
+    (105, None),  # 틱 시작 [100, 160]에는 있지만 닿는 시점에는 밖
+])
+def test_contact_x_uses_platform_at_crossing(x, expected):
+    player = falling_player(x, 490)
+    player.save_previous()
+    # 바닥이 490 -> 510으로 움직이면 발판 상단(500)을 틱의 절반에서 지남
+    assert Movement.contact_x(player, moving_platform(), 490, 510) == expected
+
+
+def test_contact_x_interpolates_player_x():
+    player = falling_player(90, 490)
+    player.save_previous()
+    player.pos_x = 130  # 닿는 시점의 x는 110
+    assert Movement.contact_x(player, Platform(112, 500, 60), 490, 510) is None
+    assert Movement.contact_x(player, Platform(110, 500, 60), 490, 510) == 110
+
+
+def test_swept_landing_carries_only_after_contact():
+    platform = moving_platform()
+    player = falling_player(165, 490, velocity_y=20 - GRAVITY)
+    player.save_previous()
+    # 한 틱(dt=1)에 바닥이 490 -> 510으로 움직여 틱의 절반(발판 x 110)에서 착지
+    Movement.apply_gravity(player, [platform], 1, swept=True)
+    assert player.bottom == platform.y
+    # 착지한 뒤로 발판이 움직인 10px만 함께 이동
+    assert player.pos_x == 165 + (platform.x - 110)